@@ -9,7 +9,7 @@ QuickSort y HeapSort desde una perspectiva teórica y empírica.
 Funcionalidades:
 - Ejecución de experiencias para tamaños de entrada únicos o en serie.
 - Medición de tiempo de ejecución y conteo de instrucciones.
-- Generación de gráficos comparativos para los 4 algoritmos:
+- Generación de gráficos comparativos para todos los algoritmos:
   1. Tiempo de ejecución vs. Tamaño de entrada.
   2. Total de instrucciones vs. Tamaño de entrada.
 - Opción de escala logarítmica para una mejor visualización comparativa.
@@ -20,189 +20,59 @@ Funcionalidades:
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import time
-import random
-import csv
-from typing import List, Tuple, Dict
+from typing import Callable, List, Optional
 import threading
-import math
-import statistics
 
-class AlgoritmoOrdenamiento:
-    """
-    Clase base para almacenar las métricas de un algoritmo de ordenamiento.
-    """
-    def __init__(self, nombre: str, color: str):
-        self.nombre = nombre
-        self.color = color
-        self.resultados = {}  # {tamanio: [(tiempo, instrucciones), ...]}
-
-    def agregar_metricas(self, tamanio: int, tiempo: float, instrucciones: int):
-        """Agrega métricas de una ejecución para un tamaño específico."""
-        if tamanio not in self.resultados:
-            self.resultados[tamanio] = []
-        self.resultados[tamanio].append((tiempo, instrucciones))
-
-    def obtener_promedios(self) -> List[Tuple[int, float, int]]:
-        """Devuelve una lista de (tamaño, tiempo_promedio, instrucciones_promedio) ordenada por tamaño."""
-        promedios = []
-        for tamanio, mediciones in sorted(self.resultados.items()):
-            if not mediciones:
-                continue
-            avg_tiempo = sum(m[0] for m in mediciones) / len(mediciones)
-            avg_instrucciones = sum(m[1] for m in mediciones) / len(mediciones)
-            promedios.append((tamanio, avg_tiempo, int(avg_instrucciones)))
-        return promedios
-
-    def obtener_desviacion_estandar(self, tamanio: int) -> Tuple[float, float]:
-        """Devuelve la desviación estándar de tiempo e instrucciones para un tamaño dado."""
-        if tamanio not in self.resultados or len(self.resultados[tamanio]) < 2:
-            return 0.0, 0.0
-        
-        mediciones = self.resultados[tamanio]
-        tiempos = [m[0] for m in mediciones]
-        instrucciones = [m[1] for m in mediciones]
-        
-        std_tiempo = statistics.stdev(tiempos)
-        std_inst = statistics.stdev(instrucciones)
-        
-        return std_tiempo, std_inst
-
-    def limpiar_datos(self):
-        """Limpia todos los resultados almacenados."""
-        self.resultados.clear()
-
-    def exportar_csv(self, filename: str):
-        """Exporta los promedios de las métricas a un archivo CSV."""
-        datos = self.obtener_promedios()
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow(['Tamaño', 'Tiempo Promedio (s)', 'Tiempo StdDev', 'Instrucciones Promedio', 'Instrucciones StdDev'])
-            for tamanio, tiempo, instrucciones in datos:
-                std_tiempo, std_inst = self.obtener_desviacion_estandar(tamanio)
-                writer.writerow([tamanio, tiempo, std_tiempo, instrucciones, std_inst])
-        return f"📊 Métricas de {self.nombre} exportadas a {filename}"
-
-# --- Implementaciones de Algoritmos de Ordenamiento (conteo de instrucciones) ---
-
-def bubble_sort(arr: List[int]) -> Tuple[List[int], int]:
-    n = len(arr)
-    total_instrucciones = 0
-    arr_copy = arr.copy()
-    total_instrucciones += 1
-    for i in range(n):
-        total_instrucciones += 1
-        for j in range(0, n - i - 1):
-            total_instrucciones += 1
-            if arr_copy[j] > arr_copy[j + 1]:
-                total_instrucciones += 1
-                arr_copy[j], arr_copy[j + 1] = arr_copy[j + 1], arr_copy[j]
-                total_instrucciones += 1
-    return arr_copy, total_instrucciones
-
-def heapify(arr: List[int], n: int, i: int, contador: int) -> int:
-    largest = i
-    left = 2 * i + 1
-    right = 2 * i + 2
-    contador += 3
-    if left < n and arr[left] > arr[largest]:
-        largest = left
-        contador += 1
-    if right < n and arr[right] > arr[largest]:
-        largest = right
-        contador += 1
-    if largest != i:
-        arr[i], arr[largest] = arr[largest], arr[i]
-        contador += 1
-        contador = heapify(arr, n, largest, contador)
-    return contador
-
-def heap_sort(arr: List[int]) -> Tuple[List[int], int]:
-    n = len(arr)
-    total_instrucciones = 0
-    arr_copy = arr.copy()
-    for i in range(n // 2 - 1, -1, -1):
-        total_instrucciones += 1
-        total_instrucciones = heapify(arr_copy, n, i, total_instrucciones)
-    for i in range(n - 1, 0, -1):
-        total_instrucciones += 1
-        arr_copy[0], arr_copy[i] = arr_copy[i], arr_copy[0]
-        total_instrucciones += 1
-        total_instrucciones = heapify(arr_copy, i, 0, total_instrucciones)
-    return arr_copy, total_instrucciones
-
-def quick_sort(arr: List[int]) -> Tuple[List[int], int]:
-    arr_copy = arr.copy()
-    total_instrucciones = [0]
-    def _partition(arr, low, high):
-        pivot = arr[high]
-        i = low - 1
-        total_instrucciones[0] += 2
-        for j in range(low, high):
-            total_instrucciones[0] += 1
-            if arr[j] <= pivot:
-                total_instrucciones[0] += 1
-                i += 1
-                total_instrucciones[0] += 1
-                arr[i], arr[j] = arr[j], arr[i]
-                total_instrucciones[0] += 1
-        arr[i + 1], arr[high] = arr[high], arr[i + 1]
-        total_instrucciones[0] += 1
-        return i + 1
-    def _quick_sort_helper(arr, low, high):
-        if low < high:
-            total_instrucciones[0] += 1
-            pi = _partition(arr, low, high)
-            total_instrucciones[0] += 1
-            _quick_sort_helper(arr, low, pi - 1)
-            _quick_sort_helper(arr, pi + 1, high)
-    _quick_sort_helper(arr_copy, 0, len(arr_copy) - 1)
-    return arr_copy, total_instrucciones[0]
-
-def insertion_sort(arr: List[int]) -> Tuple[List[int], int]:
-    arr_copy = arr.copy()
-    total_instrucciones = 0
-    for i in range(1, len(arr_copy)):
-        total_instrucciones += 1
-        key = arr_copy[i]
-        total_instrucciones += 1
-        j = i - 1
-        total_instrucciones += 1
-        while j >= 0 and arr_copy[j] > key:
-            total_instrucciones += 2
-            arr_copy[j + 1] = arr_copy[j]
-            total_instrucciones += 1
-            j -= 1
-            total_instrucciones += 1
-        arr_copy[j + 1] = key
-        total_instrucciones += 1
-    return arr_copy, total_instrucciones
-
-def verificar_ordenamiento(arr_original: List[int], arr_ordenado: List[int]) -> bool:
-    """Verifica que el array esté correctamente ordenado."""
-    return arr_ordenado == sorted(arr_original)
-
-def generar_array_segun_caso(n: int, caso: str = 'aleatorio') -> List[int]:
-    """
-    Genera arrays con diferentes características:
-    - 'aleatorio': Completamente aleatorio
-    - 'ordenado': Ya ordenado (mejor caso para algunos algoritmos)
-    - 'inverso': Ordenado inversamente (peor caso)
-    - 'casi_ordenado': 90% ordenado con algunos elementos fuera de lugar
-    """
-    if caso == 'aleatorio':
-        return [random.randint(1, 100000) for _ in range(n)]
-    elif caso == 'ordenado':
-        return list(range(1, n + 1))
-    elif caso == 'inverso':
-        return list(range(n, 0, -1))
-    elif caso == 'casi_ordenado':
-        arr = list(range(1, n + 1))
-        # Desordenar 10% de elementos
-        for _ in range(n // 10):
-            i, j = random.randint(0, n-1), random.randint(0, n-1)
-            arr[i], arr[j] = arr[j], arr[i]
-        return arr
-    return [random.randint(1, 100000) for _ in range(n)]
+from ordenamiento import (
+    AlgoritmoOrdenamiento, bubble_sort, insertion_sort, heap_sort, quick_sort,
+    heapify, verificar_ordenamiento, generar_array_segun_caso, parsear_serie_tamanos,
+    FUNCIONES_ORDENAMIENTO, MODOS_VERIFICACION, OPERACIONES, LINEAS_BASE, LINEA_BASE_REFERENCIA, crear_algoritmos
+)
+from experimentos import EjecutorSerie, cpus_disponibles
+from cache_datos import CacheDatos, DIRECTORIO_POR_DEFECTO
+from planificador import PlanificadorComplejidad, POLITICAS
+from graficos import GraficoComparativo, ETIQUETAS_METRICAS, INTERVALO_REFRESCO_MS
+from registro import ColaLog, ARCHIVO_LOG_POR_DEFECTO
+from progreso import formatear_duracion
+from cronometro import CALENTAMIENTO_POR_DEFECTO, TIEMPO_MINIMO_POR_DEFECTO, Cronometro
+from memoria import METRICAS_MEMORIA
+from plugins import cargar_plugins, plugins_de_entorno
+from base_resultados import ARCHIVO_BASE_POR_DEFECTO, BaseResultados, aplicar_mediciones, opciones_ejecutor
+
+INTERVALO_LOG_MS = 100  # Cada cuánto se vuelca al widget el lote de mensajes pendientes
+MAX_MENSAJES_POR_LOTE = 2000  # Tope por lote, para no bloquear la interfaz si hay una ráfaga
+MAX_LINEAS_LOG = 5000  # El widget conserva solo las últimas líneas
+INTERVALO_PROGRESO_MS = 200  # Cada cuánto se vuelca a la barra el último avance informado
+ESCALA_PROGRESO = 1000  # La barra representa la fracción ponderada por costo, en milésimas
+
+# Conversores de los campos de opciones (ver AplicacionLaboratorio._leer_opcion)
+def _entero_positivo(texto: str) -> int:
+    valor = int(texto)
+    if valor < 1:
+        raise ValueError("Debe ser al menos 1.")
+    return valor
+
+def _entero_no_negativo(texto: str) -> int:
+    valor = int(texto)
+    if valor < 0:
+        raise ValueError("No puede ser negativo.")
+    return valor
+
+def _milisegundos_en_segundos(texto: str) -> float:
+    """Milisegundos (vacío = 0) convertidos a segundos."""
+    valor = float(texto) if texto else 0.0
+    if valor < 0:
+        raise ValueError("No puede ser negativo.")
+    return valor / 1000
+
+def _segundos_opcionales(texto: str) -> Optional[float]:
+    """Segundos mayores a 0, o None si el campo está vacío."""
+    if not texto:
+        return None
+    valor = float(texto)
+    if valor <= 0:
+        raise ValueError("Debe ser mayor a 0.")
+    return valor
 
 class AplicacionLaboratorio:
     """
@@ -214,17 +84,16 @@ class AplicacionLaboratorio:
         self.root.geometry("1200x850")
         self.root.configure(bg='#f0f0f0')
 
-        self.algoritmos = {
-            'Bubble Sort': AlgoritmoOrdenamiento('Bubble Sort', '#e55353'),
-            'Insertion Sort': AlgoritmoOrdenamiento('Insertion Sort', '#f9b115'),
-            'Heap Sort': AlgoritmoOrdenamiento('Heap Sort', '#3399ff'),
-            'Quick Sort': AlgoritmoOrdenamiento('Quick Sort', '#2eb85c')
-        }
-        self.funciones_ordenamiento = {
-            'Bubble Sort': bubble_sort, 'Insertion Sort': insertion_sort,
-            'Heap Sort': heap_sort, 'Quick Sort': quick_sort
-        }
+        self.algoritmos = crear_algoritmos()
+        self.funciones_ordenamiento = dict(FUNCIONES_ORDENAMIENTO)
+        self.ejecutor_actual = None  # Serie en curso, para poder cancelarla
+        self.base_resultados = None  # BaseResultados, se abre al usarla por primera vez
+        self.graficos_abiertos = []  # GraficoComparativo de las ventanas de gráficos abiertas
+        self._hay_mediciones_nuevas = False  # Lo activa el hilo de trabajo; lo consume el refresco en Tk
+        self._progreso_pendiente = None  # Último estado de avance informado por el hilo de trabajo
+        self.cola_log = ColaLog()
         self.crear_interfaz()
+        self.root.after(INTERVALO_LOG_MS, self._vaciar_log)
 
     def crear_interfaz(self):
         main_frame = ttk.Frame(self.root, padding="10")
@@ -265,13 +134,110 @@ class AplicacionLaboratorio:
         ttk.Radiobutton(tipo_datos_frame, text="Inverso", variable=self.tipo_datos_var, value='inverso').pack(side=tk.LEFT, padx=5)
         ttk.Radiobutton(tipo_datos_frame, text="Casi Ordenado", variable=self.tipo_datos_var, value='casi_ordenado').pack(side=tk.LEFT, padx=5)
 
+        # Ejecución en paralelo
+        ttk.Label(config_frame, text="Procesos en paralelo:").grid(row=3, column=0, padx=(0, 10), sticky=tk.W, pady=(5, 0))
+        paralelo_frame = ttk.Frame(config_frame)
+        paralelo_frame.grid(row=3, column=1, padx=(0, 20), sticky=tk.W, pady=(5, 0))
+        self.entrada_trabajadores = ttk.Spinbox(paralelo_frame, from_=1, to=len(cpus_disponibles()), width=10)
+        self.entrada_trabajadores.set(1)
+        self.entrada_trabajadores.pack(side=tk.LEFT)
+        self.fijar_cpu_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(paralelo_frame, text="Fijar cada proceso a una CPU", variable=self.fijar_cpu_var).pack(side=tk.LEFT, padx=10)
+
+        # Semilla y caché de datasets
+        ttk.Label(config_frame, text="Semilla (vacío = aleatoria):").grid(row=4, column=0, padx=(0, 10), sticky=tk.W, pady=(5, 0))
+        semilla_frame = ttk.Frame(config_frame)
+        semilla_frame.grid(row=4, column=1, padx=(0, 20), sticky=tk.W, pady=(5, 0))
+        self.entrada_semilla = ttk.Entry(semilla_frame, width=12)
+        self.entrada_semilla.pack(side=tk.LEFT)
+        self.usar_cache_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(semilla_frame, text=f"Reutilizar datasets en caché ({DIRECTORIO_POR_DEFECTO})",
+                        variable=self.usar_cache_var).pack(side=tk.LEFT, padx=10)
+
+        # Verificación de resultados
+        ttk.Label(config_frame, text="Verificación:").grid(row=5, column=0, padx=(0, 10), sticky=tk.W, pady=(5, 0))
+        verificacion_frame = ttk.Frame(config_frame)
+        verificacion_frame.grid(row=5, column=1, padx=(0, 20), sticky=tk.W, pady=(5, 0))
+        self.verificacion_var = tk.StringVar(value='referencia')
+        ttk.Combobox(verificacion_frame, textvariable=self.verificacion_var, values=MODOS_VERIFICACION,
+                     state='readonly', width=12).pack(side=tk.LEFT)
+        ttk.Label(verificacion_frame, text="% de ejecuciones verificadas:").pack(side=tk.LEFT, padx=(10, 5))
+        self.entrada_porcentaje_verificado = ttk.Spinbox(verificacion_frame, from_=0, to=100, increment=10, width=6)
+        self.entrada_porcentaje_verificado.set(100)
+        self.entrada_porcentaje_verificado.pack(side=tk.LEFT)
+
+        # Planificador por complejidad
+        ttk.Label(config_frame, text="Presupuesto por ejecución (s):").grid(row=6, column=0, padx=(0, 10), sticky=tk.W, pady=(5, 0))
+        presupuesto_frame = ttk.Frame(config_frame)
+        presupuesto_frame.grid(row=6, column=1, padx=(0, 20), sticky=tk.W, pady=(5, 0))
+        self.entrada_presupuesto = ttk.Entry(presupuesto_frame, width=12)
+        self.entrada_presupuesto.pack(side=tk.LEFT)
+        ttk.Label(presupuesto_frame, text="(vacío = sin límite)  Si se excede:").pack(side=tk.LEFT, padx=(10, 5))
+        self.politica_var = tk.StringVar(value='omitir')
+        ttk.Combobox(presupuesto_frame, textvariable=self.politica_var, values=POLITICAS,
+                     state='readonly', width=12).pack(side=tk.LEFT)
+
+        # Límite de tiempo y cancelación
+        ttk.Label(config_frame, text="Límite por ejecución (s):").grid(row=7, column=0, padx=(0, 10), sticky=tk.W, pady=(5, 0))
+        limite_frame = ttk.Frame(config_frame)
+        limite_frame.grid(row=7, column=1, padx=(0, 20), sticky=tk.W, pady=(5, 0))
+        self.entrada_limite = ttk.Entry(limite_frame, width=12)
+        self.entrada_limite.pack(side=tk.LEFT)
+        self.aislar_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(limite_frame, text="Ejecutar en proceso aparte (Cancelar interrumpe la ejecución en curso)",
+                        variable=self.aislar_var).pack(side=tk.LEFT, padx=10)
+
+        # Modo de medición
+        self.medicion_separada_var = tk.BooleanVar(value=False)
+        medicion_frame = ttk.Frame(config_frame)
+        medicion_frame.grid(row=8, column=0, columnspan=2, sticky=tk.W, pady=(5, 0))
+        ttk.Checkbutton(medicion_frame, text="Medir tiempo con versiones sin contadores (instrucciones en una ejecución aparte)",
+                        variable=self.medicion_separada_var).pack(side=tk.LEFT)
+        self.contadores_hw_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(medicion_frame, text="Contadores de hardware (perf, Linux)",
+                        variable=self.contadores_hw_var).pack(side=tk.LEFT, padx=10)
+        self.memoria_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(medicion_frame, text="Medir memoria (proceso aparte)",
+                        variable=self.memoria_var).pack(side=tk.LEFT, padx=10)
+        self.entrada_tipada_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(medicion_frame, text="Entrada como array('i') (4 bytes por elemento)",
+                        variable=self.entrada_tipada_var).pack(side=tk.LEFT, padx=10)
+
+        # Cronómetro: calentamiento, bucles para ejecuciones cortas y recolector de basura
+        ttk.Label(config_frame, text="Calentamiento (ejecuciones):").grid(row=9, column=0, padx=(0, 10), sticky=tk.W, pady=(5, 0))
+        cronometro_frame = ttk.Frame(config_frame)
+        cronometro_frame.grid(row=9, column=1, padx=(0, 20), sticky=tk.W, pady=(5, 0))
+        self.entrada_calentamiento = ttk.Spinbox(cronometro_frame, from_=0, to=10, width=6)
+        self.entrada_calentamiento.set(CALENTAMIENTO_POR_DEFECTO)
+        self.entrada_calentamiento.pack(side=tk.LEFT)
+        ttk.Label(cronometro_frame, text="Repetir en bucle las ejecuciones de menos de (ms):").pack(side=tk.LEFT, padx=(10, 5))
+        self.entrada_tiempo_minimo = ttk.Entry(cronometro_frame, width=8)
+        self.entrada_tiempo_minimo.insert(0, f"{TIEMPO_MINIMO_POR_DEFECTO * 1000:g}")
+        self.entrada_tiempo_minimo.pack(side=tk.LEFT)
+        self.desactivar_gc_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(cronometro_frame, text="Desactivar el recolector de basura al cronometrar",
+                        variable=self.desactivar_gc_var).pack(side=tk.LEFT, padx=10)
+
+        # Copia del log a archivo y base de resultados
+        archivos_frame = ttk.Frame(config_frame)
+        archivos_frame.grid(row=10, column=0, columnspan=2, sticky=tk.W, pady=(5, 0))
+        self.log_archivo_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(archivos_frame, text=f"Guardar el log en {ARCHIVO_LOG_POR_DEFECTO} (rotativo)",
+                        variable=self.log_archivo_var, command=self._cambiar_log_archivo).pack(side=tk.LEFT)
+        self.guardar_base_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(archivos_frame, text=f"Guardar cada medición en {ARCHIVO_BASE_POR_DEFECTO}",
+                        variable=self.guardar_base_var).pack(side=tk.LEFT, padx=10)
+
         # Botones de acción
         btn_frame = ttk.Frame(config_frame)
-        btn_frame.grid(row=3, column=0, columnspan=3, pady=(10, 0))
+        btn_frame.grid(row=11, column=0, columnspan=3, pady=(10, 0))
 
         self.btn_ejecutar_serie = ttk.Button(btn_frame, text="🚀 Ejecutar Serie", command=self.ejecutar_serie)
         self.btn_ejecutar_serie.pack(side=tk.LEFT, padx=5)
 
+        self.btn_cancelar = ttk.Button(btn_frame, text="⏹️ Cancelar", command=self.cancelar_serie, state='disabled')
+        self.btn_cancelar.pack(side=tk.LEFT, padx=5)
+
         self.btn_graficos = ttk.Button(btn_frame, text="📊 Ver Gráficos Comparativos", command=self.abrir_ventana_graficos)
         self.btn_graficos.pack(side=tk.LEFT, padx=5)
         
@@ -281,10 +247,15 @@ class AplicacionLaboratorio:
         self.btn_exportar = ttk.Button(btn_frame, text="💾 Exportar Resultados", command=self.exportar_resultados, state='disabled')
         self.btn_exportar.pack(side=tk.LEFT, padx=5)
         
+        self.btn_corridas = ttk.Button(btn_frame, text="🗂️ Corridas Guardadas", command=self.abrir_corridas_guardadas)
+        self.btn_corridas.pack(side=tk.LEFT, padx=5)
+
         ttk.Button(btn_frame, text="🧹 Limpiar Datos", command=self.limpiar_datos).pack(side=tk.LEFT, padx=5)
 
-        self.progress = ttk.Progressbar(config_frame, mode='determinate')
-        self.progress.grid(row=4, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(10, 0))
+        self.progress = ttk.Progressbar(config_frame, mode='determinate', maximum=ESCALA_PROGRESO)
+        self.progress.grid(row=12, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(10, 0))
+        self.progreso_label = ttk.Label(config_frame, text="")
+        self.progreso_label.grid(row=13, column=0, columnspan=3, sticky=tk.W)
 
     def crear_panel_resultados(self, parent):
         resultados_frame = ttk.LabelFrame(parent, text="📋 LOG DE EJECUCIÓN Y ANÁLISIS", padding="10")
@@ -311,91 +282,218 @@ class AplicacionLaboratorio:
 
     def ejecutar_serie(self):
         try:
-            serie_str = self.entrada_serie.get()
-            if not serie_str:
-                messagebox.showerror("Error", "La serie de tamaños no puede estar vacía.")
-                return
-            
-            tamanos_str = serie_str.replace(' ', '').lower().split(',')
-            tamanos = []
-            for s in tamanos_str:
-                if 'm' in s:
-                    tamanos.append(int(float(s.replace('m', '')) * 1_000_000))
-                elif 'k' in s:
-                    tamanos.append(int(float(s.replace('k', '')) * 1_000))
-                else:
-                    tamanos.append(int(s))
-            
-            if any(n <= 0 for n in tamanos):
-                messagebox.showerror("Error", "Todos los tamaños deben ser mayores a 0.")
-                return
-            
-            repeticiones = int(self.entrada_repeticiones.get())
-            tipo_datos = self.tipo_datos_var.get()
-            
-            self.bloquear_controles(True)
-            thread = threading.Thread(target=self._ejecutar_serie_worker, args=(tamanos, repeticiones, tipo_datos), daemon=True)
-            thread.start()
-
+            tamanos = parsear_serie_tamanos(self.entrada_serie.get())
         except (ValueError, TypeError) as e:
             messagebox.showerror("Error", f"Formato de serie inválido. Use números separados por comas (ej: 1000, 5k, 10k).\n{e}")
+            return
+        try:
+            repeticiones = self._leer_opcion("Repeticiones por tamaño", self.entrada_repeticiones.get(), _entero_positivo)
+            opciones = self._leer_opciones()
+            # Se crea en el hilo de Tk para que Cancelar tenga siempre a quién dirigirse
+            self.ejecutor_actual = EjecutorSerie(self.algoritmos, self.funciones_ordenamiento, log=self.log,
+                                                 al_progresar=self._al_progresar, al_medir=self._al_medir,
+                                                 **opciones)
+        except (ValueError, TypeError) as e:
+            messagebox.showerror("Opción Inválida", str(e))
+            return
+        self._lanzar_serie(tamanos, repeticiones, self.tipo_datos_var.get())
+
+    @staticmethod
+    def _leer_opcion(etiqueta: str, texto: str, convertir: Callable):
+        """Convierte el texto de un campo; si no es válido, el error nombra el campo."""
+        texto = texto.strip()
+        try:
+            return convertir(texto)
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"{etiqueta}: valor inválido '{texto}'.\n{e}") from e
+
+    def _leer_opciones(self) -> dict:
+        """Opciones del ejecutor según los controles; se leen aquí, en el hilo de Tk, y viajan ya resueltas."""
+        leer = self._leer_opcion
+        calentamiento = leer("Calentamiento (ejecuciones)", self.entrada_calentamiento.get(), _entero_no_negativo)
+        tiempo_minimo = leer("Repetir en bucle las ejecuciones de menos de (ms)", self.entrada_tiempo_minimo.get(),
+                             _milisegundos_en_segundos)
+        return {
+            'trabajadores': leer("Procesos en paralelo", self.entrada_trabajadores.get(), _entero_positivo),
+            'fijar_cpu': self.fijar_cpu_var.get(),
+            'modo_medicion': 'separado' if self.medicion_separada_var.get() else 'instrumentado',
+            'semilla': leer("Semilla", self.entrada_semilla.get(), lambda texto: int(texto) if texto else None),
+            'cache': CacheDatos() if self.usar_cache_var.get() else None,
+            'verificacion': self.verificacion_var.get(),
+            'fraccion_verificada': leer("% de ejecuciones verificadas", self.entrada_porcentaje_verificado.get(),
+                                        lambda texto: min(max(float(texto), 0.0), 100.0) / 100),
+            'planificador': leer("Presupuesto por ejecución (s)", self.entrada_presupuesto.get(),
+                                 lambda texto: PlanificadorComplejidad(float(texto), self.politica_var.get())
+                                 if texto else None),
+            'limite_tiempo': leer("Límite por ejecución (s)", self.entrada_limite.get(), _segundos_opcionales),
+            'aislar': self.aislar_var.get(),
+            'contadores_hw': self.contadores_hw_var.get(),
+            'memoria': self.memoria_var.get(),
+            'entrada': 'array' if self.entrada_tipada_var.get() else 'lista',
+            'cronometro': Cronometro(calentamiento, tiempo_minimo, self.desactivar_gc_var.get()),
+            'base': self._abrir_base() if self.guardar_base_var.get() else None,
+        }
+
+    def _lanzar_serie(self, tamanos: List[int], repeticiones: int, tipo_datos: str):
+        """Ejecuta self.ejecutor_actual en el hilo de trabajo y programa los refrescos de la interfaz."""
+        self.bloquear_controles(True)
+        thread = threading.Thread(target=self._ejecutar_serie_worker,
+                                  args=(self.ejecutor_actual, tamanos, repeticiones, tipo_datos), daemon=True)
+        thread.start()
+        self.root.after(INTERVALO_REFRESCO_MS, self._refrescar_graficos_en_vivo)
+        self.root.after(INTERVALO_PROGRESO_MS, self._refrescar_progreso)
+
+    def _abrir_base(self) -> BaseResultados:
+        if self.base_resultados is None:
+            self.base_resultados = BaseResultados()
+        return self.base_resultados
+
+    def abrir_corridas_guardadas(self):
+        """Lista las corridas de la base de resultados para cargarlas en la interfaz o reanudarlas."""
+        try:
+            corridas = self._abrir_base().corridas()
+        except Exception as e:
+            messagebox.showerror("Base de Resultados", f"No se pudo leer {ARCHIVO_BASE_POR_DEFECTO}:\n{e}")
+            return
+        if not corridas:
+            messagebox.showinfo("Base de Resultados", f"Todavía no hay corridas guardadas en {ARCHIVO_BASE_POR_DEFECTO}.")
+            return
+
+        win = tk.Toplevel(self.root)
+        win.title("🗂️ Corridas Guardadas")
+        win.geometry("1000x400")
+        columnas = ('id', 'inicio', 'estado', 'caso', 'tamanos', 'repeticiones', 'algoritmos', 'mediciones', 'revision')
+        titulos = ('Id', 'Inicio', 'Estado', 'Caso', 'Tamaños', 'Rep.', 'Algoritmos', 'Mediciones', 'Revisión')
+        tabla = ttk.Treeview(win, columns=columnas, show='headings', selectmode='browse')
+        for columna, titulo in zip(columnas, titulos):
+            tabla.heading(columna, text=titulo)
+            tabla.column(columna, width=70 if columna in ('repeticiones', 'mediciones') else 110)
+        for corrida in corridas:
+            tabla.insert('', tk.END, iid=corrida['id'], values=(
+                corrida['id'][:12], time.strftime('%Y-%m-%d %H:%M', time.localtime(corrida['inicio'])),
+                corrida['estado'], corrida['caso'], ', '.join(f"{n:,}" for n in corrida['tamanos']),
+                corrida['repeticiones'], len(corrida['algoritmos']), corrida['mediciones'],
+                corrida['revision'] or '-'))
+        tabla.pack(fill=tk.BOTH, expand=True, padx=10, pady=(10, 5))
+
+        def seleccionada():
+            seleccion = tabla.selection()
+            if not seleccion:
+                messagebox.showwarning("Sin Selección", "Seleccione una corrida.", parent=win)
+            return seleccion[0] if seleccion else None
+
+        def cargar():
+            id_corrida = seleccionada()
+            if id_corrida is not None:
+                self.cargar_corrida(id_corrida)
+
+        def reanudar():
+            id_corrida = seleccionada()
+            if id_corrida is not None and self.reanudar_corrida(id_corrida):
+                win.destroy()
+
+        botones = ttk.Frame(win)
+        botones.pack(pady=(0, 10))
+        ttk.Button(botones, text="📥 Cargar en la interfaz", command=cargar).pack(side=tk.LEFT, padx=5)
+        ttk.Button(botones, text="▶️ Reanudar", command=reanudar).pack(side=tk.LEFT, padx=5)
+
+    def cargar_corrida(self, id_corrida: str):
+        """
+        Agrega las mediciones de una corrida guardada a los datos acumulados, sin
+        ejecutar nada. Las celdas que ya estén cargadas no se repiten.
+        """
+        if self.ejecutor_actual is not None:
+            # La ventana de corridas puede haber quedado abierta al iniciar una serie
+            messagebox.showwarning("Serie en Curso", "Espere a que termine la serie actual o cancélela.")
+            return
+        mediciones = self._abrir_base().mediciones(id_corrida)
+        cargadas = aplicar_mediciones(mediciones, self.algoritmos, id_corrida)
+        disponibles = sum(1 for medicion in mediciones if medicion['algoritmo'] in self.algoritmos)
+        self.log(f"📥 Corrida {id_corrida[:12]}: {cargadas} mediciones cargadas")
+        if cargadas < disponibles:
+            self.log(f"   ({disponibles - cargadas} ya estaban cargadas)")
+        if disponibles < len(mediciones):
+            self.log(f"   ({len(mediciones) - disponibles} de algoritmos no disponibles; ¿falta cargar un plugin?)")
+        self.bloquear_controles(False)
+        self._refrescar_graficos()
+
+    def reanudar_corrida(self, id_corrida: str) -> bool:
+        """Continúa una corrida guardada con sus opciones originales; devuelve False si no se pudo iniciar."""
+        if self.ejecutor_actual is not None:
+            messagebox.showwarning("Serie en Curso", "Espere a que termine la serie actual o cancélela.")
+            return False
+        base = self._abrir_base()
+        corrida = base.corrida(id_corrida)
+        if corrida['estado'] == 'completada':
+            messagebox.showinfo("Corrida Completa", "Esa corrida ya terminó; use 'Cargar en la interfaz'.")
+            return False
+        faltantes = [nombre for nombre in corrida['algoritmos'] if nombre not in self.funciones_ordenamiento]
+        if faltantes:
+            messagebox.showerror("Algoritmos no Disponibles",
+                                 f"La corrida usa algoritmos que no están cargados: {', '.join(faltantes)}")
+            return False
+        funciones = {nombre: self.funciones_ordenamiento[nombre] for nombre in corrida['algoritmos']}
+        self.ejecutor_actual = EjecutorSerie(self.algoritmos, funciones, log=self.log,
+                                             al_progresar=self._al_progresar, al_medir=self._al_medir,
+                                             semilla=corrida['semilla'], base=base, reanudar=corrida['id'],
+                                             **opciones_ejecutor(corrida['opciones']))
+        self._lanzar_serie(corrida['tamanos'], corrida['repeticiones'], corrida['caso'])
+        return True
         
-    def _ejecutar_serie_worker(self, tamanos: List[int], repeticiones: int, tipo_datos: str):
-        total_pasos = len(tamanos) * len(self.algoritmos) * repeticiones
-        paso_actual = 0
-        self.progress['maximum'] = total_pasos
-        
+    def _al_progresar(self, estado: dict):
+        # Se llama desde el hilo de trabajo: solo se guarda el último estado; _refrescar_progreso lo muestra
+        self._progreso_pendiente = estado
+
+    def _refrescar_progreso(self):
+        estado, self._progreso_pendiente = self._progreso_pendiente, None
+        if estado is not None:
+            self.progress['value'] = estado['fraccion'] * ESCALA_PROGRESO
+            self.progreso_label.config(
+                text=f"{estado['completadas']}/{estado['total']} celdas | {estado['celdas_por_segundo']:.1f} celdas/s | "
+                     f"restante estimado: {formatear_duracion(estado['eta'])}")
+        if self.ejecutor_actual is not None:
+            self.root.after(INTERVALO_PROGRESO_MS, self._refrescar_progreso)
+
+    def _ejecutar_serie_worker(self, ejecutor: EjecutorSerie, tamanos: List[int], repeticiones: int, tipo_datos: str):
         try:
-            self.log(f"\n{'='*70}")
-            self.log(f"🔬 NUEVA SERIE DE EXPERIENCIAS")
-            self.log(f"   Tipo de datos: {tipo_datos.upper()}")
-            self.log(f"   Repeticiones por tamaño: {repeticiones}")
-            self.log(f"{'='*70}\n")
-            
-            for n in sorted(tamanos):
-                self.log(f"\n--- EXPERIENCIA PARA n = {n:,} ({repeticiones} repeticiones) ---")
-                
-                for rep in range(repeticiones):
-                    array_original = generar_array_segun_caso(n, tipo_datos)
-                    
-                    for nombre, func in self.funciones_ordenamiento.items():
-                        paso_actual += 1
-                        self.progress['value'] = paso_actual
-                        
-                        if rep == 0:
-                            self.log(f"🔄 Ejecutando {nombre}...")
-                        
-                        tiempo_inicio = time.perf_counter()
-                        arr_ordenado, instrucciones = func(array_original)
-                        tiempo_total = time.perf_counter() - tiempo_inicio
-                        
-                        # Verificar que el ordenamiento es correcto
-                        if not verificar_ordenamiento(array_original, arr_ordenado):
-                            self.log(f"  ⚠️ ADVERTENCIA: {nombre} no ordenó correctamente!")
-                        
-                        self.algoritmos[nombre].agregar_metricas(n, tiempo_total, instrucciones)
-                
-                # Mostrar promedios después de todas las repeticiones
-                self.log(f"\n📊 PROMEDIOS para n={n:,}:")
-                for nombre, alg in self.algoritmos.items():
-                    if n in alg.resultados:
-                        mediciones = alg.resultados[n]
-                        avg_tiempo = statistics.mean(m[0] for m in mediciones[-repeticiones:])
-                        avg_inst = statistics.mean(m[1] for m in mediciones[-repeticiones:])
-                        std_tiempo = statistics.stdev(m[0] for m in mediciones[-repeticiones:]) if len(mediciones[-repeticiones:]) > 1 else 0
-                        self.log(f"  {nombre:15s}: {avg_tiempo:8.6f}s (±{std_tiempo:.6f}s) | {int(avg_inst):,} instrucciones")
-
-            self.log(f"\n{'='*70}")
-            self.log("✅✅✅ SERIE DE EXPERIENCIAS COMPLETADA ✅✅✅")
-            self.log(f"{'='*70}\n")
+            ejecutor.ejecutar(tamanos, repeticiones, tipo_datos)
         except Exception as e:
             self.log(f"❌ ERROR: {e}")
             messagebox.showerror("Error en Ejecución", str(e))
         finally:
-            self.bloquear_controles(False)
+            self.root.after(0, self._serie_terminada)
+
+    def _serie_terminada(self):
+        self.ejecutor_actual = None
+        self._progreso_pendiente = None
+        self.bloquear_controles(False)
+        self._refrescar_graficos()
+
+    def _al_medir(self, medicion: dict):
+        # Se llama desde el hilo de trabajo: solo se marca; el redibujo ocurre en el hilo de Tk
+        self._hay_mediciones_nuevas = True
+
+    def _refrescar_graficos_en_vivo(self):
+        """Mientras corre la serie, agrega a los gráficos abiertos las mediciones nuevas, a ritmo acotado."""
+        if self._hay_mediciones_nuevas:
+            self._refrescar_graficos()
+        if self.ejecutor_actual is not None:
+            self.root.after(INTERVALO_REFRESCO_MS, self._refrescar_graficos_en_vivo)
+
+    def _refrescar_graficos(self):
+        self._hay_mediciones_nuevas = False
+        self.graficos_abiertos = [g for g in self.graficos_abiertos if g.canvas.winfo_exists()]
+        for grafico in self.graficos_abiertos:
+            grafico.dibujar()  # Incremental: solo crea los puntos nuevos y mueve los que cambiaron de escala
+
+    def cancelar_serie(self):
+        if self.ejecutor_actual is not None:
+            self.log("⏹️ Cancelando la serie...")
+            self.ejecutor_actual.cancelar()
+            self.btn_cancelar.config(state='disabled')
 
     def abrir_ventana_graficos(self):
-        if not any(alg.resultados for alg in self.algoritmos.values()):
+        if not any(alg.resultados for alg in self.algoritmos.values()) and self.ejecutor_actual is None:
             messagebox.showwarning("Sin Datos", "Debe ejecutar al menos una experiencia antes de generar gráficos.")
             return
 
@@ -409,148 +507,61 @@ class AplicacionLaboratorio:
         # Pestaña 1: Tiempo vs Tamaño
         frame_tiempo = ttk.Frame(notebook)
         notebook.add(frame_tiempo, text="Tiempo de Ejecución vs. Tamaño")
-        self.crear_panel_grafico(frame_tiempo, 'tiempo')
+        self.graficos_abiertos.append(self.crear_panel_grafico(frame_tiempo, 'tiempo'))
 
         # Pestaña 2: Instrucciones vs Tamaño
         frame_inst = ttk.Frame(notebook)
         notebook.add(frame_inst, text="Instrucciones vs. Tamaño")
-        self.crear_panel_grafico(frame_inst, 'instrucciones')
-
-    def crear_panel_grafico(self, parent, data_type: str):
+        self.graficos_abiertos.append(self.crear_panel_grafico(frame_inst, 'instrucciones'))
+
+        # Pestaña 3: memoria (pico de tracemalloc o incremento de RSS) a elección
+        frame_memoria = ttk.Frame(notebook)
+        notebook.add(frame_memoria, text="Memoria vs. Tamaño")
+        self.graficos_abiertos.append(self.crear_panel_grafico(frame_memoria, METRICAS_MEMORIA[0], metricas=METRICAS_MEMORIA))
+
+        # Pestaña 4: desglose de operaciones, con la operación del eje Y a elección
+        frame_ops = ttk.Frame(notebook)
+        notebook.add(frame_ops, text="Operaciones vs. Tamaño")
+        self.graficos_abiertos.append(self.crear_panel_grafico(frame_ops, OPERACIONES[0], metricas=OPERACIONES))
+
+        # Una pestaña por cada otra métrica adicional medida (p. ej. contadores de hardware)
+        metricas_extra = sorted({m for alg in self.algoritmos.values() for m in alg.metricas_disponibles()}
+                                - set(OPERACIONES) - set(METRICAS_MEMORIA))
+        for metrica in metricas_extra:
+            frame_metrica = ttk.Frame(notebook)
+            notebook.add(frame_metrica, text=f"{ETIQUETAS_METRICAS.get(metrica, metrica)} vs. Tamaño")
+            self.graficos_abiertos.append(self.crear_panel_grafico(frame_metrica, metrica))
+
+    def crear_panel_grafico(self, parent, data_type: str, metricas=None):
+        """Panel con un GraficoComparativo; con metricas, un selector elige cuál va en el eje Y."""
         top_frame = ttk.Frame(parent)
         top_frame.pack(fill=tk.X, padx=10, pady=5)
-        
-        log_scale_var = tk.BooleanVar(value=(data_type == 'instrucciones'))
+
+        if metricas:
+            etiquetas = {ETIQUETAS_METRICAS.get(m, m): m for m in metricas}
+            metrica_var = tk.StringVar(value=ETIQUETAS_METRICAS.get(data_type, data_type))
+            ttk.Label(top_frame, text="Eje Y:").pack(side=tk.LEFT)
+            selector = ttk.Combobox(top_frame, textvariable=metrica_var, values=list(etiquetas),
+                                    state='readonly', width=24)
+            selector.pack(side=tk.LEFT, padx=(5, 15))
+            selector.bind("<<ComboboxSelected>>",
+                          lambda e: grafico.configurar(data_type=etiquetas[metrica_var.get()]))
+
+        log_scale_var = tk.BooleanVar(value=(data_type != 'tiempo'))
         ttk.Checkbutton(top_frame, text="Usar Escala Logarítmica (Eje Y)", variable=log_scale_var,
-                        command=lambda: self.dibujar_grafico_comparativo(canvas, data_type, log_scale_var.get())).pack(side=tk.LEFT)
+                        command=lambda: grafico.configurar(use_log_scale=log_scale_var.get())).pack(side=tk.LEFT)
         
         show_error_bars = tk.BooleanVar(value=True)
         ttk.Checkbutton(top_frame, text="Mostrar Desviación Estándar", variable=show_error_bars,
-                        command=lambda: self.dibujar_grafico_comparativo(canvas, data_type, log_scale_var.get(), show_error_bars.get())).pack(side=tk.LEFT, padx=10)
+                        command=lambda: grafico.configurar(show_error_bars=show_error_bars.get())).pack(side=tk.LEFT, padx=10)
 
         canvas = tk.Canvas(parent, bg="white")
         canvas.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
-        # Dibujar el gráfico cuando el canvas esté listo
-        canvas.bind("<Configure>", lambda e: self.dibujar_grafico_comparativo(e.widget, data_type, log_scale_var.get(), show_error_bars.get()))
-
-    def dibujar_grafico_comparativo(self, canvas: tk.Canvas, data_type: str, use_log_scale: bool, show_error_bars: bool = True):
-        canvas.delete("all")
-        
-        width = canvas.winfo_width()
-        height = canvas.winfo_height()
-        m_left, m_right, m_top, m_bottom = 100, 50, 50, 80
-        plot_w = width - m_left - m_right
-        plot_h = height - m_top - m_bottom
-
-        if plot_w <= 0 or plot_h <= 0: return
-
-        all_data = {}
-        min_x, max_x, min_y, max_y = float('inf'), 0, float('inf'), 0
-
-        for nombre, alg in self.algoritmos.items():
-            promedios = alg.obtener_promedios()
-            if not promedios: continue
-            
-            tamanos = [p[0] for p in promedios]
-            valores = [p[1] if data_type == 'tiempo' else p[2] for p in promedios]
-            
-            # Obtener desviaciones estándar
-            std_devs = []
-            for tamanio in tamanos:
-                std_t, std_i = alg.obtener_desviacion_estandar(tamanio)
-                std_devs.append(std_t if data_type == 'tiempo' else std_i)
-            
-            all_data[nombre] = (tamanos, valores, std_devs, alg.color)
-
-            min_x = min(min_x, min(tamanos))
-            max_x = max(max_x, max(tamanos))
-            min_y_candidate = min(v for v in valores if v > 0) if any(v > 0 for v in valores) else 1
-            min_y = min(min_y, min_y_candidate)
-            max_y = max(max_y, max(valores))
-
-        if not all_data: return
-
-        if min_x == max_x: max_x = min_x + 1
-        min_y_final = 1 if use_log_scale and min_y == float('inf') else (min_y if use_log_scale else 0)
-        if min_y_final >= max_y: max_y = min_y_final + 1
-        
-        # Funciones de mapeo
-        def map_x(x): return m_left + (x - min_x) / (max_x - min_x) * plot_w
-        def map_y(y):
-            if use_log_scale:
-                if y <= 0: return m_top + plot_h
-                log_min = math.log10(min_y_final)
-                log_max = math.log10(max_y)
-                if log_max == log_min: return m_top + plot_h
-                return m_top + (1 - (math.log10(y) - log_min) / (log_max - log_min)) * plot_h
-            else:
-                return m_top + (1 - (y - min_y_final) / (max_y - min_y_final)) * plot_h
-
-        # Dibujar ejes, ticks y título
-        self._dibujar_ejes(canvas, m_left, m_top, plot_w, plot_h, min_x, max_x, min_y_final, max_y, map_x, map_y, data_type, use_log_scale)
-
-        # Dibujar datos, barras de error y leyenda
-        legend_y_start = m_top + 10
-        for i, (nombre, (tamanos, valores, std_devs, color)) in enumerate(all_data.items()):
-            coords = []
-            for x, y, std in zip(tamanos, valores, std_devs):
-                px, py = map_x(x), map_y(y)
-                coords.extend([px, py])
-                
-                # Dibujar barras de error
-                if show_error_bars and std > 0:
-                    py_upper = map_y(y + std) if not use_log_scale else map_y(y * (1 + std/y)) if y > 0 else py
-                    py_lower = map_y(max(y - std, min_y_final)) if not use_log_scale else map_y(y * (1 - std/y)) if y > std else map_y(min_y_final)
-                    canvas.create_line(px, py_upper, px, py_lower, fill=color, width=1, dash=(2, 2))
-                    canvas.create_line(px-2, py_upper, px+2, py_upper, fill=color, width=1)
-                    canvas.create_line(px-2, py_lower, px+2, py_lower, fill=color, width=1)
-                
-                # Punto de datos
-                canvas.create_oval(px - 3, py - 3, px + 3, py + 3, fill=color, outline=color)
-            
-            if len(coords) >= 4:
-                canvas.create_line(coords, fill=color, width=2)
-            
-            # Leyenda
-            canvas.create_rectangle(width - 220, legend_y_start + i*20 - 5, width-215, legend_y_start + i*20 + 5, fill=color, outline=color)
-            canvas.create_text(width - 210, legend_y_start + i*20, text=nombre, anchor=tk.W)
-
-    def _dibujar_ejes(self, canvas, m_l, m_t, p_w, p_h, min_x, max_x, min_y, max_y, map_x, map_y, data_type, use_log_scale):
-        # Ejes
-        canvas.create_line(m_l, m_t, m_l, m_t + p_h, width=2)
-        canvas.create_line(m_l, m_t + p_h, m_l + p_w, m_t + p_h, width=2)
-
-        # Título
-        y_label = "Tiempo de Ejecución (s)" if data_type == 'tiempo' else "Total de Instrucciones"
-        if use_log_scale: y_label += " (Escala Logarítmica)"
-        canvas.create_text(m_l + p_w / 2, m_t / 2, text=f"{y_label} vs. Tamaño de Entrada", font=("Arial", 14, "bold"))
-        canvas.create_text(m_l + p_w / 2, m_t + p_h + 45, text="Tamaño de Entrada (n)", font=("Arial", 11))
-        canvas.create_text(25, m_t + p_h / 2, text=y_label, angle=90, font=("Arial", 11))
-
-        # Ticks X
-        for i in range(6):
-            val = min_x + i * (max_x - min_x) / 5
-            px = map_x(val)
-            canvas.create_line(px, m_t + p_h, px, m_t + p_h + 5)
-            canvas.create_text(px, m_t + p_h + 15, text=f"{val:,.0f}", anchor=tk.N)
-
-        # Ticks Y
-        if use_log_scale:
-            exp_start = math.floor(math.log10(min_y))
-            exp_end = math.ceil(math.log10(max_y))
-            for exp in range(exp_start, exp_end + 1):
-                val = 10**exp
-                if min_y <= val <= max_y:
-                    py = map_y(val)
-                    canvas.create_line(m_l - 5, py, m_l, py)
-                    canvas.create_text(m_l - 10, py, text=f"1e{exp}", anchor=tk.E)
-        else:
-            for i in range(6):
-                val = min_y + i * (max_y - min_y) / 5
-                py = map_y(val)
-                canvas.create_line(m_l - 5, py, m_l, py)
-                canvas.create_text(m_l - 10, py, text=f"{val:,.2f}" if val < 10 else f"{val:,.0f}", anchor=tk.E)
+        # Dibujar el gráfico cuando el canvas esté listo; los redimensionados se agrupan en un redibujo
+        grafico = GraficoComparativo(canvas, self.algoritmos, data_type, log_scale_var.get(), show_error_bars.get())
+        canvas.bind("<Configure>", grafico.programar_redibujo)
+        return grafico
 
     def mostrar_resumen_estadistico(self):
         """Muestra una ventana con resumen estadístico de todas las experiencias."""
@@ -574,7 +585,14 @@ class AplicacionLaboratorio:
         resumen = "="*70 + "\n"
         resumen += "         RESUMEN ESTADÍSTICO DE EXPERIENCIAS\n"
         resumen += "="*70 + "\n\n"
-        
+
+        # Factor respecto de la línea base: cuántas veces más lento que sorted() para el mismo n
+        base = self.algoritmos.get(LINEA_BASE_REFERENCIA)
+        tiempos_base = {tamanio: tiempo for tamanio, tiempo, _ in base.obtener_promedios()} if base else {}
+        if tiempos_base:
+            resumen += f"'× base' = tiempo / tiempo de {LINEA_BASE_REFERENCIA} para el mismo tamaño\n"
+            resumen += "(sobrecosto del intérprete y del algoritmo frente al ordenamiento en C)\n\n"
+
         for nombre, alg in self.algoritmos.items():
             promedios = alg.obtener_promedios()
             if not promedios:
@@ -586,12 +604,28 @@ class AplicacionLaboratorio:
             resumen += f"  Total de ejecuciones: {sum(len(alg.resultados[t]) for t in alg.resultados)}\n\n"
             
             # Tabla de resultados
-            resumen += f"  {'Tamaño':>10} | {'Tiempo Prom (s)':>15} | {'StdDev':>10} | {'Instrucciones':>15}\n"
-            resumen += "  " + "-" * 66 + "\n"
+            resumen += f"  {'Tamaño':>10} | {'Tiempo Prom (s)':>15} | {'StdDev':>10} | {'Instrucciones':>15} | {'× base':>8}\n"
+            resumen += "  " + "-" * 77 + "\n"
             
             for tamanio, tiempo, instrucciones in promedios:
                 std_t, std_i = alg.obtener_desviacion_estandar(tamanio)
-                resumen += f"  {tamanio:>10,} | {tiempo:>15.6f} | {std_t:>10.6f} | {instrucciones:>15,}\n"
+                tiempo_base = tiempos_base.get(tamanio)
+                factor = f"{tiempo / tiempo_base:.1f}x" if tiempo_base else '-'
+                instrucciones = f"{instrucciones:,}" if nombre not in LINEAS_BASE else '-'
+                resumen += f"  {tamanio:>10,} | {tiempo:>15.6f} | {std_t:>10.6f} | {instrucciones:>15} | {factor:>8}\n"
+            for tamanio, tiempo, instrucciones in alg.obtener_extrapolados():
+                resumen += f"  {tamanio:>10,} | {tiempo:>15.6g} | {'extrap.':>10} | {instrucciones:>15,}\n"
+
+            # Estadísticas robustas del tiempo: poco sensibles a las ejecuciones atípicas
+            resumen += f"\n  {'Tamaño':>10} | {'Mediana (s)':>12} | {'IQR':>10} | {'Mínimo (s)':>12} | {'IC 95% media':>12}\n"
+            resumen += "  " + "-" * 66 + "\n"
+            for tamanio, _, _ in promedios:
+                est = alg.obtener_estadisticas_robustas(tamanio)
+                resumen += (f"  {tamanio:>10,} | {est['mediana']:>12.6f} | {est['iqr']:>10.6f} | "
+                            f"{est['minimo']:>12.6f} | {'±' + format(est['ic95'], '.6f'):>12}\n")
+            if alg.tiempos_agotados:
+                agotados = ", ".join(f"n={t:,} ({c})" for t, c in sorted(alg.tiempos_agotados.items()))
+                resumen += f"\n  Ejecuciones con tiempo agotado: {agotados}\n"
             
             # Calcular factor de crecimiento
             if len(promedios) >= 2:
@@ -604,7 +638,8 @@ class AplicacionLaboratorio:
                 factor_inst = ultimo_inst / primer_inst if primer_inst > 0 else 0
                 
                 resumen += f"\n  Factor de crecimiento (tiempo): {factor_tiempo:.2f}x\n"
-                resumen += f"  Factor de crecimiento (instrucciones): {factor_inst:.2f}x\n"
+                if nombre not in LINEAS_BASE:
+                    resumen += f"  Factor de crecimiento (instrucciones): {factor_inst:.2f}x\n"
             
             resumen += "\n\n"
         
@@ -624,19 +659,17 @@ class AplicacionLaboratorio:
         
         if tamanos_comunes:
             tamanio_max = max(tamanos_comunes)
-            resumen += f"Comparación para n = {tamanio_max:,}:\n\n"
+            resumen += f"Comparación para n = {tamanio_max:,} (mediana del tiempo):\n\n"
             
             tiempos_comparacion = []
             for nombre, alg in self.algoritmos.items():
                 if tamanio_max in alg.resultados:
-                    mediciones = alg.resultados[tamanio_max]
-                    avg_tiempo = statistics.mean(m[0] for m in mediciones)
-                    tiempos_comparacion.append((nombre, avg_tiempo))
+                    tiempos_comparacion.append((nombre, alg.obtener_estadisticas_robustas(tamanio_max)['mediana']))
             
             tiempos_comparacion.sort(key=lambda x: x[1])
             
             for i, (nombre, tiempo) in enumerate(tiempos_comparacion, 1):
-                resumen += f"  {i}. {nombre:15s}: {tiempo:.6f}s"
+                resumen += f"  {i}. {nombre:25s}: {tiempo:.6f}s"
                 if i == 1:
                     resumen += " 🏆 (Más rápido)"
                 elif i == len(tiempos_comparacion):
@@ -653,23 +686,37 @@ class AplicacionLaboratorio:
         return resumen
 
     def log(self, mensaje: str):
-        self.root.after(0, self._log_thread_safe, mensaje)
+        # Seguro desde cualquier hilo: solo encola; _vaciar_log lo muestra en el próximo lote
+        self.cola_log(mensaje)
     
-    def _log_thread_safe(self, mensaje: str):
-        timestamp = time.strftime("%H:%M:%S")
-        self.log_text.insert(tk.END, f"[{timestamp}] {mensaje}\n")
-        self.log_text.see(tk.END)
+    def _vaciar_log(self):
+        """Inserta los mensajes pendientes de una sola vez y recorta el widget a MAX_LINEAS_LOG."""
+        lineas = self.cola_log.extraer(MAX_MENSAJES_POR_LOTE)
+        if lineas:
+            self.log_text.insert(tk.END, "\n".join(lineas) + "\n")
+            total = int(self.log_text.index('end-1c').split('.')[0])
+            if total > MAX_LINEAS_LOG:
+                self.log_text.delete('1.0', f'{total - MAX_LINEAS_LOG + 1}.0')
+            self.log_text.see(tk.END)
+        self.root.after(INTERVALO_LOG_MS, self._vaciar_log)
+
+    def _cambiar_log_archivo(self):
+        self.cola_log.configurar_archivo(ARCHIVO_LOG_POR_DEFECTO if self.log_archivo_var.get() else None)
 
     def bloquear_controles(self, bloquear: bool):
         state = 'disabled' if bloquear else 'normal'
         self.btn_ejecutar_serie.config(state=state)
-        self.btn_graficos.config(state=state if bloquear else 'normal')
+        self.btn_corridas.config(state=state)
+        self.btn_cancelar.config(state='normal' if bloquear else 'disabled')
+        # Los gráficos pueden abrirse durante la serie: se actualizan en vivo
+        self.btn_graficos.config(state='normal')
         tiene_datos = any(a.resultados for a in self.algoritmos.values())
         self.btn_exportar.config(state=state if bloquear else ('normal' if tiene_datos else 'disabled'))
         self.btn_resumen.config(state=state if bloquear else ('normal' if tiene_datos else 'disabled'))
         
         if not bloquear:
             self.progress['value'] = 0
+            self.progreso_label.config(text="")
 
     def limpiar_datos(self):
         if messagebox.askokcancel("Confirmar", "Esto borrará todos los datos de las experiencias acumuladas. ¿Desea continuar?"):
@@ -764,6 +811,46 @@ de la velocidad del hardware.
   - A pesar de su peor caso, en la práctica es a menudo el más rápido debido a 
     constantes bajas y buen uso de la caché.
 
+--------------------------------------------------------------------
+🔹 ESTRATEGIAS DE PIVOTE E INTROSORT
+--------------------------------------------------------------------
+• Quick Sort (pivote último): toma arr[high]; con datos ordenados o inversos 
+  cada partición deja un lado vacío y el costo cae en O(n²).
+• Aleatorio: el pivote se elige al azar; el peor caso pasa a ser improbable 
+  para cualquier entrada (O(n log n) esperado).
+• Mediana de 3: mediana entre el primero, el central y el último. Elimina el 
+  peor caso de los datos ordenados e inversos con muy pocas comparaciones.
+• Ninther (Tukey): mediana de tres medianas de tres; estima mejor la mediana 
+  real en tramos grandes (≥ 40 elementos).
+• Introsort: Quick Sort con mediana de 3 que, si la profundidad supera 
+  2·log₂(n), termina el tramo con Heap Sort. Garantiza O(n log n) en el 
+  peor caso conservando la velocidad de Quick Sort en el caso típico.
+
+--------------------------------------------------------------------
+🔹 MERGE SORT (DESCENDENTE, ASCENDENTE Y NATURAL)
+--------------------------------------------------------------------
+• Ecuación: T(n) = 2T(n/2) + O(n)  =>  O(n log n) en todos los casos
+  - Divide la entrada por la mitad, ordena cada mitad y las mezcla en tiempo 
+    lineal. Es estable y usa O(n) de memoria auxiliar.
+• Descendente (top-down): recursivo, con profundidad log₂(n).
+• Ascendente (bottom-up): mezcla tramos de 1, 2, 4, ... elementos sin recursión.
+• Natural (estilo Timsort): aprovecha las corridas ya ordenadas (invierte las 
+  descendentes), alarga las cortas con Insertion Sort y las mezcla con las 
+  invariantes de la pila de Timsort. Con datos ordenados o inversos: O(n).
+
+--------------------------------------------------------------------
+🔹 RADIX SORT (LSD) Y COUNTING SORT
+--------------------------------------------------------------------
+• No comparan elementos entre sí: aprovechan que son enteros en un rango 
+  acotado (1..100000 en los datos aleatorios).
+• Counting Sort: cuenta cada valor y reescribe en orden. O(n + k), con k el 
+  rango de valores; la memoria también es O(k).
+• Radix Sort LSD (base 256): una pasada estable de conteo por byte, del menos 
+  significativo al más significativo. O(d·(n + 256)), con d = 3 bytes para 
+  valores hasta 100000.
+• Complejidad: O(n) para un rango fijo. Con n grande superan a los algoritmos 
+  por comparación, cuyo límite inferior es Ω(n log n).
+
 --------------------------------------------------------------------
 💡 OBSERVACIONES PARA LAS EXPERIENCIAS
 --------------------------------------------------------------------
@@ -777,6 +864,7 @@ Al realizar las experiencias con diferentes tipos de datos, observará:
 • Datos ORDENADOS:
   - Insertion Sort será muy rápido: O(n)
   - Quick Sort puede degradarse a O(n²) con pivote simple
+    (las variantes de pivote e Introsort mantienen O(n log n))
   - Heap Sort mantiene O(n log n)
   - Bubble Sort mantiene O(n²)
 
@@ -792,6 +880,11 @@ Al realizar las experiencias con diferentes tipos de datos, observará:
 
 def main():
     root = tk.Tk()
+    # Antes de crear la aplicación: registra en FUNCIONES_ORDENAMIENTO solo los plugins pedidos
+    try:
+        cargar_plugins(plugins_de_entorno())
+    except ValueError as e:
+        messagebox.showwarning("Plugins", str(e))
     app = AplicacionLaboratorio(root)
     root.mainloop()
 
@@ -0,0 +1,322 @@
+# -*- coding: utf-8 -*-
+"""
+Base de resultados persistente (SQLite).
+
+Cada medición individual que emite EjecutorSerie se guarda en una base SQLite
+local junto con su corrida: identificador, caso, semilla, tamaños,
+repeticiones, algoritmos y opciones de la serie, datos de la máquina y la
+revisión de git del código. Así una serie cancelada o interrumpida puede
+reanudarse desde la última celda guardada, y las corridas anteriores pueden
+volver a cargarse en la interfaz sin ejecutarlas.
+
+La base usa journal_mode=WAL (la interfaz puede leerla mientras una serie
+escribe) y las mediciones se insertan por lotes, como mínimo cada
+INTERVALO_LOTE segundos aunque no llegue ninguna medición nueva: si el proceso
+muere se pierden a lo sumo las de ese último intervalo, y esas celdas se
+vuelven a medir al reanudar.
+"""
+
+import json
+import os
+import platform
+import sqlite3
+import subprocess
+import threading
+import time
+import uuid
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from cache_datos import CacheDatos
+from cronometro import Cronometro
+from planificador import PlanificadorComplejidad
+
+ARCHIVO_BASE_POR_DEFECTO = 'resultados.sqlite'
+TAMANO_LOTE = 100  # Mediciones por inserción
+INTERVALO_LOTE = 2.0  # Segundos entre volcados de un lote incompleto
+ESTADOS_CORRIDA = ('en_curso', 'completada', 'cancelada', 'interrumpida')
+
+# Campos de la medición con columna propia; el resto (métricas adicionales) va en 'extra' como JSON
+CAMPOS_MEDICION = ('algoritmo', 'tamanio', 'repeticion', 'semilla', 'tiempo', 'instrucciones',
+                   'correcto', 'extrapolado', 'tiempo_agotado')
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS corridas (
+    id TEXT PRIMARY KEY,
+    inicio REAL NOT NULL,
+    fin REAL,
+    estado TEXT NOT NULL,
+    caso TEXT NOT NULL,
+    semilla INTEGER NOT NULL,
+    tamanos TEXT NOT NULL,
+    repeticiones INTEGER NOT NULL,
+    algoritmos TEXT NOT NULL,
+    opciones TEXT NOT NULL,
+    maquina TEXT NOT NULL,
+    revision TEXT
+);
+CREATE TABLE IF NOT EXISTS mediciones (
+    corrida TEXT NOT NULL REFERENCES corridas(id),
+    algoritmo TEXT NOT NULL,
+    tamanio INTEGER NOT NULL,
+    repeticion INTEGER,
+    semilla INTEGER,
+    tiempo REAL,
+    instrucciones INTEGER,
+    correcto INTEGER,
+    extrapolado INTEGER NOT NULL DEFAULT 0,
+    tiempo_agotado INTEGER NOT NULL DEFAULT 0,
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS mediciones_por_corrida ON mediciones (corrida, tamanio);
+"""
+
+
+def informacion_maquina() -> Dict[str, object]:
+    """Datos del equipo y del intérprete con que se midió."""
+    return {
+        'equipo': platform.node(),
+        'sistema': platform.platform(),
+        'procesador': platform.processor() or platform.machine(),
+        'cpus': os.cpu_count(),
+        'python': f"{platform.python_implementation()} {platform.python_version()}",
+    }
+
+def revision_git() -> Optional[str]:
+    """Revisión del código ('-dirty' si hay cambios sin confirmar), o None fuera de un repositorio git."""
+    try:
+        resultado = subprocess.run(['git', 'describe', '--always', '--dirty'], capture_output=True, text=True,
+                                   timeout=5, cwd=os.path.dirname(os.path.abspath(__file__)))
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if resultado.returncode != 0:
+        return None
+    return resultado.stdout.strip() or None
+
+def opciones_ejecutor(opciones: Dict[str, object]) -> Dict[str, object]:
+    """
+    Argumentos de EjecutorSerie a partir de las opciones guardadas de una corrida
+    (ver EjecutorSerie.opciones_corrida): reconstruye el cronómetro, el
+    planificador y la caché.
+    """
+    argumentos = dict(opciones)
+    argumentos['cronometro'] = Cronometro(**opciones['cronometro'])
+    planificador = opciones.get('planificador')
+    argumentos['planificador'] = (PlanificadorComplejidad(planificador['presupuesto'], planificador['politica'])
+                                  if planificador else None)
+    cache = opciones.get('cache')
+    argumentos['cache'] = CacheDatos(cache['directorio'], cache['tamano_maximo']) if cache else None
+    return argumentos
+
+def aplicar_mediciones(mediciones: Iterable[dict], algoritmos: Dict[str, object],
+                       id_corrida: Optional[str] = None) -> int:
+    """
+    Incorpora mediciones guardadas a los AlgoritmoOrdenamiento, igual que si se
+    acabaran de medir. Las de algoritmos que no están en el diccionario se
+    ignoran. Con id_corrida, cada celda (tamaño, repetición) de esa corrida se
+    incorpora una sola vez por algoritmo (ver AlgoritmoOrdenamiento.celdas_de_corridas):
+    volver a cargar una corrida, o reanudarla después de medir parte de ella en
+    la misma sesión, no duplica mediciones. Devuelve cuántas se incorporaron.
+    """
+    incorporadas = 0
+    for medicion in mediciones:
+        alg = algoritmos.get(medicion['algoritmo'])
+        if alg is None:
+            continue
+        n = medicion['tamanio']
+        if id_corrida is not None:
+            celda = (id_corrida, n, medicion.get('repeticion'))
+            if celda in alg.celdas_de_corridas:
+                continue
+            alg.celdas_de_corridas.add(celda)
+        if medicion.get('tiempo_agotado'):
+            alg.agregar_tiempo_agotado(n)
+        elif medicion.get('extrapolado'):
+            alg.agregar_extrapolacion(n, medicion['tiempo'], medicion['instrucciones'])
+        else:
+            alg.agregar_metricas(n, medicion['tiempo'], medicion['instrucciones'])
+            extra = {clave: valor for clave, valor in medicion.items() if clave not in CAMPOS_MEDICION
+                     and clave != 'caso' and isinstance(valor, (int, float)) and not isinstance(valor, bool)}
+            if extra:
+                alg.agregar_metricas_extra(n, extra)
+        incorporadas += 1
+    return incorporadas
+
+def celdas_completadas(mediciones: Iterable[dict]) -> Set[Tuple[str, int, Optional[int]]]:
+    """
+    (algoritmo, tamaño, repetición) de las celdas ya registradas; las
+    extrapoladas cubren todas las repeticiones y llevan repetición None.
+    """
+    return {(m['algoritmo'], m['tamanio'], None if m.get('extrapolado') else m['repeticion']) for m in mediciones}
+
+
+class CorridaRegistrada:
+    """
+    Escritor de las mediciones de una corrida. Llamarlo con una medición (el
+    diccionario de al_medir) la encola; las encoladas se insertan juntas al
+    llegar a TAMANO_LOTE, al cerrar la corrida y, desde un hilo aparte, cada
+    INTERVALO_LOTE segundos: así también se guardan durante una celda larga o
+    mientras no se mide nada.
+    """
+    def __init__(self, base: 'BaseResultados', id_corrida: str):
+        self.base = base
+        self.id = id_corrida
+        self._conexion = base._conectar()
+        self._pendientes = []
+        self._lock = threading.Lock()
+        self._cerrada = threading.Event()
+        self._hilo_volcado = threading.Thread(target=self._volcar_periodicamente, daemon=True,
+                                              name=f"volcado-{id_corrida[:12]}")
+        self._hilo_volcado.start()
+
+    def __call__(self, medicion: dict):
+        extra = {clave: valor for clave, valor in medicion.items() if clave not in CAMPOS_MEDICION and clave != 'caso'}
+        fila = (self.id, medicion['algoritmo'], medicion['tamanio'], medicion.get('repeticion'),
+                medicion.get('semilla'), medicion.get('tiempo'), medicion.get('instrucciones'),
+                None if medicion.get('correcto') is None else int(medicion['correcto']),
+                int(bool(medicion.get('extrapolado'))), int(bool(medicion.get('tiempo_agotado'))),
+                json.dumps(extra) if extra else None)
+        with self._lock:
+            self._pendientes.append(fila)
+            if len(self._pendientes) >= TAMANO_LOTE:
+                self._volcar()
+
+    def volcar(self):
+        """Inserta ya las mediciones encoladas."""
+        with self._lock:
+            self._volcar()
+
+    def _volcar_periodicamente(self):
+        while not self._cerrada.wait(INTERVALO_LOTE):
+            self.volcar()
+
+    def _volcar(self):
+        if not self._pendientes:
+            return
+        with self._conexion:  # Una transacción por lote
+            self._conexion.executemany("INSERT INTO mediciones VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                                       self._pendientes)
+        self._pendientes = []
+
+    def cerrar(self, estado: str):
+        """Inserta lo pendiente, marca el estado final de la corrida y cierra la conexión."""
+        if estado not in ESTADOS_CORRIDA:
+            raise ValueError(f"Estado de corrida desconocido: '{estado}'")
+        self._cerrada.set()
+        self._hilo_volcado.join()
+        with self._lock:
+            self._volcar()
+            with self._conexion:
+                self._conexion.execute("UPDATE corridas SET estado = ?, fin = ? WHERE id = ?",
+                                       (estado, time.time(), self.id))
+            self._conexion.close()
+
+    def __repr__(self) -> str:
+        return f"CorridaRegistrada({self.id!r}, base={self.base.ruta!r})"
+
+
+class BaseResultados:
+    """
+    Archivo SQLite con las corridas y sus mediciones. Cada corrida se identifica
+    por un id hexadecimal; los métodos que reciben uno aceptan también un
+    prefijo que lo distinga de los demás.
+    """
+    def __init__(self, ruta: str = ARCHIVO_BASE_POR_DEFECTO):
+        self.ruta = ruta
+        directorio = os.path.dirname(os.path.abspath(ruta))
+        os.makedirs(directorio, exist_ok=True)
+        conexion = self._conectar()
+        try:
+            conexion.executescript(_ESQUEMA)
+        finally:
+            conexion.close()
+
+    def _conectar(self) -> sqlite3.Connection:
+        # check_same_thread=False: la interfaz crea la corrida en su hilo y la serie escribe desde el de trabajo
+        conexion = sqlite3.connect(self.ruta, timeout=30, check_same_thread=False)
+        conexion.row_factory = sqlite3.Row
+        conexion.execute("PRAGMA journal_mode=WAL")
+        conexion.execute("PRAGMA synchronous=NORMAL")  # Con WAL sigue siendo consistente ante una caída
+        return conexion
+
+    def _consultar(self, sql: str, parametros: Tuple = ()) -> List[sqlite3.Row]:
+        conexion = self._conectar()
+        try:
+            return conexion.execute(sql, parametros).fetchall()
+        finally:
+            conexion.close()
+
+    def iniciar_corrida(self, caso: str, semilla: int, tamanos: List[int], repeticiones: int,
+                        algoritmos: List[str], opciones: Dict[str, object]) -> CorridaRegistrada:
+        """Registra una corrida nueva 'en_curso' y devuelve su escritor."""
+        id_corrida = uuid.uuid4().hex
+        conexion = self._conectar()
+        try:
+            with conexion:
+                conexion.execute("INSERT INTO corridas VALUES (?, ?, NULL, 'en_curso', ?, ?, ?, ?, ?, ?, ?, ?)",
+                                 (id_corrida, time.time(), caso, semilla, json.dumps(sorted(tamanos)),
+                                  repeticiones, json.dumps(algoritmos), json.dumps(opciones),
+                                  json.dumps(informacion_maquina()), revision_git()))
+        finally:
+            conexion.close()
+        return CorridaRegistrada(self, id_corrida)
+
+    def reanudar_corrida(self, id_corrida: str) -> CorridaRegistrada:
+        """Vuelve a marcar 'en_curso' una corrida existente y devuelve su escritor."""
+        id_corrida = self.resolver_id(id_corrida)
+        conexion = self._conectar()
+        try:
+            with conexion:
+                conexion.execute("UPDATE corridas SET estado = 'en_curso', fin = NULL WHERE id = ?", (id_corrida,))
+        finally:
+            conexion.close()
+        return CorridaRegistrada(self, id_corrida)
+
+    def resolver_id(self, prefijo: str) -> str:
+        """Id completo de la corrida que empieza con prefijo; ValueError si no hay una sola."""
+        filas = self._consultar("SELECT id FROM corridas WHERE id LIKE ? || '%'", (prefijo.strip().lower(),))
+        if not filas:
+            raise ValueError(f"No hay ninguna corrida '{prefijo}' en {self.ruta}.")
+        if len(filas) > 1:
+            raise ValueError(f"El id '{prefijo}' es ambiguo: corresponde a {len(filas)} corridas.")
+        return filas[0]['id']
+
+    def corridas(self) -> List[Dict[str, object]]:
+        """Resumen de las corridas guardadas, de la más reciente a la más antigua."""
+        filas = self._consultar(
+            "SELECT c.*, (SELECT COUNT(*) FROM mediciones m WHERE m.corrida = c.id) AS mediciones "
+            "FROM corridas c ORDER BY c.inicio DESC")
+        return [self._como_corrida(fila) for fila in filas]
+
+    def corrida(self, id_corrida: str) -> Dict[str, object]:
+        """Datos completos de una corrida: caso, semilla, tamaños, repeticiones, algoritmos, opciones, etc."""
+        id_corrida = self.resolver_id(id_corrida)
+        fila = self._consultar(
+            "SELECT c.*, (SELECT COUNT(*) FROM mediciones m WHERE m.corrida = c.id) AS mediciones "
+            "FROM corridas c WHERE c.id = ?", (id_corrida,))[0]
+        return self._como_corrida(fila)
+
+    def mediciones(self, id_corrida: str) -> List[dict]:
+        """Mediciones de la corrida, en el orden en que se registraron y con la forma de al_medir."""
+        corrida = self.corrida(id_corrida)
+        filas = self._consultar("SELECT * FROM mediciones WHERE corrida = ? ORDER BY rowid", (corrida['id'],))
+        mediciones = []
+        for fila in filas:
+            medicion = {campo: fila[campo] for campo in CAMPOS_MEDICION}
+            medicion['caso'] = corrida['caso']
+            medicion['correcto'] = None if fila['correcto'] is None else bool(fila['correcto'])
+            medicion['extrapolado'] = bool(fila['extrapolado'])
+            medicion['tiempo_agotado'] = bool(fila['tiempo_agotado'])
+            if fila['extra']:
+                medicion.update(json.loads(fila['extra']))
+            mediciones.append(medicion)
+        return mediciones
+
+    @staticmethod
+    def _como_corrida(fila: sqlite3.Row) -> Dict[str, object]:
+        corrida = dict(fila)
+        for campo in ('tamanos', 'algoritmos', 'opciones', 'maquina'):
+            corrida[campo] = json.loads(corrida[campo])
+        return corrida
+
+    def __repr__(self) -> str:
+        return f"BaseResultados({self.ruta!r})"
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+Caché en disco de los arrays de entrada.
+
+Cada entrada se identifica por (n, caso, semilla) y se guarda como un archivo
+binario de enteros de 32 bits. Al leerla se mapea con mmap y se expone como
+memoryview, sin copiar los datos. Cuando el total de la caché supera el límite
+se eliminan los archivos usados hace más tiempo (LRU por fecha de acceso).
+"""
+
+import mmap
+import os
+from array import array
+from typing import List
+
+from ordenamiento import generar_array_segun_caso, numpy_disponible
+
+DIRECTORIO_POR_DEFECTO = os.path.join(os.path.expanduser('~'), '.cache', 'laboratorio_ordenamiento')
+TAMANO_MAXIMO_POR_DEFECTO = 2 * 1024 ** 3  # 2 GiB
+EXTENSION = '.i32'
+
+
+class CacheDatos:
+    """
+    Caché de datasets reproducibles en disco.
+
+    El nombre de cada archivo incluye el motor de generación ('np' o 'py'), ya que
+    NumPy y el generador de Python producen secuencias distintas para una misma semilla.
+    """
+    def __init__(self, directorio: str = DIRECTORIO_POR_DEFECTO, tamano_maximo: int = TAMANO_MAXIMO_POR_DEFECTO):
+        self.directorio = directorio
+        self.tamano_maximo = tamano_maximo
+        self.aciertos = 0
+        self.fallos = 0
+        os.makedirs(directorio, exist_ok=True)
+
+    def ruta(self, n: int, caso: str, semilla: int) -> str:
+        motor = 'np' if numpy_disponible() else 'py'
+        return os.path.join(self.directorio, f"{caso}_n{n}_s{semilla}_{motor}{EXTENSION}")
+
+    def obtener(self, n: int, caso: str, semilla: int) -> memoryview:
+        """Devuelve la entrada como memoryview de enteros ('i'), generándola si no está en caché."""
+        ruta = self.ruta(n, caso, semilla)
+        if os.path.exists(ruta):
+            self.aciertos += 1
+            os.utime(ruta)  # Marca de uso para la expulsión LRU
+        else:
+            self.fallos += 1
+            self._guardar(ruta, generar_array_segun_caso(n, caso, semilla, formato='array'))
+            self._podar(conservar=ruta)
+        return self._mapear(ruta)
+
+    def obtener_lista(self, n: int, caso: str, semilla: int) -> List[int]:
+        return self.obtener(n, caso, semilla).tolist()
+
+    def obtener_array(self, n: int, caso: str, semilla: int) -> array:
+        datos = array('i')
+        datos.frombytes(self.obtener(n, caso, semilla).cast('B'))  # Una única copia en bloque
+        return datos
+
+    def tamano_total(self) -> int:
+        return sum(tamano for _, tamano, _ in self._archivos())
+
+    def limpiar(self):
+        for ruta, _, _ in self._archivos():
+            try:
+                os.remove(ruta)
+            except OSError:
+                pass
+
+    def _mapear(self, ruta: str) -> memoryview:
+        with open(ruta, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return memoryview(array('i'))
+            # El mapeo sigue vivo mientras exista el memoryview, aunque se cierre el archivo
+            mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return memoryview(mapa).cast('i')
+
+    def _guardar(self, ruta: str, datos: array):
+        # Escritura atómica: un proceso concurrente nunca ve un archivo a medio escribir
+        temporal = f"{ruta}.{os.getpid()}.tmp"
+        with open(temporal, 'wb') as f:
+            datos.tofile(f)
+        os.replace(temporal, ruta)
+
+    def _archivos(self):
+        """(ruta, tamaño, última modificación) de cada archivo de la caché."""
+        archivos = []
+        for entrada in os.scandir(self.directorio):
+            if entrada.is_file() and entrada.name.endswith(EXTENSION):
+                info = entrada.stat()
+                archivos.append((entrada.path, info.st_size, info.st_mtime))
+        return archivos
+
+    def _podar(self, conservar: str = None):
+        archivos = sorted(self._archivos(), key=lambda a: a[2])
+        total = sum(tamano for _, tamano, _ in archivos)
+        for ruta, tamano, _ in archivos:
+            if total <= self.tamano_maximo:
+                break
+            if ruta == conservar:
+                continue
+            try:
+                os.remove(ruta)
+                total -= tamano
+            except OSError:
+                pass  # En uso (p. ej. mapeado en Windows): se intentará en la próxima poda
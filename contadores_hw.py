@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""
+Contadores de rendimiento del hardware (Linux, perf_event_open).
+
+Complementan la métrica "instrucciones", que cuenta operaciones a mano dentro de
+cada algoritmo, con lo que realmente ejecuta la CPU: ciclos, instrucciones de
+máquina, fallos de caché y fallos de predicción de saltos. Se leen con la
+llamada al sistema perf_event_open a través de ctypes, sin dependencias extra.
+
+Es opcional: en otras plataformas, sin permisos (kernel.perf_event_paranoid) o
+en máquinas virtuales sin PMU, ContadoresHardware.disponible es False y error
+explica el motivo; el resto del laboratorio funciona igual.
+"""
+
+import ctypes
+import os
+import platform
+import struct
+import sys
+import threading
+from typing import Dict, Optional, Tuple
+
+# perf_event_attr.type
+PERF_TYPE_HARDWARE = 0
+PERF_TYPE_SOFTWARE = 1
+
+# Eventos a medir: nombre de la métrica -> (type, config)
+EVENTOS_HW = {
+    'ciclos': (PERF_TYPE_HARDWARE, 0),             # PERF_COUNT_HW_CPU_CYCLES
+    'instrucciones_cpu': (PERF_TYPE_HARDWARE, 1),  # PERF_COUNT_HW_INSTRUCTIONS
+    'fallos_cache': (PERF_TYPE_HARDWARE, 3),       # PERF_COUNT_HW_CACHE_MISSES
+    'fallos_prediccion': (PERF_TYPE_HARDWARE, 5),  # PERF_COUNT_HW_BRANCH_MISSES
+}
+
+ETIQUETAS_HW = {
+    'ciclos': "Ciclos de CPU",
+    'instrucciones_cpu': "Instrucciones de CPU",
+    'fallos_cache': "Fallos de Caché",
+    'fallos_prediccion': "Fallos de Predicción de Saltos",
+}
+
+_SYSCALL_PERF_EVENT_OPEN = {'x86_64': 298, 'amd64': 298, 'aarch64': 241, 'arm64': 241,
+                            'i386': 336, 'i686': 336, 'armv7l': 364, 'ppc64le': 319, 's390x': 331}
+
+# ioctl sobre el líder del grupo; con PERF_IOC_FLAG_GROUP afecta a todos los eventos
+PERF_EVENT_IOC_ENABLE = 0x2400
+PERF_EVENT_IOC_DISABLE = 0x2401
+PERF_EVENT_IOC_RESET = 0x2403
+PERF_IOC_FLAG_GROUP = 1
+PERF_FORMAT_GROUP = 1 << 3
+
+# Bits de perf_event_attr.flags
+_DISABLED = 1 << 0
+_EXCLUDE_KERNEL = 1 << 5  # Solo espacio de usuario: lo permite perf_event_paranoid <= 2
+_EXCLUDE_HV = 1 << 6
+
+
+class _PerfEventAttr(ctypes.Structure):
+    """struct perf_event_attr hasta PERF_ATTR_SIZE_VER5 (112 bytes)."""
+    _fields_ = [
+        ('type', ctypes.c_uint32), ('size', ctypes.c_uint32), ('config', ctypes.c_uint64),
+        ('sample_period', ctypes.c_uint64), ('sample_type', ctypes.c_uint64),
+        ('read_format', ctypes.c_uint64), ('flags', ctypes.c_uint64),
+        ('wakeup_events', ctypes.c_uint32), ('bp_type', ctypes.c_uint32),
+        ('config1', ctypes.c_uint64), ('config2', ctypes.c_uint64),
+        ('branch_sample_type', ctypes.c_uint64), ('sample_regs_user', ctypes.c_uint64),
+        ('sample_stack_user', ctypes.c_uint32), ('clockid', ctypes.c_int32),
+        ('sample_regs_intr', ctypes.c_uint64), ('aux_watermark', ctypes.c_uint32),
+        ('sample_max_stack', ctypes.c_uint16), ('reserved_2', ctypes.c_uint16),
+    ]
+
+
+class ContadoresHardware:
+    """
+    Grupo de contadores perf del hilo que lo crea.
+
+    Los eventos se abren como un único grupo, de modo que el kernel los programa
+    juntos y las lecturas corresponden al mismo intervalo. Los eventos que la
+    máquina no soporta se descartan (error los enumera); si no queda ninguno,
+    disponible es False.
+    """
+    def __init__(self, eventos: Optional[Dict[str, Tuple[int, int]]] = None):
+        self.eventos = []  # Nombres de los eventos efectivamente abiertos, en orden de lectura
+        self.error = None
+        self._fds = []
+        eventos = EVENTOS_HW if eventos is None else eventos
+        try:
+            self._abrir(eventos)
+        except OSError as e:
+            self.cerrar()
+            self.error = str(e)
+
+    @property
+    def disponible(self) -> bool:
+        return bool(self._fds)
+
+    def _abrir(self, eventos: Dict[str, Tuple[int, int]]):
+        if not sys.platform.startswith('linux'):
+            raise OSError("perf_event_open solo existe en Linux")
+        numero = _SYSCALL_PERF_EVENT_OPEN.get(platform.machine().lower())
+        if numero is None:
+            raise OSError(f"arquitectura no soportada: {platform.machine()}")
+        libc = ctypes.CDLL(None, use_errno=True)
+        libc.syscall.restype = ctypes.c_long
+
+        errores = []
+        for nombre, (tipo, config) in eventos.items():
+            attr = _PerfEventAttr(type=tipo, size=ctypes.sizeof(_PerfEventAttr), config=config,
+                                  read_format=PERF_FORMAT_GROUP, flags=_EXCLUDE_KERNEL | _EXCLUDE_HV)
+            lider = self._fds[0] if self._fds else -1
+            if lider == -1:
+                attr.flags |= _DISABLED  # El grupo arranca detenido; se habilita en iniciar()
+            fd = libc.syscall(numero, ctypes.byref(attr), 0, -1, lider, 0)
+            if fd < 0:
+                errores.append(f"{nombre}: {os.strerror(ctypes.get_errno())}")
+                continue
+            self._fds.append(fd)
+            self.eventos.append(nombre)
+        if not self._fds:
+            raise OSError("; ".join(errores) or "sin eventos")
+        self.error = "; ".join(errores) or None  # Eventos descartados, si los hubo
+        self._libc = libc
+
+    def iniciar(self):
+        lider = self._fds[0]
+        self._libc.ioctl(lider, PERF_EVENT_IOC_RESET, PERF_IOC_FLAG_GROUP)
+        self._libc.ioctl(lider, PERF_EVENT_IOC_ENABLE, PERF_IOC_FLAG_GROUP)
+
+    def detener(self) -> Dict[str, int]:
+        """Detiene el grupo y devuelve {evento: cuenta} desde el último iniciar()."""
+        lider = self._fds[0]
+        self._libc.ioctl(lider, PERF_EVENT_IOC_DISABLE, PERF_IOC_FLAG_GROUP)
+        # Formato PERF_FORMAT_GROUP: u64 cantidad de eventos, seguido de un u64 por evento
+        datos = os.read(lider, 8 * (1 + len(self._fds)))
+        cantidad = struct.unpack_from('Q', datos)[0]
+        valores = struct.unpack_from(f'{cantidad}Q', datos, 8)
+        return dict(zip(self.eventos, valores))
+
+    def cerrar(self):
+        for fd in self._fds:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._fds = []
+
+    def __del__(self):
+        self.cerrar()
+
+
+_por_hilo = threading.local()
+
+def contadores_del_hilo() -> ContadoresHardware:
+    """Contadores del hilo actual (perf mide por hilo), abiertos una sola vez y reutilizados."""
+    contadores = getattr(_por_hilo, 'contadores', None)
+    if contadores is None:
+        contadores = _por_hilo.contadores = ContadoresHardware()
+    return contadores
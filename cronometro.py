@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+Cronómetro de las ejecuciones: calentamiento, recolector de basura y bucles.
+
+Un único par de perf_counter() alrededor de cada llamada, con el recolector de
+basura activo y sin calentamiento, da tiempos ruidosos para los tamaños chicos:
+una recolección o el primer acceso a memoria fría pesan tanto como el propio
+ordenamiento. Cronometro.medir() mide con perf_counter_ns (tiempo de pared) y
+process_time_ns (tiempo de CPU), con el recolector desactivado durante la
+región cronometrada, y repite en un bucle las ejecuciones más cortas que
+tiempo_minimo para promediarlas.
+"""
+
+import gc
+import math
+import time
+from contextlib import nullcontext
+from typing import Callable, ContextManager, Dict, Optional, Tuple
+
+from contadores_hw import ContadoresHardware
+
+CALENTAMIENTO_POR_DEFECTO = 1  # Ejecuciones descartadas antes del bloque cronometrado
+TIEMPO_MINIMO_POR_DEFECTO = 0.01  # Segundos: las ejecuciones más cortas se repiten en un bucle
+MAX_BUCLES = 1_000_000
+
+ETIQUETAS_CRONOMETRO = {
+    'tiempo_cpu': "Tiempo de CPU (s)",
+}
+
+
+class Cronometro:
+    """
+    Mide una llamada sin argumentos.
+
+    La primera ejecución sirve de calibración. Si tarda al menos tiempo_minimo
+    es la medición (repetir una ejecución larga no mejora la precisión y
+    duplicaría el costo de la serie). Si es más corta, se hacen calentamiento
+    ejecuciones más sin cronometrar y luego un bloque de bucles ejecuciones
+    seguidas, con bucles elegido para que el bloque dure unos tiempo_minimo; el
+    tiempo informado es el del bloque dividido por bucles.
+
+    Cronometro(calentamiento=0, tiempo_minimo=0, desactivar_gc=False) equivale a
+    un par de perf_counter() alrededor de una sola ejecución.
+
+    Con limitar, cada tramo de ejecuciones corre dentro de limitar(ejecuciones),
+    un contexto que lo interrumpe si excede el límite de esa cantidad de
+    ejecuciones: la calibración y cada calentamiento por separado, y el bloque
+    cronometrado con bucles ejecuciones. Así el límite se aplica a una ejecución
+    y no a todo lo que hace el cronómetro.
+    """
+    def __init__(self, calentamiento: int = CALENTAMIENTO_POR_DEFECTO,
+                 tiempo_minimo: float = TIEMPO_MINIMO_POR_DEFECTO, desactivar_gc: bool = True):
+        if calentamiento < 0:
+            raise ValueError("El número de ejecuciones de calentamiento no puede ser negativo.")
+        if tiempo_minimo < 0:
+            raise ValueError("El tiempo mínimo cronometrado no puede ser negativo.")
+        self.calentamiento = calentamiento
+        self.tiempo_minimo = tiempo_minimo
+        self.desactivar_gc = desactivar_gc
+
+    def medir(self, llamada: Callable[[], object], contadores: Optional[ContadoresHardware] = None,
+              limitar: Optional[Callable[[int], ContextManager]] = None
+              ) -> Tuple[float, float, int, object, Dict[str, float]]:
+        """
+        Devuelve (tiempo de pared, tiempo de CPU, bucles, resultado de la última
+        llamada, lecturas de contadores), con los tiempos y las lecturas por ejecución.
+        """
+        limitar = limitar or (lambda ejecuciones: nullcontext())
+        gc_activo = gc.isenabled()
+        if self.desactivar_gc:
+            gc.collect()  # Que la basura de la celda anterior no se recolecte dentro de esta
+            gc.disable()
+        try:
+            with limitar(1):
+                pared, cpu, resultado, lecturas = self._bloque(llamada, 1, contadores)
+            if pared >= self.tiempo_minimo * 1e9:
+                return pared / 1e9, cpu / 1e9, 1, resultado, lecturas
+            for _ in range(self.calentamiento):
+                with limitar(1):
+                    llamada()
+            bucles = min(MAX_BUCLES, math.ceil(self.tiempo_minimo * 1e9 / max(pared, 1)))
+            with limitar(bucles):
+                pared, cpu, resultado, lecturas = self._bloque(llamada, bucles, contadores)
+            return (pared / bucles / 1e9, cpu / bucles / 1e9, bucles, resultado,
+                    {nombre: valor / bucles for nombre, valor in lecturas.items()})
+        finally:
+            if self.desactivar_gc and gc_activo:
+                gc.enable()
+
+    @staticmethod
+    def _bloque(llamada: Callable[[], object], bucles: int, contadores: Optional[ContadoresHardware]):
+        """Ejecuta la llamada bucles veces seguidas; tiempos en nanosegundos."""
+        if contadores is not None:
+            contadores.iniciar()
+        cpu_inicio = time.process_time_ns()
+        inicio = time.perf_counter_ns()
+        for _ in range(bucles):
+            resultado = llamada()
+        pared = time.perf_counter_ns() - inicio
+        cpu = time.process_time_ns() - cpu_inicio
+        lecturas = contadores.detener() if contadores is not None else {}
+        return pared, cpu, resultado, lecturas
+
+    def __repr__(self) -> str:
+        return (f"Cronometro(calentamiento={self.calentamiento}, tiempo_minimo={self.tiempo_minimo:g}, "
+                f"desactivar_gc={self.desactivar_gc})")
@@ -0,0 +1,799 @@
+# -*- coding: utf-8 -*-
+"""
+Motor de ejecución de series de experiencias.
+
+Recorre cada combinación (tamaño, repetición, algoritmo), mide tiempo e
+instrucciones y acumula los resultados en los objetos AlgoritmoOrdenamiento.
+No importa Tkinter: la interfaz gráfica y la línea de comandos le pasan
+funciones de retorno (callbacks) para el log, el progreso y cada medición.
+"""
+
+import os
+import time
+import queue
+import random
+import signal
+import threading
+import statistics
+import multiprocessing
+from array import array
+from contextlib import contextmanager
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Tuple
+
+from progreso import EstimadorProgreso, formatear_duracion
+from contadores_hw import ContadoresHardware, contadores_del_hilo
+from cronometro import Cronometro
+from memoria import AISLAMIENTO_POR_EJECUCION, medir_memoria, rss_actual
+from base_resultados import aplicar_mediciones, celdas_completadas
+from ordenamiento import (
+    AlgoritmoOrdenamiento, ContadorOperaciones, FUNCIONES_RAPIDAS, LINEAS_BASE_NUMPY, MODOS_ENTRADA, MODOS_MEDICION,
+    MODOS_VERIFICACION, admite_operaciones, generar_array_segun_caso, huella_secuencia, numpy_disponible,
+    preparar_verificacion, verificar_con_referencia
+)
+
+
+def medir_celda(func: Callable, array_original: List[int], func_rapida: Optional[Callable] = None,
+                contadores: Optional[ContadoresHardware] = None,
+                cronometro: Optional[Cronometro] = None,
+                limite: Optional[float] = None) -> Tuple[float, int, List[int], Dict[str, float]]:
+    """
+    Ejecuta un algoritmo sobre la entrada y devuelve (tiempo, instrucciones,
+    arr_ordenado, métricas adicionales).
+
+    El tiempo lo mide cronometro (por defecto Cronometro()): con calentamiento,
+    sin recolector de basura y en un bucle si la ejecución es muy corta.
+    Si se indica func_rapida (gemelo sin contadores), el tiempo se mide sobre ella
+    y las instrucciones se obtienen de una ejecución aparte, no cronometrada, de func.
+    Las métricas adicionales son el tiempo de CPU, el desglose de operaciones de
+    func (ver ContadorOperaciones, si func lo admite) y, con contadores
+    (ContadoresHardware disponibles), las lecturas de hardware de la ejecución
+    cronometrada.
+
+    Con limite (segundos, donde LIMITE_SOPORTADO) cada ejecución cronometrada se
+    interrumpe con TiempoAgotado si lo supera (ver Cronometro.medir); la
+    ejecución instrumentada aparte del modo separado queda fuera del límite.
+    """
+    cronometro = cronometro or Cronometro()
+    limitar = None
+    if limite and LIMITE_SOPORTADO:
+        limitar = lambda ejecuciones: _con_limite(limite * ejecuciones)
+    instrumentar = admite_operaciones(func)
+    operaciones = None
+
+    def ejecutar_instrumentado():
+        # Un contador nuevo por llamada: el que queda es el de la última ejecución
+        nonlocal operaciones
+        if not instrumentar:
+            return func(array_original)
+        operaciones = ContadorOperaciones()
+        return func(array_original, operaciones=operaciones)
+
+    if func_rapida is None:
+        tiempo_total, tiempo_cpu, _, (arr_ordenado, instrucciones), extra = cronometro.medir(
+            ejecutar_instrumentado, contadores, limitar)
+    else:
+        tiempo_total, tiempo_cpu, _, arr_ordenado, extra = cronometro.medir(
+            lambda: func_rapida(array_original), contadores, limitar)
+        _, instrucciones = ejecutar_instrumentado()
+    extra['tiempo_cpu'] = tiempo_cpu
+    if operaciones is not None:
+        extra.update(operaciones.como_dict())
+    return tiempo_total, instrucciones, arr_ordenado, extra
+
+def verificar_celda(array_original: List[int], arr_ordenado: List[int], modo: str, referencia) -> Tuple[bool, float]:
+    """Verifica el resultado de una celda y devuelve (correcto, tiempo de verificación)."""
+    tiempo_inicio = time.perf_counter()
+    correcto = verificar_con_referencia(array_original, arr_ordenado, modo, referencia)
+    return correcto, time.perf_counter() - tiempo_inicio
+
+class TiempoAgotado(Exception):
+    """Una ejecución superó el límite de tiempo por celda."""
+
+
+class SerieCancelada(Exception):
+    """La serie se canceló antes de terminar."""
+
+
+# Sin SIGALRM (Windows) el límite no puede interrumpir la ejecución desde el propio proceso
+LIMITE_SOPORTADO = hasattr(signal, 'setitimer')
+
+def _alarma(signum, frame):
+    raise TiempoAgotado()
+
+@contextmanager
+def _con_limite(segundos: float):
+    """Interrumpe el bloque con TiempoAgotado si tarda más de segundos (requiere LIMITE_SOPORTADO)."""
+    signal.signal(signal.SIGALRM, _alarma)
+    signal.setitimer(signal.ITIMER_REAL, segundos)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+
+def _contadores_hw() -> Optional[ContadoresHardware]:
+    """Contadores de hardware del hilo actual, o None si la plataforma no los ofrece."""
+    contadores = contadores_del_hilo()
+    return contadores if contadores.disponible else None
+
+def _medir_celda_remota(func: Callable, datos: array, func_rapida: Optional[Callable] = None,
+                        modo_verificacion: Optional[str] = None, referencia=None,
+                        limite: Optional[float] = None, contadores_hw: bool = False,
+                        cronometro: Optional[Cronometro] = None,
+                        func_memoria: Optional[Callable] = None,
+                        entrada: str = 'lista') -> Tuple[float, int, Optional[bool], float, Dict[str, float]]:
+    """
+    Versión para los procesos del pool: la entrada viaja como array('i') y solo
+    vuelven los números. Devuelve (tiempo, instrucciones, correcto, tiempo de
+    verificación, métricas adicionales); correcto es None si la celda no se verifica.
+    En el modo 'referencia' la referencia llega resumida (huella_secuencia de la
+    entrada ordenada), no como una copia ordenada de la entrada.
+    Con entrada='lista' los algoritmos reciben la entrada convertida a lista; con
+    'array', el mismo array('i').
+
+    Con limite (segundos) una alarma interrumpe una ejecución que lo supere y la
+    celda termina con TiempoAgotado (ver medir_celda); la verificación queda
+    fuera del límite.
+
+    Con func_memoria, antes de medir se ejecuta una vez con la sonda de
+    memoria (ver memoria.medir_memoria) y sus métricas se agregan a las
+    adicionales; si esa ejecución supera el límite, la celda queda sin ellas.
+    """
+    array_original = datos.tolist() if entrada == 'lista' else datos
+    memoria = {}
+    if func_memoria is not None:
+        # Antes de cronometrar: así el pico de RSS no incluye el resultado de la ejecución medida
+        memoria = _sondear_memoria(func_memoria, array_original, rss_actual(), limite)
+    contadores = _contadores_hw() if contadores_hw else None
+    tiempo_total, instrucciones, arr_ordenado, extra = medir_celda(func, array_original, func_rapida, contadores,
+                                                                   cronometro, limite)
+    extra.update(memoria)
+    if modo_verificacion is None:
+        return tiempo_total, instrucciones, None, 0.0, extra
+    correcto, tiempo_verificacion = verificar_celda(array_original, arr_ordenado, modo_verificacion, referencia)
+    return tiempo_total, instrucciones, correcto, tiempo_verificacion, extra
+
+def _sondear_memoria(func: Callable, array_original: List[int], rss_base: Optional[int],
+                     limite: Optional[float]) -> Dict[str, int]:
+    if not (limite and LIMITE_SOPORTADO):
+        return medir_memoria(lambda: func(array_original), rss_base)
+    try:
+        with _con_limite(limite):
+            return medir_memoria(lambda: func(array_original), rss_base)
+    except TiempoAgotado:
+        return {}
+
+_SIN_PREPARAR = object()  # Marca de referencia de verificación aún no calculada
+
+def _inicializar_trabajador(pids, cpus_libres, precargar_numpy=False):
+    """
+    Informa el PID del proceso trabajador (ver _terminar_pool) y lo fija a una
+    CPU propia para reducir el ruido en las mediciones.
+    """
+    pids.put(os.getpid())
+    # Ctrl+C lo atiende el proceso principal, que termina a los trabajadores
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    if precargar_numpy:
+        numpy_disponible()  # Que importar NumPy no caiga dentro de la primera ejecución cronometrada
+    if cpus_libres is None:
+        return
+    try:
+        os.sched_setaffinity(0, {cpus_libres.get(timeout=1)})
+    except Exception:
+        pass  # Sin CPUs libres o plataforma sin afinidad: se ejecuta sin fijar
+
+INTERVALO_CANCELACION = 0.2  # Segundos entre comprobaciones de cancelación mientras se espera al pool
+CELDAS_EN_VUELO_POR_TRABAJADOR = 2  # Se envía otra repetición cuando quedan menos celdas que esto por proceso
+
+def _terminar_pool(pool: ProcessPoolExecutor, pids):
+    """
+    Descarta las celdas pendientes y termina los procesos sin esperar a las que están en curso.
+
+    pids es la cola en la que cada trabajador informa su PID al iniciarse
+    (_inicializar_trabajador). Solo se terminan los procesos hijos vivos con
+    esos PID: un PID de un trabajador ya terminado no alcanza a otro proceso.
+    """
+    propios = set()
+    while True:
+        try:
+            propios.add(pids.get_nowait())
+        except queue.Empty:
+            break
+    pool.shutdown(wait=False, cancel_futures=True)
+    # Un trabajador que aún no informó su PID no tomó ninguna celda: sale al cerrarse el pool
+    procesos = [proceso for proceso in multiprocessing.active_children() if proceso.pid in propios]
+    for proceso in procesos:
+        proceso.terminate()
+    for proceso in procesos:
+        proceso.join(timeout=1)
+
+def cpus_disponibles() -> List[int]:
+    """CPUs en las que puede ejecutarse este proceso."""
+    if hasattr(os, 'sched_getaffinity'):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+class EjecutorSerie:
+    """
+    Ejecuta una serie de experiencias sin depender de la interfaz gráfica.
+
+    - log(mensaje): recibe los mensajes de texto del log de ejecución.
+    - al_avanzar(paso_actual, total_pasos): informa el avance celda a celda.
+    - al_progresar(estado): como al_avanzar, pero con el avance ponderado por el
+      costo estimado de cada celda, el tiempo restante y el ritmo (ver
+      EstimadorProgreso.estado).
+    - al_medir(medicion): recibe un dict por cada ejecución individual.
+
+    Las funciones de retorno se llaman desde el hilo que ejecuta la serie.
+
+    Con contadores_hw (Linux, perf_event_open) cada ejecución cronometrada se mide
+    también con los contadores de hardware (ver contadores_hw.EVENTOS_HW); las
+    lecturas se guardan como métricas adicionales del algoritmo y se agregan al
+    dict de al_medir. Si la plataforma no los ofrece se informa en el log y la
+    serie sigue sin ellos.
+
+    Con trabajadores > 1 las celdas de cada tamaño se reparten entre procesos
+    (ProcessPoolExecutor) y los resultados se incorporan en el mismo orden que
+    la ejecución secuencial. Con fijar_cpu cada proceso queda fijado a una CPU.
+
+    cronometro (Cronometro, por defecto con calentamiento, recolector de basura
+    desactivado y bucles para las ejecuciones de menos de 10 ms) mide cada celda;
+    el tiempo de CPU se guarda como la métrica adicional 'tiempo_cpu'.
+
+    modo_medicion:
+    - 'instrumentado': tiempo e instrucciones salen de la misma ejecución.
+    - 'separado': el tiempo se mide sobre el gemelo sin contadores (funciones_rapidas,
+      por defecto FUNCIONES_RAPIDAS) y las instrucciones sobre la versión instrumentada.
+
+    Cada repetición usa la semilla semilla + rep, de modo que una serie puede
+    reproducirse exactamente; si no se indica semilla se sortea una y se informa
+    en el log. Con cache (CacheDatos) las entradas se leen de disco en lugar de
+    regenerarse.
+
+    verificacion elige cómo se comprueba cada resultado (ver MODOS_VERIFICACION):
+    'referencia' ordena la entrada una sola vez y compara cada salida con ella,
+    'lineal' usa una comprobación O(n) y 'completa' reordena la entrada en cada
+    verificación. Con fraccion_verificada < 1 solo se verifica esa fracción de las
+    ejecuciones. El costo de verificar se acumula aparte en tiempo_verificacion.
+
+    Con un planificador (PlanificadorComplejidad) cada algoritmo se estima antes de
+    ejecutar un tamaño; las celdas que exceden el presupuesto se omiten o se
+    extrapolan. Las extrapoladas se informan a al_medir con 'extrapolado': True.
+
+    Con entrada='array' los algoritmos reciben la entrada como array('i') (4 bytes
+    por elemento en lugar de un int de Python por elemento) y cada uno la copia
+    en bloque; así caben en memoria series de decenas de millones de elementos.
+
+    Con memoria cada celda corre en un proceso trabajador (uno nuevo por ejecución
+    en Python >= 3.11) y, antes de cronometrarla, se ejecuta una vez con la sonda
+    de memoria (ver memoria.METRICAS_MEMORIA), sobre la versión rápida si existe.
+    Las métricas se guardan como adicionales del algoritmo.
+
+    Con base (BaseResultados) cada medición se guarda en la base de resultados
+    como parte de una corrida nueva, cuyo id queda en corrida_id. Con reanudar
+    (id de una corrida de esa base) se continúa esa corrida: sus mediciones
+    guardadas se incorporan a los algoritmos, salvo las celdas que ya tengan en
+    memoria (una corrida cancelada y reanudada en la misma sesión no se duplica,
+    y los datos de otras series se conservan), y solo se ejecutan las que faltan;
+    ejecutar() debe recibir los mismos tamaños, repeticiones y caso, y el
+    ejecutor, las mismas opciones (ver BaseResultados.corrida y opciones_ejecutor).
+
+    Con limite_tiempo (segundos) cada ejecución corre en un proceso trabajador y
+    se interrumpe si lo supera: la celda queda registrada como tiempo agotado
+    ('tiempo_agotado': True en al_medir) y la serie sigue con las demás. Si un
+    algoritmo agota el límite en todas las repeticiones de un tamaño, los tamaños
+    mayores se omiten. cancelar() detiene la serie desde otro hilo; con procesos
+    (trabajadores > 1, limite_tiempo, aislar o memoria) la celda en curso se interrumpe en
+    el acto, si no la serie se detiene al terminar la celda actual.
+    """
+    def __init__(self, algoritmos: Dict[str, AlgoritmoOrdenamiento], funciones: Dict[str, Callable],
+                 log: Optional[Callable[[str], None]] = None,
+                 al_avanzar: Optional[Callable[[int, int], None]] = None,
+                 al_medir: Optional[Callable[[dict], None]] = None,
+                 al_progresar: Optional[Callable[[dict], None]] = None,
+                 trabajadores: int = 1, fijar_cpu: bool = False,
+                 modo_medicion: str = 'instrumentado',
+                 funciones_rapidas: Optional[Dict[str, Callable]] = None,
+                 semilla: Optional[int] = None, cache=None,
+                 verificacion: str = 'referencia', fraccion_verificada: float = 1.0,
+                 planificador=None, limite_tiempo: Optional[float] = None, aislar: bool = False,
+                 contadores_hw: bool = False, cronometro: Optional[Cronometro] = None, memoria: bool = False,
+                 entrada: str = 'lista', base=None, reanudar: Optional[str] = None):
+        self.algoritmos = algoritmos
+        self.funciones = funciones
+        self.log = log or (lambda mensaje: None)
+        self.al_avanzar = al_avanzar or (lambda paso, total: None)
+        self.al_medir = al_medir or (lambda medicion: None)
+        self.al_progresar = al_progresar or (lambda estado: None)
+        self.trabajadores = max(1, trabajadores)
+        self.fijar_cpu = fijar_cpu
+        if modo_medicion not in MODOS_MEDICION:
+            raise ValueError(f"Modo de medición desconocido: '{modo_medicion}'")
+        self.modo_medicion = modo_medicion
+        self.funciones_rapidas = FUNCIONES_RAPIDAS if funciones_rapidas is None else funciones_rapidas
+        self.semilla = semilla
+        self.cache = cache
+        if verificacion not in MODOS_VERIFICACION:
+            raise ValueError(f"Modo de verificación desconocido: '{verificacion}'")
+        if not 0.0 <= fraccion_verificada <= 1.0:
+            raise ValueError("La fracción verificada debe estar entre 0 y 1.")
+        self.verificacion = verificacion
+        self.fraccion_verificada = fraccion_verificada
+        self.tiempo_verificacion = 0.0
+        self.ejecuciones_verificadas = 0
+        self.planificador = planificador
+        if limite_tiempo is not None and limite_tiempo <= 0:
+            raise ValueError("El límite de tiempo por ejecución debe ser mayor a 0.")
+        self.limite_tiempo = limite_tiempo
+        self.aislar = aislar
+        self.contadores_hw = contadores_hw
+        self.cronometro = cronometro or Cronometro()
+        self.memoria = memoria
+        if entrada not in MODOS_ENTRADA:
+            raise ValueError(f"Tipo de entrada desconocido: '{entrada}'")
+        self.entrada = entrada
+        if reanudar is not None and base is None:
+            raise ValueError("Para reanudar una corrida hace falta la base de resultados.")
+        self.base = base
+        self.reanudar = reanudar
+        self.corrida_id = None
+        self._corrida = None
+        self.cancelada = False
+        self._cancelacion = threading.Event()
+
+    def cancelar(self):
+        """Pide detener la serie; puede llamarse desde cualquier hilo."""
+        self._cancelacion.set()
+
+    def opciones_corrida(self) -> Dict[str, object]:
+        """Opciones de la serie que se guardan con la corrida, para poder reanudarla con las mismas."""
+        return {
+            'trabajadores': self.trabajadores, 'fijar_cpu': self.fijar_cpu, 'modo_medicion': self.modo_medicion,
+            'verificacion': self.verificacion, 'fraccion_verificada': self.fraccion_verificada,
+            'limite_tiempo': self.limite_tiempo, 'aislar': self.aislar, 'contadores_hw': self.contadores_hw,
+            'memoria': self.memoria, 'entrada': self.entrada,
+            'cronometro': {'calentamiento': self.cronometro.calentamiento, 'tiempo_minimo': self.cronometro.tiempo_minimo,
+                           'desactivar_gc': self.cronometro.desactivar_gc},
+            'planificador': ({'presupuesto': self.planificador.presupuesto, 'politica': self.planificador.politica}
+                             if self.planificador is not None else None),
+            'cache': ({'directorio': self.cache.directorio, 'tamano_maximo': self.cache.tamano_maximo}
+                      if self.cache is not None else None),
+        }
+
+    def _limite_celda(self) -> Optional[float]:
+        """Límite efectivo por ejecución: el menor entre limite_tiempo y el que imponga el planificador."""
+        limites = [self.limite_tiempo]
+        if self.planificador is not None:
+            limites.append(self.planificador.limite_por_celda())
+        limites = [l for l in limites if l is not None]
+        return min(limites) if limites else None
+
+    def ejecutar(self, tamanos: List[int], repeticiones: int, tipo_datos: str):
+        self._total_pasos = len(tamanos) * len(self.funciones) * repeticiones
+        self._paso_actual = 0
+        corrida_previa = self.base.corrida(self.reanudar) if self.reanudar is not None else None
+        if corrida_previa is not None:
+            if (corrida_previa['caso'], corrida_previa['repeticiones'], corrida_previa['tamanos']) != \
+                    (tipo_datos, repeticiones, sorted(tamanos)):
+                raise ValueError(f"La corrida {corrida_previa['id']} tiene otros tamaños, repeticiones o caso.")
+            self.semilla = corrida_previa['semilla']
+        if self.semilla is None:
+            self.semilla = random.randrange(2 ** 31)
+        self._rng_verificacion = random.Random(self.semilla)
+        self._tiempo_medido = 0.0
+        self._ejecuciones = 0
+        self.tiempo_verificacion = 0.0
+        self.ejecuciones_verificadas = 0
+        self.cancelada = False
+        self._limite = self._limite_celda()
+        self._estimador = EstimadorProgreso(self.algoritmos, paralelismo=self.trabajadores,
+                                            limite=self._limite if LIMITE_SOPORTADO else None)
+        self._estimador.planificar((nombre, n) for n in tamanos for nombre in self.funciones for _ in range(repeticiones))
+        self._agotadas = {}  # {(nombre, n): ejecuciones con tiempo agotado en esta serie}
+        self._excluidos = {}  # {nombre: n en el que agotó el límite en todas las repeticiones}
+        self._completadas = set()
+        usar_procesos = self.trabajadores > 1 or self.aislar or self._limite is not None or self.memoria
+        self._precargar_numpy = any(nombre in LINEAS_BASE_NUMPY for nombre in self.funciones)
+        if self._precargar_numpy and not usar_procesos:
+            numpy_disponible()
+
+        self.log(f"\n{'='*70}")
+        self.log(f"🔬 NUEVA SERIE DE EXPERIENCIAS")
+        self.log(f"   Tipo de datos: {tipo_datos.upper()}")
+        self.log(f"   Repeticiones por tamaño: {repeticiones}")
+        self.log(f"   Semilla: {self.semilla}{' (datasets en caché)' if self.cache else ''}")
+        if self.modo_medicion == 'separado':
+            self.log("   Medición: tiempo con versiones sin contadores, instrucciones aparte")
+        if self.entrada == 'array':
+            self.log("   Entrada: array('i') tipado (4 bytes por elemento)")
+        self._corrida = self._abrir_corrida(corrida_previa, tamanos, repeticiones, tipo_datos)
+        if self.trabajadores > 1:
+            self.log(f"   Procesos en paralelo: {self.trabajadores}{' (fijados a CPU)' if self.fijar_cpu else ''}")
+        elif usar_procesos:
+            self.log("   Ejecución en un proceso aislado (cancelable)")
+        if self._limite is not None:
+            self.log(f"   Límite por ejecución: {self._limite:g}s")
+        self.log(f"   Cronómetro: {self.cronometro.calentamiento} calentamiento(s), bucles hasta "
+                 f"{self.cronometro.tiempo_minimo * 1000:g} ms"
+                 f"{', recolector de basura desactivado' if self.cronometro.desactivar_gc else ''}")
+        self.log(f"{'='*70}\n")
+        self._usar_hw = False
+        if self.memoria:
+            self.log("💾 Sonda de memoria: pico de tracemalloc e incremento de RSS en una ejecución aparte"
+                     + (", un proceso nuevo por ejecución" if AISLAMIENTO_POR_EJECUCION else ""))
+            if not AISLAMIENTO_POR_EJECUCION:
+                self.log("   (Python < 3.11: los procesos se reutilizan y el incremento de RSS puede subestimarse)")
+        if self.contadores_hw:
+            contadores = contadores_del_hilo()
+            if contadores.disponible:
+                self._usar_hw = True
+                self.log(f"📟 Contadores de hardware: {', '.join(contadores.eventos)}")
+                if contadores.error:
+                    self.log(f"   (no disponibles: {contadores.error})")
+            else:
+                self.log(f"⚠️ Contadores de hardware no disponibles ({contadores.error}); se mide sin ellos.")
+        if self._limite is not None and not LIMITE_SOPORTADO:
+            self.log("⚠️ Esta plataforma no permite interrumpir por tiempo; el límite no se aplica (use Cancelar).")
+
+        pool = self._crear_pool() if usar_procesos else None
+        try:
+            for n in sorted(tamanos):
+                if pool is not None:
+                    self._ejecutar_tamanio_paralelo(pool, n, repeticiones, tipo_datos)
+                else:
+                    self._ejecutar_tamanio(n, repeticiones, tipo_datos)
+        except SerieCancelada:
+            self.cancelada = True
+        except BaseException:
+            # Ctrl+C u otro error: no esperar a que terminen las celdas en curso
+            if pool is not None:
+                _terminar_pool(pool, self._pids_trabajadores)
+                pool = None
+            if self._corrida is not None:
+                self._corrida.cerrar('interrumpida')
+            raise
+        finally:
+            if pool is not None:
+                if self.cancelada:
+                    _terminar_pool(pool, self._pids_trabajadores)
+                else:
+                    pool.shutdown()
+
+        self._log_verificacion()
+        if self._corrida is not None:
+            self._corrida.cerrar('cancelada' if self.cancelada else 'completada')
+            self.log(f"💾 Mediciones guardadas en {self.base.ruta} (corrida {self.corrida_id})")
+        self.log(f"\n{'='*70}")
+        if self.cancelada:
+            self.log("⏹️ SERIE CANCELADA: se conservan las mediciones ya terminadas")
+        else:
+            self.log("✅✅✅ SERIE DE EXPERIENCIAS COMPLETADA ✅✅✅")
+        self.log(f"{'='*70}\n")
+
+    def _ejecutar_tamanio(self, n: int, repeticiones: int, tipo_datos: str):
+        self.log(f"\n--- EXPERIENCIA PARA n = {n:,} ({repeticiones} repeticiones) ---")
+        funciones = self._planificar(n, repeticiones, tipo_datos)
+
+        for rep in range(repeticiones):
+            pendientes = self._pendientes(funciones, n, rep)
+            if not pendientes:
+                continue
+            array_original = self._obtener_entrada(n, rep, tipo_datos, self.entrada)
+            referencia = _SIN_PREPARAR
+
+            for nombre, func in pendientes.items():
+                if self._cancelacion.is_set():
+                    raise SerieCancelada()
+                if rep == 0:
+                    self.log(f"🔄 Ejecutando {nombre}...")
+
+                tiempo_total, instrucciones, arr_ordenado, extra = medir_celda(
+                    func, array_original, self._version_rapida(nombre), _contadores_hw() if self._usar_hw else None,
+                    self.cronometro)
+                correcto = None
+                if self._toca_verificar():
+                    if referencia is _SIN_PREPARAR:
+                        referencia = self._preparar_verificacion(array_original)
+                    correcto, tiempo_verificacion = verificar_celda(array_original, arr_ordenado, self.verificacion, referencia)
+                    self._contar_verificacion(tiempo_verificacion)
+                self._registrar(nombre, n, rep, tipo_datos, tiempo_total, instrucciones, correcto, extra)
+                self._avanzar(nombre, n)
+
+        self._log_promedios(n, repeticiones)
+        self._log_progreso()
+
+    def _ejecutar_tamanio_paralelo(self, pool: ProcessPoolExecutor, n: int, repeticiones: int, tipo_datos: str):
+        modo_pool = 'en paralelo' if self.trabajadores > 1 else 'en proceso aislado'
+        self.log(f"\n--- EXPERIENCIA PARA n = {n:,} ({repeticiones} repeticiones, {modo_pool}) ---")
+        funciones = self._planificar(n, repeticiones, tipo_datos)
+
+        # Orden canónico de las celdas: el mismo que recorre la ejecución secuencial
+        pendientes_por_rep = [self._pendientes(funciones, n, rep) for rep in range(repeticiones)]
+        orden = [(rep, nombre) for rep, pendientes in enumerate(pendientes_por_rep) for nombre in pendientes]
+        # Cada entrada se genera al enviar su repetición y se libera cuando terminan sus celdas:
+        # en memoria solo están las de las repeticiones en curso, no las de toda la serie
+        por_enviar = iter([(rep, pendientes) for rep, pendientes in enumerate(pendientes_por_rep) if pendientes])
+        en_vuelo = CELDAS_EN_VUELO_POR_TRABAJADOR * self.trabajadores
+        futuros = {}
+        terminados = {}
+        siguiente = 0
+        while True:
+            while len(futuros) < en_vuelo:
+                repeticion = next(por_enviar, None)
+                if repeticion is None:
+                    break
+                futuros.update(self._enviar_repeticion(pool, n, tipo_datos, *repeticion))
+            if not futuros:
+                break
+            # Espera acotada para atender una cancelación aunque ninguna celda termine
+            hechos, _ = wait(futuros, timeout=INTERVALO_CANCELACION, return_when=FIRST_COMPLETED)
+            if self._cancelacion.is_set():
+                raise SerieCancelada()
+            for futuro in hechos:
+                rep, nombre = futuros.pop(futuro)
+                try:
+                    terminados[(rep, nombre)] = futuro.result()
+                    self._avanzar(nombre, n)
+                except TiempoAgotado:
+                    terminados[(rep, nombre)] = None
+                    self._avanzar(nombre, n, limite=self._limite)
+            # Incorporar solo el prefijo contiguo ya terminado, para conservar el orden
+            while siguiente < len(orden) and orden[siguiente] in terminados:
+                rep, nombre = orden[siguiente]
+                resultado = terminados.pop(orden[siguiente])
+                siguiente += 1
+                if resultado is None:
+                    self._registrar_tiempo_agotado(nombre, n, rep, tipo_datos)
+                    continue
+                tiempo_total, instrucciones, correcto, tiempo_verificacion, extra = resultado
+                if correcto is not None:
+                    self._contar_verificacion(tiempo_verificacion)
+                self._registrar(nombre, n, rep, tipo_datos, tiempo_total, instrucciones, correcto, extra)
+
+        for nombre in funciones:
+            if self._agotadas.get((nombre, n), 0) == repeticiones:
+                self._excluir(nombre, n)
+        self._log_promedios(n, repeticiones)
+        self._log_progreso()
+
+    def _enviar_repeticion(self, pool: ProcessPoolExecutor, n: int, tipo_datos: str, rep: int,
+                           pendientes: Dict[str, Callable]) -> Dict[Future, Tuple[int, str]]:
+        """Genera la entrada de la repetición rep y envía al pool sus celdas pendientes."""
+        # array('i') se serializa como un bloque de bytes: envío barato a los procesos
+        datos = self._obtener_entrada(n, rep, tipo_datos, 'array', serializable=True)
+        verificar = [self._toca_verificar() for _ in pendientes]
+        referencia = self._preparar_verificacion(datos, resumida=True) if any(verificar) else None
+        futuros = {}
+        for (nombre, func), verificar_celda_rep in zip(pendientes.items(), verificar):
+            modo = self.verificacion if verificar_celda_rep else None
+            futuros[pool.submit(_medir_celda_remota, func, datos, self._version_rapida(nombre),
+                                modo, referencia if modo else None, self._limite, self._usar_hw,
+                                self.cronometro, self._version_memoria(nombre, func),
+                                self.entrada)] = (rep, nombre)
+        return futuros
+
+    def _obtener_entrada(self, n: int, rep: int, tipo_datos: str, formato: str, serializable: bool = False):
+        semilla = self.semilla + rep
+        if self.cache is None:
+            return generar_array_segun_caso(n, tipo_datos, semilla, formato)
+        if formato == 'array':
+            if serializable:
+                # Hacia el pool va un array('i'): un memoryview no se puede serializar
+                return self.cache.obtener_array(n, tipo_datos, semilla)
+            # En el mismo proceso basta el memoryview sobre el mmap: cada algoritmo hace su
+            # propia copia (ver _copiar), sin una copia intermedia de la entrada completa
+            return self.cache.obtener(n, tipo_datos, semilla)
+        return self.cache.obtener_lista(n, tipo_datos, semilla)
+
+    def _crear_pool(self) -> ProcessPoolExecutor:
+        # 'spawn' evita heredar por fork el estado de Tkinter y de los hilos de la interfaz
+        contexto = multiprocessing.get_context('spawn')
+        cpus_libres = None
+        aislar_ejecuciones = self.memoria and AISLAMIENTO_POR_EJECUCION
+        if self.fijar_cpu and aislar_ejecuciones:
+            # Cada proceso nuevo tomaría una CPU de la cola sin devolverla
+            self.log("⚠️ Con la sonda de memoria cada ejecución usa un proceso nuevo; se ejecuta sin fijar a CPU.")
+        elif self.fijar_cpu:
+            if hasattr(os, 'sched_setaffinity'):
+                cpus_libres = contexto.Queue()
+                for cpu in cpus_disponibles()[:self.trabajadores]:
+                    cpus_libres.put(cpu)
+            else:
+                self.log("⚠️ Esta plataforma no permite fijar procesos a CPU; se ejecuta sin fijar.")
+        opciones = {'max_tasks_per_child': 1} if aislar_ejecuciones else {}
+        self._pids_trabajadores = contexto.Queue()
+        return ProcessPoolExecutor(max_workers=self.trabajadores, mp_context=contexto,
+                                   initializer=_inicializar_trabajador,
+                                   initargs=(self._pids_trabajadores, cpus_libres, self._precargar_numpy),
+                                   **opciones)
+
+    def _version_memoria(self, nombre: str, func: Callable) -> Optional[Callable]:
+        """Versión a ejecutar con la sonda de memoria (la rápida si existe), o None sin sonda."""
+        if not self.memoria:
+            return None
+        return self.funciones_rapidas.get(nombre, func)
+
+    def _version_rapida(self, nombre: str) -> Optional[Callable]:
+        """Gemelo sin contadores a cronometrar, o None si se mide la versión instrumentada."""
+        if self.modo_medicion != 'separado':
+            return None
+        return self.funciones_rapidas.get(nombre)
+
+    def _planificar(self, n: int, repeticiones: int, tipo_datos: str) -> Dict[str, Callable]:
+        """Algoritmos a ejecutar para n; los que exceden el presupuesto se omiten o se extrapolan."""
+        candidatas = {}
+        for nombre, func in self.funciones.items():
+            if nombre in self._excluidos:
+                self.log(f"⏱️ {nombre:25s}: se omite (agotó el límite en n={self._excluidos[nombre]:,})")
+                for _ in range(repeticiones):
+                    self._avanzar(nombre, n, ejecutada=False)
+            elif all(self._completada(nombre, n, rep) for rep in range(repeticiones)):
+                # Ya guardado en la corrida que se reanuda
+                for _ in range(repeticiones):
+                    self._avanzar(nombre, n, ejecutada=False)
+                if self._agotadas.get((nombre, n), 0) == repeticiones:
+                    self._excluir(nombre, n)
+            else:
+                candidatas[nombre] = func
+        if self.planificador is None:
+            return candidatas
+        activas = {}
+        for nombre, func in candidatas.items():
+            alg = self.algoritmos[nombre]
+            prediccion = self.planificador.predecir(alg, n)
+            if not self.planificador.excede_presupuesto(prediccion):
+                if prediccion is not None:
+                    self.log(f"🧮 {nombre:25s}: estimado {prediccion[0]:.3g}s por ejecución")
+                activas[nombre] = func
+                continue
+
+            tiempo, instrucciones = prediccion
+            extrapolar = self.planificador.politica == 'extrapolar'
+            self.log(f"🧮 {nombre:25s}: estimado {tiempo:.3g}s por ejecución > presupuesto "
+                     f"{self.planificador.presupuesto:.3g}s → {'se extrapola' if extrapolar else 'se omite'}")
+            if extrapolar:
+                alg.agregar_extrapolacion(n, tiempo, instrucciones)
+                self._emitir({
+                    'algoritmo': nombre, 'tamanio': n, 'repeticion': None, 'caso': tipo_datos, 'semilla': None,
+                    'tiempo': tiempo, 'instrucciones': int(instrucciones), 'correcto': None, 'extrapolado': True
+                })
+            for _ in range(repeticiones):
+                self._avanzar(nombre, n, ejecutada=False)
+            # Sin mediciones nuevas la predicción solo crece con n: los tamaños mayores también se saltean
+            self._estimador.descartar(nombre, n)
+        return activas
+
+    def _excluir(self, nombre: str, n: int):
+        """Excluye nombre de los tamaños mayores que n y quita sus celdas restantes del ETA."""
+        self._excluidos[nombre] = n
+        self._estimador.descartar(nombre, n)
+
+    def _pendientes(self, funciones: Dict[str, Callable], n: int, rep: int) -> Dict[str, Callable]:
+        """Algoritmos de la repetición rep que faltan medir; las celdas ya guardadas solo avanzan el progreso."""
+        pendientes = {}
+        for nombre, func in funciones.items():
+            if self._completada(nombre, n, rep):
+                self._avanzar(nombre, n, ejecutada=False)
+            else:
+                pendientes[nombre] = func
+        return pendientes
+
+    def _toca_verificar(self) -> bool:
+        return self.fraccion_verificada >= 1.0 or self._rng_verificacion.random() < self.fraccion_verificada
+
+    def _preparar_verificacion(self, array_original: List[int], resumida: bool = False):
+        """
+        Referencia de verificación de una entrada; su costo cuenta como sobrecosto de verificación.
+        Con resumida, la referencia ordenada se reduce a su huella para enviarla a los procesos.
+        """
+        tiempo_inicio = time.perf_counter()
+        referencia = preparar_verificacion(array_original, self.verificacion)
+        if resumida and self.verificacion == 'referencia':
+            referencia = huella_secuencia(referencia)
+        self.tiempo_verificacion += time.perf_counter() - tiempo_inicio
+        return referencia
+
+    def _contar_verificacion(self, tiempo_verificacion: float):
+        self.tiempo_verificacion += tiempo_verificacion
+        self.ejecuciones_verificadas += 1
+
+    def _log_verificacion(self):
+        porcentaje = 100 * self.tiempo_verificacion / self._tiempo_medido if self._tiempo_medido > 0 else 0
+        self.log(f"\n🔎 Verificación '{self.verificacion}': {self.ejecuciones_verificadas} de {self._ejecuciones} ejecuciones, "
+                 f"{self.tiempo_verificacion:.6f}s de sobrecosto ({porcentaje:.1f}% del tiempo medido)")
+
+    def _avanzar(self, nombre: str, n: int, ejecutada: bool = True, limite: Optional[float] = None):
+        self._paso_actual += 1
+        self._estimador.completar(nombre, n, ejecutada, limite)
+        self.al_avanzar(self._paso_actual, self._total_pasos)
+        self.al_progresar(self._estimador.estado())
+
+    def _log_progreso(self):
+        # Con las mediciones del tamaño recién terminado mejora la predicción de los siguientes
+        self._estimador.reestimar()
+        estado = self._estimador.estado()
+        if estado['completadas'] < estado['total']:
+            self.log(f"\n⏳ Avance {estado['fraccion']:.0%} ({estado['completadas']}/{estado['total']} celdas) | "
+                     f"restante estimado: {formatear_duracion(estado['eta'])} | {estado['celdas_por_segundo']:.1f} celdas/s")
+
+    def _emitir(self, medicion: dict):
+        if self._corrida is not None:
+            self._corrida(medicion)
+            self.algoritmos[medicion['algoritmo']].celdas_de_corridas.add(
+                (self._corrida.id, medicion['tamanio'], medicion['repeticion']))
+        self.al_medir(medicion)
+
+    def _abrir_corrida(self, corrida_previa: Optional[dict], tamanos: List[int], repeticiones: int, tipo_datos: str):
+        """Escritor de la corrida en la base (nueva o reanudada), o None sin base."""
+        if self.base is None:
+            return None
+        if corrida_previa is None:
+            corrida = self.base.iniciar_corrida(tipo_datos, self.semilla, tamanos, repeticiones,
+                                                list(self.funciones), self.opciones_corrida())
+            self.corrida_id = corrida.id
+            self.log(f"   Corrida: {corrida.id} (base {self.base.ruta})")
+            return corrida
+        mediciones = self.base.mediciones(corrida_previa['id'])
+        # Las celdas ya en memoria (de un intento anterior en esta sesión) no se vuelven a incorporar
+        aplicar_mediciones(mediciones, self.algoritmos, corrida_previa['id'])
+        for medicion in mediciones:
+            if medicion['tiempo_agotado']:
+                clave = (medicion['algoritmo'], medicion['tamanio'])
+                self._agotadas[clave] = self._agotadas.get(clave, 0) + 1
+        self._completadas = celdas_completadas(mediciones)
+        corrida = self.base.reanudar_corrida(corrida_previa['id'])
+        self.corrida_id = corrida.id
+        self.log(f"   Reanuda la corrida {corrida.id}: {len(mediciones)} mediciones ya guardadas")
+        return corrida
+
+    def _completada(self, nombre: str, n: int, rep: int) -> bool:
+        """True si la celda ya está en la corrida que se reanuda."""
+        return (nombre, n, rep) in self._completadas or (nombre, n, None) in self._completadas
+
+    def _registrar(self, nombre: str, n: int, rep: int, tipo_datos: str,
+                   tiempo_total: float, instrucciones: int, correcto: Optional[bool],
+                   extra: Optional[Dict[str, float]] = None):
+        if correcto is False:
+            self.log(f"  ⚠️ ADVERTENCIA: {nombre} no ordenó correctamente!")
+        self._tiempo_medido += tiempo_total
+        self._ejecuciones += 1
+
+        self.algoritmos[nombre].agregar_metricas(n, tiempo_total, instrucciones)
+        if extra:
+            self.algoritmos[nombre].agregar_metricas_extra(n, extra)
+        self._emitir({
+            'algoritmo': nombre, 'tamanio': n, 'repeticion': rep, 'caso': tipo_datos, 'semilla': self.semilla + rep,
+            'tiempo': tiempo_total, 'instrucciones': instrucciones, 'correcto': correcto, **(extra or {})
+        })
+
+    def _registrar_tiempo_agotado(self, nombre: str, n: int, rep: int, tipo_datos: str):
+        self.log(f"  ⏱️ {nombre} superó el límite de {self._limite:g}s (repetición {rep + 1})")
+        self._agotadas[(nombre, n)] = self._agotadas.get((nombre, n), 0) + 1
+        self.algoritmos[nombre].agregar_tiempo_agotado(n)
+        self._emitir({
+            'algoritmo': nombre, 'tamanio': n, 'repeticion': rep, 'caso': tipo_datos, 'semilla': self.semilla + rep,
+            'tiempo': None, 'instrucciones': None, 'correcto': None, 'tiempo_agotado': True
+        })
+
+    def _log_promedios(self, n: int, repeticiones: int):
+        # Mostrar promedios después de todas las repeticiones
+        self.log(f"\n📊 PROMEDIOS para n={n:,}:")
+        for nombre, alg in self.algoritmos.items():
+            agotadas = self._agotadas.get((nombre, n), 0)
+            medidas = repeticiones - agotadas
+            if n in alg.resultados and medidas > 0:
+                mediciones = alg.resultados[n][-medidas:]
+                avg_tiempo = statistics.mean(m[0] for m in mediciones)
+                avg_inst = statistics.mean(m[1] for m in mediciones)
+                std_tiempo = statistics.stdev(m[0] for m in mediciones) if len(mediciones) > 1 else 0
+                mediana = statistics.median(m[0] for m in mediciones)
+                self.log(f"  {nombre:25s}: {avg_tiempo:8.6f}s (±{std_tiempo:.6f}s, mediana {mediana:.6f}s) | "
+                         f"{int(avg_inst):,} instrucciones")
+            elif n in alg.extrapolados:
+                tiempo, instrucciones = alg.extrapolados[n]
+                self.log(f"  {nombre:25s}: {tiempo:8.6g}s (extrapolado) | ~{instrucciones:,} instrucciones")
+            if agotadas == repeticiones:
+                self.log(f"  {nombre:25s}: tiempo agotado en todas las repeticiones (> {self._limite:g}s)")
+            elif agotadas:
+                self.log(f"  {'':25s}  ⏱️ {agotadas} de {repeticiones} repeticiones agotaron el límite")
@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+"""
+Gráficos comparativos sobre tk.Canvas.
+
+El gráfico se dibuja en tres capas etiquetadas ('ejes', 'datos' y 'leyenda').
+Cada elemento se identifica por una clave estable (p. ej. ('punto', algoritmo, i))
+y se reutiliza entre redibujos: solo se mueven (canvas.coords) o reconfiguran los
+elementos que cambiaron, y se crean o borran únicamente los que aparecen o
+desaparecen. Los eventos <Configure> de un redimensionado se agrupan en un único
+redibujo diferido. Gracias a esto el gráfico puede refrescarse periódicamente
+mientras corre una serie: cada refresco solo agrega los puntos nuevos.
+"""
+
+import math
+import tkinter as tk
+from typing import Dict, Hashable
+
+from ordenamiento import AlgoritmoOrdenamiento, ETIQUETAS_OPERACIONES, LINEAS_BASE
+from contadores_hw import ETIQUETAS_HW
+from cronometro import ETIQUETAS_CRONOMETRO
+from memoria import ETIQUETAS_MEMORIA
+
+CAPAS = ('ejes', 'datos', 'leyenda')  # De abajo hacia arriba
+RETARDO_REDIBUJO_MS = 40  # Los <Configure> que llegan dentro de este lapso se agrupan
+INTERVALO_REFRESCO_MS = 500  # Ritmo máximo de actualización en vivo mientras corre una serie
+
+# Nombre del eje Y de cada métrica graficable
+ETIQUETAS_METRICAS = {
+    'tiempo': "Tiempo de Ejecución (s)",
+    'instrucciones': "Total de Instrucciones",
+    **ETIQUETAS_CRONOMETRO,
+    **ETIQUETAS_MEMORIA,
+    **ETIQUETAS_OPERACIONES,
+    **ETIQUETAS_HW,
+}
+
+
+class GraficoComparativo:
+    """
+    Gráfico de tiempo o instrucciones vs. tamaño para todos los algoritmos.
+
+    - data_type: 'tiempo', 'instrucciones' o una métrica adicional (ver ETIQUETAS_METRICAS).
+    - programar_redibujo(): pide un redibujo diferido; varias llamadas seguidas
+      producen uno solo. Es lo que se conecta a <Configure>.
+    - dibujar(): redibuja en el momento.
+    """
+    MARGEN_IZQ, MARGEN_DER, MARGEN_SUP, MARGEN_INF = 100, 50, 50, 80
+
+    def __init__(self, canvas: tk.Canvas, algoritmos: Dict[str, AlgoritmoOrdenamiento], data_type: str,
+                 use_log_scale: bool = False, show_error_bars: bool = True):
+        self.canvas = canvas
+        self.algoritmos = algoritmos
+        self.data_type = data_type
+        self.use_log_scale = use_log_scale
+        self.show_error_bars = show_error_bars
+        self._items = {}  # {clave: (id, tipo, coords, opciones)}
+        self._vistos = set()
+        self._creados = False
+        self._redibujo_pendiente = None
+
+    def configurar(self, **opciones):
+        """Cambia data_type, use_log_scale o show_error_bars y programa el redibujo."""
+        for nombre, valor in opciones.items():
+            setattr(self, nombre, valor)
+        self.programar_redibujo()
+
+    def programar_redibujo(self, event=None):
+        if self._redibujo_pendiente is not None:
+            self.canvas.after_cancel(self._redibujo_pendiente)
+        self._redibujo_pendiente = self.canvas.after(RETARDO_REDIBUJO_MS, self._redibujar_programado)
+
+    def _redibujar_programado(self):
+        self._redibujo_pendiente = None
+        if self.canvas.winfo_exists():  # La ventana pudo cerrarse mientras tanto
+            self.dibujar()
+
+    # --- Gestión de elementos reutilizables ---
+
+    def _elemento(self, clave: Hashable, tipo: str, coords, capa: str, **opciones):
+        """Crea el elemento si no existe; si existe, actualiza solo lo que cambió."""
+        self._vistos.add(clave)
+        coords = tuple(coords)
+        existente = self._items.get(clave)
+        if existente is None or existente[1] != tipo:
+            if existente is not None:
+                self.canvas.delete(existente[0])
+            item = getattr(self.canvas, f'create_{tipo}')(*coords, tags=(capa,), **opciones)
+            self._items[clave] = (item, tipo, coords, opciones)
+            self._creados = True
+            return
+        item, _, coords_previas, opciones_previas = existente
+        if coords != coords_previas:
+            self.canvas.coords(item, *coords)
+        if opciones != opciones_previas:
+            self.canvas.itemconfigure(item, **opciones)
+        self._items[clave] = (item, tipo, coords, opciones)
+
+    def _linea(self, clave, coords, capa, **opciones):
+        self._elemento(clave, 'line', coords, capa, **opciones)
+
+    def _ovalo(self, clave, coords, capa, **opciones):
+        self._elemento(clave, 'oval', coords, capa, **opciones)
+
+    def _rectangulo(self, clave, coords, capa, **opciones):
+        self._elemento(clave, 'rectangle', coords, capa, **opciones)
+
+    def _texto(self, clave, x, y, capa, **opciones):
+        self._elemento(clave, 'text', (x, y), capa, **opciones)
+
+    def _terminar_pasada(self):
+        """Borra los elementos que no se usaron en este redibujo y restablece el orden de las capas."""
+        for clave in [c for c in self._items if c not in self._vistos]:
+            self.canvas.delete(self._items.pop(clave)[0])
+        if self._creados:
+            for capa in CAPAS:
+                self.canvas.tag_raise(capa)
+        self._vistos = set()
+        self._creados = False
+
+    # --- Dibujo ---
+
+    def dibujar(self):
+        canvas = self.canvas
+        data_type = self.data_type
+        use_log_scale = self.use_log_scale
+
+        width = canvas.winfo_width()
+        height = canvas.winfo_height()
+        m_left, m_right, m_top, m_bottom = self.MARGEN_IZQ, self.MARGEN_DER, self.MARGEN_SUP, self.MARGEN_INF
+        plot_w = width - m_left - m_right
+        plot_h = height - m_top - m_bottom
+
+        if plot_w <= 0 or plot_h <= 0: return
+
+        all_data = {}
+        min_x, max_x, min_y, max_y = float('inf'), 0, float('inf'), 0
+
+        for nombre, alg in self.algoritmos.items():
+            if data_type == 'instrucciones' and nombre in LINEAS_BASE:
+                continue  # Las líneas base no cuentan instrucciones
+            # Promedios y desviaciones en caché: solo se recalculan si llegaron datos nuevos
+            tamanos, valores, std_devs = alg.obtener_serie(data_type)
+            if not tamanos: continue
+
+            # Puntos predichos por el planificador (se dibujan huecos y con línea discontinua)
+            extrapolados = [(p[0], p[1] if data_type == 'tiempo' else p[2]) for p in alg.obtener_extrapolados()
+                            if data_type in ('tiempo', 'instrucciones')]
+
+            all_data[nombre] = (tamanos, valores, std_devs, alg.color, extrapolados)
+
+            todos_x = list(tamanos) + [x for x, _ in extrapolados]
+            todos_y = list(valores) + [y for _, y in extrapolados]
+            min_x = min(min_x, min(todos_x))
+            max_x = max(max_x, max(todos_x))
+            min_y_candidate = min(v for v in todos_y if v > 0) if any(v > 0 for v in todos_y) else 1
+            min_y = min(min_y, min_y_candidate)
+            max_y = max(max_y, max(todos_y))
+
+        if not all_data:
+            self._terminar_pasada()
+            return
+
+        if min_x == max_x: max_x = min_x + 1
+        min_y_final = 1 if use_log_scale and min_y == float('inf') else (min_y if use_log_scale else 0)
+        if min_y_final >= max_y: max_y = min_y_final + 1
+
+        # Funciones de mapeo
+        def map_x(x): return m_left + (x - min_x) / (max_x - min_x) * plot_w
+        def map_y(y):
+            if use_log_scale:
+                if y <= 0: return m_top + plot_h
+                log_min = math.log10(min_y_final)
+                log_max = math.log10(max_y)
+                if log_max == log_min: return m_top + plot_h
+                return m_top + (1 - (math.log10(y) - log_min) / (log_max - log_min)) * plot_h
+            else:
+                return m_top + (1 - (y - min_y_final) / (max_y - min_y_final)) * plot_h
+
+        # Dibujar ejes, ticks y título
+        self._dibujar_ejes(m_left, m_top, plot_w, plot_h, min_x, max_x, min_y_final, max_y, map_x, map_y)
+
+        # Dibujar datos, barras de error y leyenda
+        legend_y_start = m_top + 10
+        hay_extrapolados = False
+        for i, (nombre, (tamanos, valores, std_devs, color, extrapolados)) in enumerate(all_data.items()):
+            coords = []
+            for j, (x, y, std) in enumerate(zip(tamanos, valores, std_devs)):
+                px, py = map_x(x), map_y(y)
+                coords.extend([px, py])
+
+                # Dibujar barras de error
+                if self.show_error_bars and std > 0:
+                    py_upper = map_y(y + std) if not use_log_scale or y > 0 else py
+                    if not use_log_scale:
+                        py_lower = map_y(max(y - std, min_y_final))
+                    else:
+                        py_lower = map_y(y - std) if y > std else map_y(min_y_final)
+                    self._linea(('error', nombre, j), (px, py_upper, px, py_lower), 'datos', fill=color, width=1, dash=(2, 2))
+                    self._linea(('error_sup', nombre, j), (px-2, py_upper, px+2, py_upper), 'datos', fill=color, width=1)
+                    self._linea(('error_inf', nombre, j), (px-2, py_lower, px+2, py_lower), 'datos', fill=color, width=1)
+
+                # Punto de datos
+                self._ovalo(('punto', nombre, j), (px - 3, py - 3, px + 3, py + 3), 'datos', fill=color, outline=color)
+
+            if len(coords) >= 4:
+                self._linea(('curva', nombre), coords, 'datos', fill=color, width=2)
+
+            # Puntos extrapolados: continúan la curva con línea discontinua y marcadores huecos
+            if extrapolados:
+                hay_extrapolados = True
+                coords_ext = coords[-2:]
+                for j, (x, y) in enumerate(extrapolados):
+                    px, py = map_x(x), map_y(y)
+                    coords_ext.extend([px, py])
+                    self._ovalo(('extrapolado', nombre, j), (px - 4, py - 4, px + 4, py + 4), 'datos',
+                                fill='white', outline=color, width=2)
+                if len(coords_ext) >= 4:
+                    self._linea(('curva_extrapolada', nombre), coords_ext, 'datos', fill=color, width=2, dash=(6, 4))
+
+            # Leyenda
+            self._rectangulo(('leyenda', nombre), (width - 220, legend_y_start + i*20 - 5, width-215, legend_y_start + i*20 + 5),
+                             'leyenda', fill=color, outline=color)
+            self._texto(('leyenda_texto', nombre), width - 210, legend_y_start + i*20, 'leyenda', text=nombre, anchor=tk.W)
+
+        if hay_extrapolados:
+            y_nota = legend_y_start + len(all_data) * 20
+            self._ovalo('nota_extrapolado', (width - 222, y_nota - 4, width - 214, y_nota + 4), 'leyenda',
+                        fill='white', outline='gray', width=2)
+            self._texto('nota_extrapolado_texto', width - 210, y_nota, 'leyenda',
+                        text="Extrapolado (no medido)", anchor=tk.W, fill='gray')
+
+        self._terminar_pasada()
+
+    def _dibujar_ejes(self, m_l, m_t, p_w, p_h, min_x, max_x, min_y, max_y, map_x, map_y):
+        # Ejes
+        self._linea('eje_y', (m_l, m_t, m_l, m_t + p_h), 'ejes', width=2)
+        self._linea('eje_x', (m_l, m_t + p_h, m_l + p_w, m_t + p_h), 'ejes', width=2)
+
+        # Título
+        y_label = ETIQUETAS_METRICAS.get(self.data_type, self.data_type)
+        if self.use_log_scale: y_label += " (Escala Logarítmica)"
+        self._texto('titulo', m_l + p_w / 2, m_t / 2, 'ejes', text=f"{y_label} vs. Tamaño de Entrada", font=("Arial", 14, "bold"))
+        self._texto('etiqueta_x', m_l + p_w / 2, m_t + p_h + 45, 'ejes', text="Tamaño de Entrada (n)", font=("Arial", 11))
+        self._texto('etiqueta_y', 25, m_t + p_h / 2, 'ejes', text=y_label, angle=90, font=("Arial", 11))
+
+        # Ticks X
+        for i in range(6):
+            val = min_x + i * (max_x - min_x) / 5
+            px = map_x(val)
+            self._linea(('tick_x', i), (px, m_t + p_h, px, m_t + p_h + 5), 'ejes')
+            self._texto(('tick_x_texto', i), px, m_t + p_h + 15, 'ejes', text=f"{val:,.0f}", anchor=tk.N)
+
+        # Ticks Y
+        if self.use_log_scale:
+            exp_start = math.floor(math.log10(min_y))
+            exp_end = math.ceil(math.log10(max_y))
+            k = 0
+            for exp in range(exp_start, exp_end + 1):
+                val = 10**exp
+                if min_y <= val <= max_y:
+                    py = map_y(val)
+                    self._linea(('tick_y', k), (m_l - 5, py, m_l, py), 'ejes')
+                    self._texto(('tick_y_texto', k), m_l - 10, py, 'ejes', text=f"1e{exp}", anchor=tk.E)
+                    k += 1
+        else:
+            for i in range(6):
+                val = min_y + i * (max_y - min_y) / 5
+                py = map_y(val)
+                self._linea(('tick_y', i), (m_l - 5, py, m_l, py), 'ejes')
+                self._texto(('tick_y_texto', i), m_l - 10, py, 'ejes',
+                            text=f"{val:,.2f}" if val < 10 else f"{val:,.0f}", anchor=tk.E)
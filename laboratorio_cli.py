@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Ejecución del laboratorio sin interfaz gráfica.
+
+Permite lanzar series de experiencias en equipos sin pantalla (por ejemplo,
+servidores de benchmarks nocturnos) y en barridos automatizados. No importa
+Tkinter. Cada medición se emite en cuanto termina, en texto, CSV o JSON Lines.
+
+Ejemplos:
+    python -m laboratorio_cli --tamanos "1k, 5k, 10k" --repeticiones 3
+    python -m laboratorio_cli -t 10k -c inverso -a quick_sort heap_sort -f csv -o res.csv
+    python -m laboratorio_cli -t 1k -c aleatorio ordenado -f jsonl
+    python -m laboratorio_cli -t "10k, 100k" --limite-tiempo 30
+    python -m laboratorio_cli -t "100k, 1m" --base --entrada array
+    python -m laboratorio_cli --corridas
+    python -m laboratorio_cli --reanudar 3f2a
+"""
+
+import argparse
+import csv
+import json
+import os
+import re
+import sys
+import time
+from typing import Callable, Dict, List
+
+from ordenamiento import (
+    FUNCIONES_ORDENAMIENTO, CASOS_DATOS, MODOS_ENTRADA, MODOS_MEDICION, MODOS_VERIFICACION, OPERACIONES,
+    crear_algoritmos, parsear_serie_tamanos
+)
+from experimentos import EjecutorSerie
+from cache_datos import CacheDatos, DIRECTORIO_POR_DEFECTO, TAMANO_MAXIMO_POR_DEFECTO
+from planificador import PlanificadorComplejidad, POLITICAS
+from contadores_hw import EVENTOS_HW
+from cronometro import CALENTAMIENTO_POR_DEFECTO, TIEMPO_MINIMO_POR_DEFECTO, Cronometro
+from memoria import METRICAS_MEMORIA
+from plugins import cargar_plugins, plugins_de_entorno, plugins_disponibles, VARIABLE_ENTORNO
+from registro import ARCHIVO_LOG_POR_DEFECTO, cerrar_registro_archivo, crear_registro_archivo
+from base_resultados import ARCHIVO_BASE_POR_DEFECTO, BaseResultados, opciones_ejecutor
+
+CAMPOS_MEDICION = ['algoritmo', 'tamanio', 'repeticion', 'caso', 'semilla', 'tiempo', 'instrucciones', 'correcto', 'extrapolado',
+                   'tiempo_agotado', 'tiempo_cpu'] + list(METRICAS_MEMORIA) + list(OPERACIONES) + list(EVENTOS_HW)
+
+
+def _clave_algoritmo(nombre: str) -> str:
+    """'Quick Sort (Mediana de 3)' -> 'quick_sort_mediana_de_3': minúsculas y '_' en lugar de lo no alfanumérico."""
+    return re.sub(r'[^a-z0-9]+', '_', nombre.lower()).strip('_')
+
+
+def resolver_algoritmos(solicitados: List[str]) -> Dict[str, Callable]:
+    """Traduce nombres o claves de algoritmos a sus funciones, conservando el orden del registro."""
+    if not solicitados:
+        return dict(FUNCIONES_ORDENAMIENTO)
+    por_clave = {_clave_algoritmo(nombre): nombre for nombre in FUNCIONES_ORDENAMIENTO}
+    elegidos = set()
+    for s in solicitados:
+        clave = _clave_algoritmo(s.strip())
+        if clave not in por_clave:
+            raise ValueError(f"Algoritmo desconocido: '{s}'. Disponibles: {', '.join(por_clave)}")
+        elegidos.add(por_clave[clave])
+    return {nombre: func for nombre, func in FUNCIONES_ORDENAMIENTO.items() if nombre in elegidos}
+
+
+class EscritorMediciones:
+    """Escribe cada medición en el formato elegido y vacía el buffer tras cada línea."""
+    def __init__(self, salida, formato: str):
+        self.salida = salida
+        self.formato = formato
+        self._csv = None
+        if formato == 'csv':
+            self._csv = csv.DictWriter(salida, fieldnames=CAMPOS_MEDICION, extrasaction='ignore')
+            self._csv.writeheader()
+
+    def __call__(self, medicion: dict):
+        if self.formato == 'csv':
+            self._csv.writerow(medicion)
+        elif self.formato == 'jsonl':
+            self.salida.write(json.dumps(medicion, ensure_ascii=False) + '\n')
+        elif medicion.get('extrapolado'):
+            self.salida.write(f"{medicion['caso']:>13s} | n={medicion['tamanio']:>10,} | extrap | "
+                              f"{medicion['algoritmo']:25s} | {medicion['tiempo']:10.4g}s | "
+                              f"{medicion['instrucciones']:>15,} instrucciones (predicción)\n")
+        elif medicion.get('tiempo_agotado'):
+            self.salida.write(f"{medicion['caso']:>13s} | n={medicion['tamanio']:>10,} | rep {medicion['repeticion']:>2} | "
+                              f"{medicion['algoritmo']:25s} | tiempo agotado\n")
+        else:
+            self.salida.write(f"{medicion['caso']:>13s} | n={medicion['tamanio']:>10,} | rep {medicion['repeticion']:>2} | "
+                              f"{medicion['algoritmo']:25s} | {medicion['tiempo']:10.6f}s | "
+                              f"{medicion['instrucciones']:>15,} instrucciones\n")
+        self.salida.flush()
+
+
+def listar_corridas(base: BaseResultados, salida=sys.stdout):
+    """Una línea por corrida guardada, de la más reciente a la más antigua."""
+    for corrida in base.corridas():
+        inicio = time.strftime('%Y-%m-%d %H:%M', time.localtime(corrida['inicio']))
+        tamanos = ', '.join(f"{n:,}" for n in corrida['tamanos'])
+        salida.write(f"{corrida['id'][:12]}  {inicio}  {corrida['estado']:12s} {corrida['caso']:13s} "
+                     f"n=[{tamanos}] x{corrida['repeticiones']} | {len(corrida['algoritmos'])} algoritmos | "
+                     f"{corrida['mediciones']} mediciones | {corrida['maquina']['equipo']} "
+                     f"@ {corrida['revision'] or 'sin revisión'}\n")
+
+
+def crear_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='python -m laboratorio_cli',
+        description="Ejecuta series de experiencias de ordenamiento sin interfaz gráfica.")
+    parser.add_argument('-t', '--tamanos', default="1000, 5000, 10000, 20000, 50000",
+                        help="Serie de tamaños separada por comas, admite sufijos k y m (ej: '1k, 5k, 1m').")
+    parser.add_argument('-r', '--repeticiones', type=int, default=3, help="Repeticiones por tamaño (por defecto 3).")
+    parser.add_argument('-c', '--caso', nargs='+', choices=CASOS_DATOS, default=['aleatorio'],
+                        help="Tipo(s) de datos de entrada. Si se indican varios se ejecuta una serie por caso.")
+    parser.add_argument('-a', '--algoritmos', nargs='+', metavar='ALGORITMO',
+                        help="Subconjunto de algoritmos (ej: quick_sort heap_sort). Por defecto, todos.")
+    parser.add_argument('-f', '--formato', choices=('texto', 'csv', 'jsonl'), default='texto',
+                        help="Formato de las mediciones emitidas (por defecto texto).")
+    parser.add_argument('-o', '--salida', help="Archivo de salida para las mediciones (por defecto stdout).")
+    parser.add_argument('-m', '--modo', choices=MODOS_MEDICION, default='instrumentado',
+                        help="'instrumentado': tiempo e instrucciones de la misma ejecución; "
+                             "'separado': tiempo de la versión sin contadores e instrucciones de una ejecución aparte.")
+    parser.add_argument('--entrada', choices=MODOS_ENTRADA, default='lista',
+                        help="'lista': los algoritmos reciben una lista de int; 'array': un array('i') tipado, "
+                             "~4 veces menos memoria para series de millones de elementos.")
+    parser.add_argument('-s', '--semilla', type=int,
+                        help="Semilla base de los datos (la repetición r usa semilla + r). Por defecto se sortea.")
+    parser.add_argument('--cache', nargs='?', const=DIRECTORIO_POR_DEFECTO, metavar='DIRECTORIO',
+                        help=f"Reutiliza los datasets guardados en disco (por defecto en {DIRECTORIO_POR_DEFECTO}).")
+    parser.add_argument('--cache-max-mb', type=int, default=TAMANO_MAXIMO_POR_DEFECTO // 1024 ** 2,
+                        help="Tamaño máximo de la caché en MiB; se expulsan los datasets menos usados.")
+    parser.add_argument('--verificacion', choices=MODOS_VERIFICACION, default='referencia',
+                        help="'referencia': ordena cada entrada una vez y compara; 'lineal': comprobación O(n) "
+                             "(orden + huella de valores); 'completa': reordena en cada verificación.")
+    parser.add_argument('--fraccion-verificada', type=float, default=1.0, metavar='F',
+                        help="Fracción (0-1) de ejecuciones a verificar, elegidas al azar (por defecto 1).")
+    parser.add_argument('--presupuesto-celda', type=float, metavar='SEGUNDOS',
+                        help="Tiempo máximo estimado por ejecución: las celdas cuya predicción (ajustada con los "
+                             "tamaños menores ya medidos) lo supera se omiten o se extrapolan.")
+    parser.add_argument('--politica', choices=POLITICAS, default='omitir',
+                        help="Qué hacer con las celdas que exceden el presupuesto (por defecto omitir); "
+                             "'limitar' las ejecuta con el presupuesto como límite de tiempo.")
+    parser.add_argument('--limite-tiempo', type=float, metavar='SEGUNDOS',
+                        help="Interrumpe cada ejecución que supere este tiempo (corre en un proceso aparte) "
+                             "y la registra como tiempo agotado.")
+    parser.add_argument('--calentamiento', type=int, default=CALENTAMIENTO_POR_DEFECTO, metavar='N',
+                        help=f"Ejecuciones descartadas antes de cronometrar las celdas cortas (por defecto "
+                             f"{CALENTAMIENTO_POR_DEFECTO}).")
+    parser.add_argument('--tiempo-minimo', type=float, default=TIEMPO_MINIMO_POR_DEFECTO, metavar='SEGUNDOS',
+                        help=f"Las ejecuciones más cortas se repiten en un bucle hasta cubrir este tiempo y se "
+                             f"promedian (por defecto {TIEMPO_MINIMO_POR_DEFECTO:g}; 0 lo desactiva).")
+    parser.add_argument('--con-gc', action='store_true',
+                        help="Deja activo el recolector de basura durante la región cronometrada.")
+    parser.add_argument('--contadores-hw', action='store_true',
+                        help="Mide también ciclos, instrucciones de CPU, fallos de caché y de predicción de saltos "
+                             "con perf_event_open (Linux); si no están disponibles se avisa y se sigue sin ellos.")
+    parser.add_argument('--memoria', action='store_true',
+                        help="Mide el pico de memoria (tracemalloc) y el incremento de RSS de cada ejecución, "
+                             "en una ejecución aparte dentro de un proceso nuevo.")
+    parser.add_argument('-j', '--trabajadores', type=int, default=1,
+                        help="Procesos en paralelo para repartir las celdas (por defecto 1, sin paralelismo).")
+    parser.add_argument('--fijar-cpu', action='store_true',
+                        help="Fija cada proceso trabajador a una CPU distinta para reducir el ruido (Linux).")
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help="Muestra el log de ejecución completo en stderr.")
+    parser.add_argument('--base', nargs='?', const=ARCHIVO_BASE_POR_DEFECTO, metavar='ARCHIVO',
+                        help=f"Guarda cada medición en una base SQLite de resultados (por defecto "
+                             f"{ARCHIVO_BASE_POR_DEFECTO}), para reanudar la serie o recargarla luego.")
+    parser.add_argument('--reanudar', metavar='ID',
+                        help="Reanuda una corrida guardada en la base (id o prefijo del id, ver --corridas): usa sus "
+                             "tamaños, repeticiones, caso, semilla, algoritmos y opciones y mide solo las celdas "
+                             "que faltan.")
+    parser.add_argument('--corridas', action='store_true',
+                        help="Lista las corridas guardadas en la base de resultados y termina.")
+    parser.add_argument('--log-archivo', nargs='?', const=ARCHIVO_LOG_POR_DEFECTO, metavar='RUTA',
+                        help=f"Guarda el log de ejecución en un archivo rotativo (por defecto {ARCHIVO_LOG_POR_DEFECTO}).")
+    parser.add_argument('--plugins', nargs='+', metavar='PLUGIN',
+                        help=f"Plugins de algoritmos a cargar (entry point o módulo importable). Por defecto, los de "
+                             f"la variable de entorno {VARIABLE_ENTORNO}; los demás no se importan.")
+    parser.add_argument('--listar', action='store_true', help="Lista los algoritmos disponibles y termina.")
+    return parser
+
+
+def main(argv: List[str] = None) -> int:
+    parser = crear_parser()
+    args = parser.parse_args(argv)
+
+    try:
+        cargar_plugins(plugins_de_entorno() if args.plugins is None else args.plugins)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.listar:
+        for nombre in FUNCIONES_ORDENAMIENTO:
+            print(f"{_clave_algoritmo(nombre):20s} {nombre}")
+        sin_cargar = {nombre: modulo for nombre, modulo in plugins_disponibles().items()
+                      if nombre not in (args.plugins or plugins_de_entorno())}
+        for nombre, modulo in sin_cargar.items():
+            print(f"{nombre:20s} (plugin sin cargar: {modulo}; use --plugins {nombre})")
+        return 0
+
+    base = BaseResultados(args.base or ARCHIVO_BASE_POR_DEFECTO) if args.base or args.reanudar or args.corridas else None
+    if args.corridas:
+        listar_corridas(base)
+        return 0
+
+    try:
+        if args.reanudar:
+            corrida = base.corrida(args.reanudar)
+            tamanos, funciones = corrida['tamanos'], resolver_algoritmos(corrida['algoritmos'])
+        else:
+            tamanos = parsear_serie_tamanos(args.tamanos)
+            funciones = resolver_algoritmos(args.algoritmos)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.repeticiones < 1:
+        parser.error("El número de repeticiones debe ser al menos 1.")
+    if args.trabajadores < 1:
+        parser.error("El número de trabajadores debe ser al menos 1.")
+    if args.presupuesto_celda is not None and args.presupuesto_celda <= 0:
+        parser.error("El presupuesto por celda debe ser mayor a 0.")
+    if args.limite_tiempo is not None and args.limite_tiempo <= 0:
+        parser.error("El límite de tiempo por ejecución debe ser mayor a 0.")
+    if not 0.0 <= args.fraccion_verificada <= 1.0:
+        parser.error("La fracción verificada debe estar entre 0 y 1.")
+    if args.calentamiento < 0:
+        parser.error("El número de ejecuciones de calentamiento no puede ser negativo.")
+    if args.tiempo_minimo < 0:
+        parser.error("El tiempo mínimo cronometrado no puede ser negativo.")
+
+    salida = open(args.salida, 'w', newline='', encoding='utf-8') if args.salida else sys.stdout
+    registro_archivo = crear_registro_archivo(args.log_archivo) if args.log_archivo else None
+
+    def log(mensaje: str):
+        if args.verbose:
+            print(mensaje, file=sys.stderr)
+        if registro_archivo is not None:
+            registro_archivo.info(mensaje)
+
+    cache = CacheDatos(args.cache, args.cache_max_mb * 1024 ** 2) if args.cache else None
+    try:
+        escritor = EscritorMediciones(salida, args.formato)
+        if args.reanudar:
+            algoritmos = crear_algoritmos(list(funciones))
+            ejecutor = EjecutorSerie(algoritmos, funciones, log=log, al_medir=escritor, semilla=corrida['semilla'],
+                                     base=base, reanudar=corrida['id'], **opciones_ejecutor(corrida['opciones']))
+            ejecutor.ejecutar(tamanos, corrida['repeticiones'], corrida['caso'])
+            return 0
+        for caso in args.caso:
+            algoritmos = crear_algoritmos(list(funciones))
+            planificador = (PlanificadorComplejidad(args.presupuesto_celda, args.politica)
+                            if args.presupuesto_celda else None)
+            ejecutor = EjecutorSerie(algoritmos, funciones, log=log, al_medir=escritor,
+                                     trabajadores=args.trabajadores, fijar_cpu=args.fijar_cpu,
+                                     modo_medicion=args.modo, semilla=args.semilla, cache=cache,
+                                     verificacion=args.verificacion, fraccion_verificada=args.fraccion_verificada,
+                                     planificador=planificador, limite_tiempo=args.limite_tiempo,
+                                     contadores_hw=args.contadores_hw,
+                                     cronometro=Cronometro(args.calentamiento, args.tiempo_minimo, not args.con_gc),
+                                     memoria=args.memoria, entrada=args.entrada, base=base)
+            ejecutor.ejecutar(tamanos, args.repeticiones, caso)
+    except KeyboardInterrupt:
+        print("Ejecución interrumpida.", file=sys.stderr)
+        return 130
+    except BrokenPipeError:
+        # La salida se cerró antes de tiempo (ej: "| head"); se descarta el resto sin traza.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    finally:
+        if salida is not sys.stdout:
+            salida.close()
+        if registro_archivo is not None:
+            cerrar_registro_archivo(registro_archivo)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+Sonda de memoria de las ejecuciones.
+
+Mide dos cosas sobre una ejecución aparte, no cronometrada (tracemalloc hace
+más lenta cada asignación):
+- memoria_pico: pico de memoria asignada por Python durante la llamada
+  (tracemalloc), que refleja la copia arr.copy() y las estructuras auxiliares
+  como la pila explícita de Quick Sort.
+- memoria_rss: cuánto creció el pico de memoria residente del proceso (RSS)
+  respecto de la base tomada con la entrada ya cargada. El pico de RSS nunca
+  baja, así que solo es fiel en un proceso nuevo: EjecutorSerie lo garantiza
+  con un proceso trabajador por ejecución cuando la plataforma lo permite
+  (ver AISLAMIENTO_POR_EJECUCION).
+
+En plataformas sin el módulo resource (Windows) solo se informa memoria_pico.
+"""
+
+import os
+import sys
+import tracemalloc
+from typing import Callable, Dict, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+METRICAS_MEMORIA = ('memoria_pico', 'memoria_rss')
+
+ETIQUETAS_MEMORIA = {
+    'memoria_pico': "Pico de Memoria Python (bytes)",
+    'memoria_rss': "Incremento de RSS (bytes)",
+}
+
+# ProcessPoolExecutor(max_tasks_per_child=...) existe desde Python 3.11
+AISLAMIENTO_POR_EJECUCION = sys.version_info >= (3, 11)
+
+
+def rss_pico() -> Optional[int]:
+    """Pico de memoria residente del proceso en bytes, o None si no puede leerse."""
+    if resource is None:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss viene en KiB en Linux y en bytes en macOS
+    return pico if sys.platform == 'darwin' else pico * 1024
+
+def rss_actual() -> Optional[int]:
+    """Memoria residente actual en bytes (/proc en Linux; si no, el pico hasta ahora)."""
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        return rss_pico()
+
+def medir_memoria(llamada: Callable[[], object], rss_base: Optional[int] = None) -> Dict[str, int]:
+    """
+    Ejecuta la llamada con tracemalloc activo y devuelve {'memoria_pico': bytes}
+    y, si se indica rss_base (ver rss_actual), {'memoria_rss': bytes}.
+    """
+    ya_activo = tracemalloc.is_tracing()
+    if not ya_activo:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    inicial, _ = tracemalloc.get_traced_memory()
+    try:
+        llamada()
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        if not ya_activo:
+            tracemalloc.stop()
+    medicion = {'memoria_pico': pico - inicial}
+    pico_rss = rss_pico()
+    if rss_base is not None and pico_rss is not None:
+        medicion['memoria_rss'] = max(0, pico_rss - rss_base)
+    return medicion
@@ -0,0 +1,1501 @@
+# -*- coding: utf-8 -*-
+"""
+Núcleo del laboratorio: métricas, algoritmos de ordenamiento y generación de datos.
+
+Este módulo no depende de Tkinter, de modo que puede usarse tanto desde la
+interfaz gráfica (CDA_tarea.py) como desde la línea de comandos
+(laboratorio_cli.py) en equipos sin pantalla.
+"""
+
+import random
+import csv
+import math
+import operator
+import itertools
+import functools
+import hashlib
+import inspect
+import importlib.util
+import statistics
+from array import array
+from typing import Callable, List, Optional, Tuple, Dict
+
+class SerieMediciones:
+    """
+    Mediciones de un algoritmo para un tamaño, guardadas por columnas.
+
+    Los tiempos van en un array('d') y las instrucciones en un array('q'), de modo
+    que cada medición ocupa 16 bytes en lugar de una tupla con dos objetos. La media
+    y la varianza se mantienen en cada agregar() (algoritmo de Welford), por lo que
+    leerlas es O(1). Se comporta como la lista de tuplas (tiempo, instrucciones) que
+    reemplaza: admite len(), índices, rebanadas e iteración.
+    """
+    __slots__ = ('tiempos', 'instrucciones', '_media_tiempo', '_m2_tiempo', '_media_inst', '_m2_inst')
+
+    def __init__(self):
+        self.tiempos = array('d')
+        self.instrucciones = array('q')
+        self._media_tiempo = 0.0
+        self._m2_tiempo = 0.0
+        self._media_inst = 0.0
+        self._m2_inst = 0.0
+
+    def agregar(self, tiempo: float, instrucciones: int):
+        self.tiempos.append(tiempo)
+        self.instrucciones.append(instrucciones)
+        k = len(self.tiempos)
+        delta = tiempo - self._media_tiempo
+        self._media_tiempo += delta / k
+        self._m2_tiempo += delta * (tiempo - self._media_tiempo)
+        delta = instrucciones - self._media_inst
+        self._media_inst += delta / k
+        self._m2_inst += delta * (instrucciones - self._media_inst)
+
+    def media_tiempo(self) -> float:
+        return self._media_tiempo
+
+    def media_instrucciones(self) -> float:
+        return self._media_inst
+
+    def desviacion_estandar(self) -> Tuple[float, float]:
+        """Desviación estándar muestral de (tiempo, instrucciones); 0 con menos de dos mediciones."""
+        k = len(self.tiempos)
+        if k < 2:
+            return 0.0, 0.0
+        return math.sqrt(max(self._m2_tiempo, 0.0) / (k - 1)), math.sqrt(max(self._m2_inst, 0.0) / (k - 1))
+
+    def __len__(self) -> int:
+        return len(self.tiempos)
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return list(zip(self.tiempos[indice], self.instrucciones[indice]))
+        return self.tiempos[indice], self.instrucciones[indice]
+
+    def __iter__(self):
+        return zip(self.tiempos, self.instrucciones)
+
+    def __repr__(self) -> str:
+        return f"SerieMediciones({list(self)!r})"
+
+
+class SerieValores:
+    """Valores de una métrica adicional para un tamaño: array('d') con media y varianza incrementales."""
+    __slots__ = ('valores', '_media', '_m2')
+
+    def __init__(self):
+        self.valores = array('d')
+        self._media = 0.0
+        self._m2 = 0.0
+
+    def agregar(self, valor: float):
+        self.valores.append(valor)
+        delta = valor - self._media
+        self._media += delta / len(self.valores)
+        self._m2 += delta * (valor - self._media)
+
+    def media(self) -> float:
+        return self._media
+
+    def desviacion_estandar(self) -> float:
+        k = len(self.valores)
+        return math.sqrt(max(self._m2, 0.0) / (k - 1)) if k > 1 else 0.0
+
+    def __len__(self) -> int:
+        return len(self.valores)
+
+
+# Valor crítico t de Student (dos colas, 95%) por grados de libertad; más allá, la normal
+_T_STUDENT_95 = (12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+                 2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+                 2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042)
+
+def estadisticas_robustas(valores) -> Dict[str, float]:
+    """
+    Resumen robusto de una muestra: mediana, cuartiles, IQR, mínimo y la
+    semiamplitud del intervalo de confianza del 95% de la media (t de Student;
+    0 con menos de dos valores). Devuelve un dict vacío si no hay valores.
+    """
+    ordenados = sorted(valores)
+    k = len(ordenados)
+    if k == 0:
+        return {}
+    if k > 1:
+        q1, mediana, q3 = statistics.quantiles(ordenados, n=4, method='inclusive')
+        t = _T_STUDENT_95[k - 2] if k - 1 <= len(_T_STUDENT_95) else 1.960
+        ic95 = t * statistics.stdev(ordenados) / math.sqrt(k)
+    else:
+        q1 = mediana = q3 = ordenados[0]
+        ic95 = 0.0
+    return {'mediana': mediana, 'q1': q1, 'q3': q3, 'iqr': q3 - q1, 'minimo': ordenados[0],
+            'media': statistics.fmean(ordenados), 'ic95': ic95}
+
+
+class AlgoritmoOrdenamiento:
+    """
+    Clase base para almacenar las métricas de un algoritmo de ordenamiento.
+
+    Cada cambio en los datos incrementa version; las estadísticas derivadas
+    (promedios, series de los gráficos) se guardan junto a la versión con la que
+    se calcularon y solo se recalculan cuando esta cambia.
+    """
+    def __init__(self, nombre: str, color: str):
+        self.nombre = nombre
+        self.color = color
+        self.resultados = {}  # {tamanio: SerieMediciones} (secuencia de (tiempo, instrucciones))
+        self.extrapolados = {}  # {tamanio: (tiempo, instrucciones)} predichos sin ejecutar
+        self.tiempos_agotados = {}  # {tamanio: ejecuciones interrumpidas por superar el límite}
+        self.metricas_extra = {}  # {tamanio: {metrica: SerieValores}} (p. ej. contadores de hardware)
+        self.celdas_de_corridas = set()  # {(id de corrida, tamanio, repeticion)} ya incorporadas (ver aplicar_mediciones)
+        self.version = 0
+        self._cache_estadisticas = {}  # {clave: (version, valor)}
+
+    def _en_cache(self, clave, calcular: Callable):
+        """Valor de calcular() para la versión actual de los datos, recalculado solo si cambiaron."""
+        entrada = self._cache_estadisticas.get(clave)
+        if entrada is not None and entrada[0] == self.version:
+            return entrada[1]
+        # La versión se lee antes de calcular: si otro hilo agrega datos mientras tanto,
+        # el valor queda guardado como viejo y se recalcula en la próxima lectura
+        version = self.version
+        valor = calcular()
+        self._cache_estadisticas[clave] = (version, valor)
+        return valor
+
+    def agregar_metricas(self, tamanio: int, tiempo: float, instrucciones: int):
+        """Agrega métricas de una ejecución para un tamaño específico."""
+        if tamanio not in self.resultados:
+            self.resultados[tamanio] = SerieMediciones()
+        self.resultados[tamanio].agregar(tiempo, instrucciones)
+        self.version += 1
+
+    def obtener_promedios(self) -> List[Tuple[int, float, int]]:
+        """Devuelve una lista de (tamaño, tiempo_promedio, instrucciones_promedio) ordenada por tamaño."""
+        return list(self._en_cache('promedios', self._calcular_promedios))
+
+    def _calcular_promedios(self) -> Tuple[Tuple[int, float, int], ...]:
+        return tuple((tamanio, mediciones.media_tiempo(), int(mediciones.media_instrucciones()))
+                     for tamanio, mediciones in sorted(self.resultados.items()) if mediciones)
+
+    def agregar_metricas_extra(self, tamanio: int, metricas: Dict[str, float]):
+        """Agrega métricas adicionales de una ejecución ({nombre: valor})."""
+        series = self.metricas_extra.setdefault(tamanio, {})
+        for nombre, valor in metricas.items():
+            if nombre not in series:
+                series[nombre] = SerieValores()
+            series[nombre].agregar(valor)
+        self.version += 1
+
+    def metricas_disponibles(self) -> Tuple[str, ...]:
+        """Nombres de las métricas adicionales con al menos una medición."""
+        return self._en_cache('metricas', lambda: tuple(sorted({m for series in self.metricas_extra.values() for m in series})))
+
+    def obtener_serie(self, metrica: str) -> Tuple[Tuple[int, ...], Tuple[float, ...], Tuple[float, ...]]:
+        """
+        (tamaños, promedios, desviaciones) de 'tiempo', 'instrucciones' o una métrica
+        adicional, listos para graficar. Se calcula una vez por versión de los datos.
+        """
+        return self._en_cache(('serie', metrica), lambda: self._calcular_serie(metrica))
+
+    def _calcular_serie(self, metrica: str):
+        if metrica not in ('tiempo', 'instrucciones'):
+            filas = [(tamanio, series[metrica].media(), series[metrica].desviacion_estandar())
+                     for tamanio, series in sorted(self.metricas_extra.items()) if metrica in series]
+            return tuple(zip(*filas)) if filas else ((), (), ())
+        columna = 0 if metrica == 'tiempo' else 1
+        filas = [(tamanio, mediciones.media_tiempo() if columna == 0 else mediciones.media_instrucciones(),
+                  mediciones.desviacion_estandar()[columna])
+                 for tamanio, mediciones in sorted(self.resultados.items()) if mediciones]
+        if not filas:
+            return (), (), ()
+        tamanos, valores, desvios = zip(*filas)
+        return tamanos, valores, desvios
+
+    def obtener_desviacion_estandar(self, tamanio: int) -> Tuple[float, float]:
+        """Devuelve la desviación estándar de tiempo e instrucciones para un tamaño dado."""
+        if tamanio not in self.resultados:
+            return 0.0, 0.0
+        return self.resultados[tamanio].desviacion_estandar()
+
+    def obtener_estadisticas_robustas(self, tamanio: int) -> Dict[str, float]:
+        """estadisticas_robustas() de los tiempos medidos para un tamaño (vacío si no hay)."""
+        if tamanio not in self.resultados:
+            return {}
+        return self._en_cache(('robustas', tamanio), lambda: estadisticas_robustas(self.resultados[tamanio].tiempos))
+
+    def agregar_extrapolacion(self, tamanio: int, tiempo: float, instrucciones: float):
+        """Registra un punto predicho por el planificador en lugar de medido."""
+        self.extrapolados[tamanio] = (tiempo, int(instrucciones))
+        self.version += 1
+
+    def obtener_extrapolados(self) -> List[Tuple[int, float, int]]:
+        """Devuelve una lista de (tamaño, tiempo, instrucciones) extrapolados, ordenada por tamaño."""
+        return [(tamanio, tiempo, inst) for tamanio, (tiempo, inst) in sorted(self.extrapolados.items())]
+
+    def agregar_tiempo_agotado(self, tamanio: int):
+        """Registra una ejecución interrumpida por superar el límite de tiempo."""
+        self.tiempos_agotados[tamanio] = self.tiempos_agotados.get(tamanio, 0) + 1
+        self.version += 1
+
+    def limpiar_datos(self):
+        """Limpia todos los resultados almacenados."""
+        self.resultados.clear()
+        self.extrapolados.clear()
+        self.tiempos_agotados.clear()
+        self.metricas_extra.clear()
+        self.celdas_de_corridas.clear()
+        self.version += 1
+
+    def exportar_csv(self, filename: str):
+        """Exporta los promedios de las métricas a un archivo CSV."""
+        datos = self.obtener_promedios()
+        extras = self.metricas_disponibles()
+        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(['Tamaño', 'Tiempo Promedio (s)', 'Tiempo StdDev', 'Instrucciones Promedio', 'Instrucciones StdDev']
+                            + [f"{m} {c}" for m in extras for c in ('Promedio', 'StdDev')])
+            for tamanio, tiempo, instrucciones in datos:
+                std_tiempo, std_inst = self.obtener_desviacion_estandar(tamanio)
+                fila = [tamanio, tiempo, std_tiempo, instrucciones, std_inst]
+                series = self.metricas_extra.get(tamanio, {})
+                for m in extras:
+                    fila += [series[m].media(), series[m].desviacion_estandar()] if m in series else ['', '']
+                writer.writerow(fila)
+        return f"📊 Métricas de {self.nombre} exportadas a {filename}"
+
+# --- Desglose de operaciones ---
+
+# Operaciones elementales que se cuentan por separado, además del total de instrucciones
+OPERACIONES = ('comparaciones', 'intercambios', 'escrituras', 'lecturas', 'llamadas')
+ETIQUETAS_OPERACIONES = {
+    'comparaciones': "Comparaciones",
+    'intercambios': "Intercambios",
+    'escrituras': "Escrituras en el Array",
+    'lecturas': "Lecturas del Array",
+    'llamadas': "Llamadas Recursivas",
+}
+
+class ContadorOperaciones:
+    """
+    Desglose de las operaciones de una ejecución instrumentada.
+
+    - comparaciones: entre elementos del array (no las de índices).
+    - intercambios: swaps de dos posiciones (2 lecturas y 2 escrituras cada uno).
+    - escrituras / lecturas: accesos a posiciones del array; un desplazamiento de
+      Insertion Sort es una lectura y una escritura.
+    - llamadas: invocaciones de la rutina recursiva (heapify, partición de Quick
+      Sort), aunque estén implementadas con un bucle o una pila explícita.
+
+    Los algoritmos cuentan con variables locales y suman los totales una vez por
+    llamada con sumar(), así el costo dentro de los bucles internos es mínimo.
+    """
+    __slots__ = OPERACIONES
+
+    def __init__(self):
+        self.comparaciones = self.intercambios = self.escrituras = self.lecturas = self.llamadas = 0
+
+    def sumar(self, comparaciones: int = 0, intercambios: int = 0, escrituras: int = 0,
+              lecturas: int = 0, llamadas: int = 0):
+        self.comparaciones += comparaciones
+        self.intercambios += intercambios
+        self.escrituras += escrituras
+        self.lecturas += lecturas
+        self.llamadas += llamadas
+
+    def como_dict(self) -> Dict[str, int]:
+        return {nombre: getattr(self, nombre) for nombre in OPERACIONES}
+
+    def __repr__(self):
+        return f"ContadorOperaciones({', '.join(f'{k}={v}' for k, v in self.como_dict().items())})"
+
+@functools.lru_cache(maxsize=None)
+def admite_operaciones(func: Callable) -> bool:
+    """True si el algoritmo instrumentado acepta el parámetro 'operaciones' (ContadorOperaciones)."""
+    try:
+        return 'operaciones' in inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return False
+
+# --- Entradas tipadas ---
+# Además de listas, los algoritmos aceptan array('i') o un memoryview de enteros
+# (por ejemplo, el de la caché de datos): ocupan 4 bytes por elemento en lugar
+# de los ~36 de un int de Python más su referencia en la lista. Cada algoritmo
+# trabaja sobre su propia copia y la devuelve con el mismo tipo que recibió
+# (un memoryview se copia a un array('i')).
+
+def _copiar(arr):
+    """Copia la entrada: list.copy() o, para un buffer tipado, una única copia en bloque."""
+    if isinstance(arr, list):
+        return arr.copy()
+    vista = memoryview(arr)
+    copia = array(vista.format)
+    copia.frombytes(vista.cast('B'))
+    return copia
+
+def _nuevo_como(arr, n: int):
+    """Arreglo auxiliar de n ceros del mismo tipo que arr."""
+    if isinstance(arr, list):
+        return [0] * n
+    return array(arr.typecode, bytes(n * arr.itemsize))
+
+def _repetido_como(arr, valor: int, veces: int):
+    """valor repetido veces, del mismo tipo que arr (para asignar a un tramo)."""
+    if isinstance(arr, list):
+        return [valor] * veces
+    return array(arr.typecode, [valor]) * veces
+
+# --- Implementaciones de Algoritmos de Ordenamiento (conteo de instrucciones) ---
+# Todas aceptan un ContadorOperaciones opcional; el total de instrucciones no cambia.
+
+def bubble_sort(arr: List[int], operaciones: Optional[ContadorOperaciones] = None) -> Tuple[List[int], int]:
+    n = len(arr)
+    total_instrucciones = 0
+    intercambios = 0
+    arr_copy = _copiar(arr)
+    total_instrucciones += 1
+    for i in range(n):
+        total_instrucciones += 1
+        for j in range(0, n - i - 1):
+            total_instrucciones += 1
+            if arr_copy[j] > arr_copy[j + 1]:
+                total_instrucciones += 1
+                arr_copy[j], arr_copy[j + 1] = arr_copy[j + 1], arr_copy[j]
+                total_instrucciones += 1
+                intercambios += 1
+    if operaciones is not None:
+        comparaciones = n * (n - 1) // 2  # Sin corte temprano: todas las pasadas completas
+        operaciones.sumar(comparaciones, intercambios, 2 * intercambios, 2 * comparaciones + 2 * intercambios)
+    return arr_copy, total_instrucciones
+
+def heapify(arr: List[int], n: int, i: int, contador: int,
+            operaciones: Optional[ContadorOperaciones] = None) -> int:
+    # Sift-down iterativo: un nivel por vuelta, sin recursión
+    comparaciones = intercambios = 0
+    while True:
+        largest = i
+        left = 2 * i + 1
+        right = 2 * i + 2
+        contador += 3
+        if left < n:
+            comparaciones += 1
+            if arr[left] > arr[largest]:
+                largest = left
+                contador += 1
+        if right < n:
+            comparaciones += 1
+            if arr[right] > arr[largest]:
+                largest = right
+                contador += 1
+        if largest == i:
+            if operaciones is not None:
+                operaciones.sumar(comparaciones, intercambios, 2 * intercambios,
+                                  2 * comparaciones + 2 * intercambios, 1)
+            return contador
+        arr[i], arr[largest] = arr[largest], arr[i]
+        contador += 1
+        intercambios += 1
+        i = largest
+
+def heap_sort(arr: List[int], operaciones: Optional[ContadorOperaciones] = None) -> Tuple[List[int], int]:
+    n = len(arr)
+    total_instrucciones = 0
+    arr_copy = _copiar(arr)
+    for i in range(n // 2 - 1, -1, -1):
+        total_instrucciones += 1
+        total_instrucciones = heapify(arr_copy, n, i, total_instrucciones, operaciones)
+    for i in range(n - 1, 0, -1):
+        total_instrucciones += 1
+        arr_copy[0], arr_copy[i] = arr_copy[i], arr_copy[0]
+        total_instrucciones += 1
+        total_instrucciones = heapify(arr_copy, i, 0, total_instrucciones, operaciones)
+    if operaciones is not None and n > 1:
+        operaciones.sumar(intercambios=n - 1, escrituras=2 * (n - 1), lecturas=2 * (n - 1))  # Extracciones de la raíz
+    return arr_copy, total_instrucciones
+
+def _partition(arr: List[int], low: int, high: int,
+               operaciones: Optional[ContadorOperaciones] = None) -> Tuple[int, int]:
+    """Partición de Lomuto con pivote arr[high]. Devuelve (índice del pivote, instrucciones)."""
+    pivot = arr[high]
+    i = low - 1
+    contador = 2
+    intercambios = 1  # El que coloca el pivote al final
+    for j in range(low, high):
+        contador += 1
+        if arr[j] <= pivot:
+            contador += 1
+            i += 1
+            contador += 1
+            arr[i], arr[j] = arr[j], arr[i]
+            contador += 1
+            intercambios += 1
+    arr[i + 1], arr[high] = arr[high], arr[i + 1]
+    contador += 1
+    if operaciones is not None:
+        comparaciones = high - low
+        operaciones.sumar(comparaciones, intercambios, 2 * intercambios, 1 + comparaciones + 2 * intercambios, 1)
+    return i + 1, contador
+
+# Estrategias de elección de pivote para Quick Sort
+PIVOTES = ('ultimo', 'aleatorio', 'mediana_de_tres', 'ninther')
+UMBRAL_NINTHER = 40  # Por debajo de este tamaño de tramo el ninther usa mediana de tres
+
+def _mediana_de_tres(arr: List[int], a: int, b: int, c: int) -> Tuple[int, int]:
+    """Índice del valor mediano entre arr[a], arr[b] y arr[c], y comparaciones realizadas."""
+    if arr[a] < arr[b]:
+        if arr[b] < arr[c]:
+            return b, 2
+        if arr[a] < arr[c]:
+            return c, 3
+        return a, 3
+    if arr[a] < arr[c]:
+        return a, 2
+    if arr[b] < arr[c]:
+        return c, 3
+    return b, 3
+
+def _elegir_pivote(arr: List[int], low: int, high: int, pivote: str) -> Tuple[int, int]:
+    """Devuelve (índice del pivote, instrucciones) según la estrategia indicada."""
+    if pivote == 'ultimo':
+        return high, 0
+    if pivote == 'aleatorio':
+        return random.randint(low, high), 1
+    mid = (low + high) // 2
+    if pivote == 'ninther' and high - low >= UMBRAL_NINTHER:
+        # Ninther de Tukey: mediana de las medianas de tres grupos de tres muestras
+        paso = (high - low) // 8
+        m1, c1 = _mediana_de_tres(arr, low, low + paso, low + 2 * paso)
+        m2, c2 = _mediana_de_tres(arr, mid - paso, mid, mid + paso)
+        m3, c3 = _mediana_de_tres(arr, high - 2 * paso, high - paso, high)
+        m, c4 = _mediana_de_tres(arr, m1, m2, m3)
+        return m, c1 + c2 + c3 + c4
+    return _mediana_de_tres(arr, low, mid, high)
+
+def _heapify_tramo(arr: List[int], inicio: int, n: int, i: int, contador: int,
+                   operaciones: Optional[ContadorOperaciones] = None) -> int:
+    """heapify sobre el sub-array arr[inicio:inicio + n]."""
+    comparaciones = intercambios = 0
+    while True:
+        largest = i
+        left = 2 * i + 1
+        right = 2 * i + 2
+        contador += 3
+        if left < n:
+            comparaciones += 1
+            if arr[inicio + left] > arr[inicio + largest]:
+                largest = left
+                contador += 1
+        if right < n:
+            comparaciones += 1
+            if arr[inicio + right] > arr[inicio + largest]:
+                largest = right
+                contador += 1
+        if largest == i:
+            if operaciones is not None:
+                operaciones.sumar(comparaciones, intercambios, 2 * intercambios,
+                                  2 * comparaciones + 2 * intercambios, 1)
+            return contador
+        arr[inicio + i], arr[inicio + largest] = arr[inicio + largest], arr[inicio + i]
+        contador += 1
+        intercambios += 1
+        i = largest
+
+def _heap_sort_tramo(arr: List[int], low: int, high: int, contador: int,
+                     operaciones: Optional[ContadorOperaciones] = None) -> int:
+    """Heap Sort en el lugar del tramo arr[low..high] (respaldo de Introsort)."""
+    n = high - low + 1
+    for i in range(n // 2 - 1, -1, -1):
+        contador += 1
+        contador = _heapify_tramo(arr, low, n, i, contador, operaciones)
+    for i in range(n - 1, 0, -1):
+        contador += 1
+        arr[low], arr[low + i] = arr[low + i], arr[low]
+        contador += 1
+        contador = _heapify_tramo(arr, low, i, 0, contador, operaciones)
+    if operaciones is not None and n > 1:
+        operaciones.sumar(intercambios=n - 1, escrituras=2 * (n - 1), lecturas=2 * (n - 1))
+    return contador
+
+def _quick_sort_tramos(arr: List[int], pivote: str, limite_profundidad: int = None,
+                       operaciones: Optional[ContadorOperaciones] = None) -> int:
+    """
+    Ordena arr en el lugar y devuelve las instrucciones contadas.
+
+    Pila explícita en lugar de recursión: se apila la partición mayor y se sigue
+    con la menor, de modo que la pila nunca supera O(log n) tramos. Si se indica
+    limite_profundidad, los tramos que lo superan se terminan con Heap Sort.
+    """
+    total_instrucciones = 0
+    comparaciones_pivote = elecciones_pivote = 0
+    pila = [(0, len(arr) - 1, 0)]
+    while pila:
+        low, high, profundidad = pila.pop()
+        while low < high:
+            if limite_profundidad is not None and profundidad > limite_profundidad:
+                total_instrucciones = _heap_sort_tramo(arr, low, high, total_instrucciones, operaciones)
+                break
+            total_instrucciones += 1
+            if pivote != 'ultimo':
+                p, instrucciones = _elegir_pivote(arr, low, high, pivote)
+                arr[p], arr[high] = arr[high], arr[p]
+                total_instrucciones += instrucciones + 1
+                elecciones_pivote += 1
+                if pivote != 'aleatorio':
+                    comparaciones_pivote += instrucciones  # En las medianas, instrucciones = comparaciones
+            pi, instrucciones = _partition(arr, low, high, operaciones)
+            total_instrucciones += instrucciones + 1
+            profundidad += 1
+            if pi - low < high - pi:
+                pila.append((pi + 1, high, profundidad))
+                high = pi - 1
+            else:
+                pila.append((low, pi - 1, profundidad))
+                low = pi + 1
+    if operaciones is not None:
+        # Cada elección de pivote termina en un intercambio hacia arr[high]
+        operaciones.sumar(comparaciones_pivote, elecciones_pivote, 2 * elecciones_pivote,
+                          2 * comparaciones_pivote + 2 * elecciones_pivote)
+    return total_instrucciones
+
+def _limite_introsort(n: int) -> int:
+    return 2 * int(math.log2(n)) if n > 1 else 0
+
+def quick_sort(arr: List[int], operaciones: Optional[ContadorOperaciones] = None, *,
+               pivote: str = 'ultimo') -> Tuple[List[int], int]:
+    if pivote not in PIVOTES:
+        raise ValueError(f"Estrategia de pivote desconocida: '{pivote}'")
+    arr_copy = _copiar(arr)
+    return arr_copy, _quick_sort_tramos(arr_copy, pivote, operaciones=operaciones)
+
+def quick_sort_aleatorio(arr: List[int], operaciones: Optional[ContadorOperaciones] = None) -> Tuple[List[int], int]:
+    return quick_sort(arr, operaciones, pivote='aleatorio')
+
+def quick_sort_mediana_de_tres(arr: List[int], operaciones: Optional[ContadorOperaciones] = None) -> Tuple[List[int], int]:
+    return quick_sort(arr, operaciones, pivote='mediana_de_tres')
+
+def quick_sort_ninther(arr: List[int], operaciones: Optional[ContadorOperaciones] = None) -> Tuple[List[int], int]:
+    return quick_sort(arr, operaciones, pivote='ninther')
+
+def introsort(arr: List[int], operaciones: Optional[ContadorOperaciones] = None) -> Tuple[List[int], int]:
+    """Quick Sort con mediana de tres que pasa a Heap Sort al superar 2·log2(n) de profundidad."""
+    arr_copy = _copiar(arr)
+    return arr_copy, _quick_sort_tramos(arr_copy, 'mediana_de_tres', _limite_introsort(len(arr_copy)), operaciones)
+
+def insertion_sort(arr: List[int], operaciones: Optional[ContadorOperaciones] = None) -> Tuple[List[int], int]:
+    arr_copy = _copiar(arr)
+    total_instrucciones = 0
+    desplazamientos = cortes = 0
+    for i in range(1, len(arr_copy)):
+        total_instrucciones += 1
+        key = arr_copy[i]
+        total_instrucciones += 1
+        j = i - 1
+        total_instrucciones += 1
+        while j >= 0 and arr_copy[j] > key:
+            total_instrucciones += 2
+            arr_copy[j + 1] = arr_copy[j]
+            total_instrucciones += 1
+            j -= 1
+            total_instrucciones += 1
+            desplazamientos += 1
+        if j >= 0:
+            cortes += 1  # El bucle terminó por una comparación falsa, no por llegar al inicio
+        arr_copy[j + 1] = key
+        total_instrucciones += 1
+    if operaciones is not None:
+        colocaciones = max(len(arr_copy) - 1, 0)
+        comparaciones = desplazamientos + cortes
+        operaciones.sumar(comparaciones, 0, desplazamientos + colocaciones,
+                          colocaciones + comparaciones + desplazamientos)
+    return arr_copy, total_instrucciones
+
+# --- Ordenamientos por mezcla (Merge Sort) ---
+
+def _mezclar(arr: List[int], aux: List[int], low: int, mid: int, high: int,
+             operaciones: Optional[ContadorOperaciones] = None) -> int:
+    """
+    Mezcla en el lugar los tramos ordenados arr[low:mid] y arr[mid:high], usando
+    aux como copia. Es estable: ante un empate toma primero el del tramo izquierdo.
+    Devuelve las instrucciones contadas.
+    """
+    aux[low:high] = arr[low:high]
+    contador = 1
+    i, j, k = low, mid, low
+    contador += 1
+    while i < mid and j < high:
+        if aux[j] < aux[i]:
+            arr[k] = aux[j]
+            j += 1
+        else:
+            arr[k] = aux[i]
+            i += 1
+        contador += 3
+        k += 1
+    restantes = mid - i  # Lo que quede del tramo derecho ya está en su lugar
+    if restantes:
+        arr[k:high] = aux[i:mid]
+        contador += 1
+    if operaciones is not None:
+        comparaciones = k - low
+        n = high - low
+        operaciones.sumar(comparaciones, 0, n + comparaciones + restantes, n + 2 * comparaciones + restantes, 1)
+    return contador
+
+def _merge_sort_recursivo(arr: List[int], aux: List[int], low: int, high: int,
+                          operaciones: Optional[ContadorOperaciones] = None) -> int:
+    # La profundidad es log2(n): la recursión no corre riesgo con entradas grandes
+    if high - low < 2:
+        return 1
+    mid = (low + high) // 2
+    contador = 2
+    contador += _merge_sort_recursivo(arr, aux, low, mid, operaciones)
+    contador += _merge_sort_recursivo(arr, aux, mid, high, operaciones)
+    return contador + _mezclar(arr, aux, low, mid, high, operaciones)
+
+def merge_sort(arr: List[int], operaciones: Optional[ContadorOperaciones] = None) -> Tuple[List[int], int]:
+    """Merge Sort descendente (top-down): divide por la mitad, ordena cada mitad y las mezcla."""
+    arr_copy = _copiar(arr)
+    aux = _copiar(arr_copy)
+    return arr_copy, 2 + _merge_sort_recursivo(arr_copy, aux, 0, len(arr_copy), operaciones)
+
+def merge_sort_ascendente(arr: List[int], operaciones: Optional[ContadorOperaciones] = None) -> Tuple[List[int], int]:
+    """Merge Sort ascendente (bottom-up): mezcla tramos de 1, 2, 4, ... elementos, sin recursión."""
+    arr_copy = _copiar(arr)
+    n = len(arr_copy)
+    aux = _copiar(arr_copy)
+    total_instrucciones = 2
+    ancho = 1
+    while ancho < n:
+        total_instrucciones += 1
+        for low in range(0, n - ancho, 2 * ancho):
+            total_instrucciones += 1
+            total_instrucciones += _mezclar(arr_copy, aux, low, low + ancho, min(low + 2 * ancho, n), operaciones)
+        ancho *= 2
+    return arr_copy, total_instrucciones
+
+def _min_run(n: int) -> int:
+    """Largo mínimo de corrida de Timsort: entre 32 y 64, con n / min_run cerca de una potencia de 2."""
+    resto = 0
+    while n >= 64:
+        resto |= n & 1
+        n >>= 1
+    return n + resto
+
+def _corrida(arr: List[int], low: int, high: int) -> Tuple[int, int, int]:
+    """
+    Fin de la corrida ordenada que empieza en low, comparaciones hechas e
+    intercambios. Una corrida estrictamente descendente se invierte en el lugar
+    (estricta para no desordenar elementos iguales).
+    """
+    fin = low + 1
+    if fin == high:
+        return fin, 0, 0
+    intercambios = 0
+    if arr[fin] < arr[low]:
+        fin += 1
+        while fin < high and arr[fin] < arr[fin - 1]:
+            fin += 1
+        arr[low:fin] = arr[low:fin][::-1]
+        intercambios = (fin - low) // 2
+    else:
+        fin += 1
+        while fin < high and arr[fin] >= arr[fin - 1]:
+            fin += 1
+    return fin, fin - low - (fin == high), intercambios
+
+def _insercion_tramo(arr: List[int], low: int, inicio: int, high: int,
+                     operaciones: Optional[ContadorOperaciones] = None) -> int:
+    """Insertion Sort de arr[low:high] sabiendo que arr[low:inicio] ya está ordenado."""
+    contador = 0
+    comparaciones = desplazamientos = 0
+    for i in range(inicio, high):
+        contador += 1
+        key = arr[i]
+        j = i - 1
+        contador += 2
+        while j >= low:
+            comparaciones += 1
+            if arr[j] <= key:
+                break
+            arr[j + 1] = arr[j]
+            j -= 1
+            contador += 2
+            desplazamientos += 1
+        arr[j + 1] = key
+        contador += 1
+    if operaciones is not None:
+        colocaciones = high - inicio
+        operaciones.sumar(comparaciones, 0, desplazamientos + colocaciones,
+                          colocaciones + comparaciones + desplazamientos)
+    return contador
+
+def _mezclar_corridas(arr: List[int], aux: List[int], pila: List[Tuple[int, int]], i: int,
+                      operaciones: Optional[ContadorOperaciones] = None) -> int:
+    """Mezcla las corridas pila[i] y pila[i + 1] y las reemplaza por la corrida resultante."""
+    inicio, largo_a = pila[i]
+    largo_b = pila[i + 1][1]
+    pila[i] = (inicio, largo_a + largo_b)
+    del pila[i + 1]
+    return 2 + _mezclar(arr, aux, inicio, inicio + largo_a, inicio + largo_a + largo_b, operaciones)
+
+def _colapsar_pila(arr: List[int], aux: List[int], pila: List[Tuple[int, int]], forzar: bool,
+                   operaciones: Optional[ContadorOperaciones] = None) -> int:
+    """
+    Mezcla corridas de la pila hasta que se cumplan las invariantes de Timsort
+    (cada corrida más larga que la suma de las dos siguientes), o hasta dejar una
+    sola con forzar. Así las mezclas quedan balanceadas: O(n log n) en total.
+    """
+    contador = 0
+    while len(pila) > 1:
+        i = len(pila) - 2
+        contador += 1
+        if forzar:
+            if i > 0 and pila[i - 1][1] < pila[i + 1][1]:
+                i -= 1
+        elif (i > 0 and pila[i - 1][1] <= pila[i][1] + pila[i + 1][1]) or \
+                (i > 1 and pila[i - 2][1] <= pila[i - 1][1] + pila[i][1]):
+            if pila[i - 1][1] < pila[i + 1][1]:
+                i -= 1
+        elif pila[i][1] > pila[i + 1][1]:
+            break
+        contador += _mezclar_corridas(arr, aux, pila, i, operaciones)
+    return contador
+
+def merge_sort_natural(arr: List[int], operaciones: Optional[ContadorOperaciones] = None) -> Tuple[List[int], int]:
+    """
+    Merge Sort natural al estilo de Timsort: aprovecha las corridas ya ordenadas
+    (las descendentes se invierten), alarga las cortas hasta min_run con
+    Insertion Sort y las mezcla según las invariantes de la pila de Timsort.
+    Con datos ordenados o inversos es O(n).
+    """
+    arr_copy = _copiar(arr)
+    n = len(arr_copy)
+    aux = _copiar(arr_copy)
+    min_run = _min_run(n)
+    total_instrucciones = 3
+    comparaciones = invertidos = 0
+    pila = []  # Corridas pendientes de mezclar: (inicio, largo)
+    low = 0
+    while low < n:
+        fin, comparaciones_corrida, intercambios_corrida = _corrida(arr_copy, low, n)
+        total_instrucciones += fin - low + intercambios_corrida
+        comparaciones += comparaciones_corrida
+        invertidos += intercambios_corrida
+        forzado = min(low + min_run, n)
+        if fin < forzado:
+            total_instrucciones += _insercion_tramo(arr_copy, low, fin, forzado, operaciones)
+            fin = forzado
+        pila.append((low, fin - low))
+        total_instrucciones += 1 + _colapsar_pila(arr_copy, aux, pila, False, operaciones)
+        low = fin
+    total_instrucciones += _colapsar_pila(arr_copy, aux, pila, True, operaciones)
+    if operaciones is not None:
+        operaciones.sumar(comparaciones, invertidos, 2 * invertidos, 2 * comparaciones + 2 * invertidos)
+    return arr_copy, total_instrucciones
+
+# --- Ordenamientos de tiempo lineal (sin comparaciones entre elementos) ---
+# Aprovechan que los datos son enteros en un rango acotado (1..VALOR_MAXIMO en
+# los casos aleatorios); trabajan con valor - mínimo, así que admiten negativos.
+
+BITS_DIGITO_RADIX = 8  # Radix Sort en base 256: un byte por pasada
+
+def radix_sort(arr: List[int], operaciones: Optional[ContadorOperaciones] = None) -> Tuple[List[int], int]:
+    """
+    Radix Sort LSD en base 256: una pasada estable de conteo por cada byte de
+    valor - mínimo, del menos al más significativo. O(d·(n + 256)), con d los
+    bytes que ocupa el rango (3 para 1..100000).
+    """
+    arr_copy = _copiar(arr)
+    n = len(arr_copy)
+    total_instrucciones = 2
+    if n < 2:
+        return arr_copy, total_instrucciones
+    minimo = min(arr_copy)
+    maximo = max(arr_copy)
+    total_instrucciones += 2
+    base = 1 << BITS_DIGITO_RADIX
+    mascara = base - 1
+    origen, destino = arr_copy, _nuevo_como(arr_copy, n)
+    desplazamiento = pasadas = 0
+    while (maximo - minimo) >> desplazamiento:
+        conteos = [0] * base
+        total_instrucciones += 1
+        for x in origen:
+            conteos[((x - minimo) >> desplazamiento) & mascara] += 1
+            total_instrucciones += 1
+        acumulado = 0
+        for digito in range(base):
+            conteos[digito], acumulado = acumulado, acumulado + conteos[digito]
+            total_instrucciones += 1
+        for x in origen:
+            digito = ((x - minimo) >> desplazamiento) & mascara
+            destino[conteos[digito]] = x
+            conteos[digito] += 1
+            total_instrucciones += 3
+        origen, destino = destino, origen
+        desplazamiento += BITS_DIGITO_RADIX
+        pasadas += 1
+        total_instrucciones += 3
+    if origen is not arr_copy:
+        arr_copy[:] = origen
+        total_instrucciones += 1
+    if operaciones is not None:
+        # min() y max() comparan y leen cada elemento; cada pasada lee dos veces y escribe una
+        copias = n if pasadas % 2 else 0
+        operaciones.sumar(comparaciones=2 * (n - 1), escrituras=pasadas * n + copias,
+                          lecturas=2 * n + 2 * pasadas * n + copias)
+    return arr_copy, total_instrucciones
+
+def counting_sort(arr: List[int], operaciones: Optional[ContadorOperaciones] = None) -> Tuple[List[int], int]:
+    """
+    Counting Sort: cuenta cuántas veces aparece cada valor en max - min + 1
+    contadores y reescribe el array en orden. O(n + k), con k el rango de valores.
+    """
+    arr_copy = _copiar(arr)
+    n = len(arr_copy)
+    total_instrucciones = 2
+    if n < 2:
+        return arr_copy, total_instrucciones
+    minimo = min(arr_copy)
+    maximo = max(arr_copy)
+    conteos = [0] * (maximo - minimo + 1)
+    total_instrucciones += 3
+    for x in arr_copy:
+        conteos[x - minimo] += 1
+        total_instrucciones += 1
+    k = 0
+    for valor, veces in enumerate(conteos, minimo):
+        total_instrucciones += 1
+        for _ in range(veces):
+            arr_copy[k] = valor
+            k += 1
+            total_instrucciones += 2
+    if operaciones is not None:
+        operaciones.sumar(comparaciones=2 * (n - 1), escrituras=n, lecturas=3 * n)
+    return arr_copy, total_instrucciones
+
+# --- Versiones rápidas (sin contadores) para medir tiempo puro ---
+# Mismos algoritmos que arriba, sin la contabilidad de instrucciones en los bucles internos.
+
+def bubble_sort_rapido(arr: List[int]) -> List[int]:
+    n = len(arr)
+    arr_copy = _copiar(arr)
+    for i in range(n):
+        for j in range(0, n - i - 1):
+            if arr_copy[j] > arr_copy[j + 1]:
+                arr_copy[j], arr_copy[j + 1] = arr_copy[j + 1], arr_copy[j]
+    return arr_copy
+
+def _heapify_rapido(arr: List[int], n: int, i: int):
+    while True:
+        largest = i
+        left = 2 * i + 1
+        right = 2 * i + 2
+        if left < n and arr[left] > arr[largest]:
+            largest = left
+        if right < n and arr[right] > arr[largest]:
+            largest = right
+        if largest == i:
+            return
+        arr[i], arr[largest] = arr[largest], arr[i]
+        i = largest
+
+def heap_sort_rapido(arr: List[int]) -> List[int]:
+    n = len(arr)
+    arr_copy = _copiar(arr)
+    for i in range(n // 2 - 1, -1, -1):
+        _heapify_rapido(arr_copy, n, i)
+    for i in range(n - 1, 0, -1):
+        arr_copy[0], arr_copy[i] = arr_copy[i], arr_copy[0]
+        _heapify_rapido(arr_copy, i, 0)
+    return arr_copy
+
+def _partition_rapido(arr: List[int], low: int, high: int) -> int:
+    pivot = arr[high]
+    i = low - 1
+    for j in range(low, high):
+        if arr[j] <= pivot:
+            i += 1
+            arr[i], arr[j] = arr[j], arr[i]
+    arr[i + 1], arr[high] = arr[high], arr[i + 1]
+    return i + 1
+
+def _heapify_tramo_rapido(arr: List[int], inicio: int, n: int, i: int):
+    while True:
+        largest = i
+        left = 2 * i + 1
+        right = 2 * i + 2
+        if left < n and arr[inicio + left] > arr[inicio + largest]:
+            largest = left
+        if right < n and arr[inicio + right] > arr[inicio + largest]:
+            largest = right
+        if largest == i:
+            return
+        arr[inicio + i], arr[inicio + largest] = arr[inicio + largest], arr[inicio + i]
+        i = largest
+
+def _heap_sort_tramo_rapido(arr: List[int], low: int, high: int):
+    n = high - low + 1
+    for i in range(n // 2 - 1, -1, -1):
+        _heapify_tramo_rapido(arr, low, n, i)
+    for i in range(n - 1, 0, -1):
+        arr[low], arr[low + i] = arr[low + i], arr[low]
+        _heapify_tramo_rapido(arr, low, i, 0)
+
+def _quick_sort_tramos_rapido(arr: List[int], pivote: str, limite_profundidad: int = None):
+    pila = [(0, len(arr) - 1, 0)]
+    while pila:
+        low, high, profundidad = pila.pop()
+        while low < high:
+            if limite_profundidad is not None and profundidad > limite_profundidad:
+                _heap_sort_tramo_rapido(arr, low, high)
+                break
+            if pivote != 'ultimo':
+                p, _ = _elegir_pivote(arr, low, high, pivote)
+                arr[p], arr[high] = arr[high], arr[p]
+            pi = _partition_rapido(arr, low, high)
+            profundidad += 1
+            if pi - low < high - pi:
+                pila.append((pi + 1, high, profundidad))
+                high = pi - 1
+            else:
+                pila.append((low, pi - 1, profundidad))
+                low = pi + 1
+
+def quick_sort_rapido(arr: List[int], *, pivote: str = 'ultimo') -> List[int]:
+    if pivote not in PIVOTES:
+        raise ValueError(f"Estrategia de pivote desconocida: '{pivote}'")
+    arr_copy = _copiar(arr)
+    _quick_sort_tramos_rapido(arr_copy, pivote)
+    return arr_copy
+
+def quick_sort_aleatorio_rapido(arr: List[int]) -> List[int]:
+    return quick_sort_rapido(arr, pivote='aleatorio')
+
+def quick_sort_mediana_de_tres_rapido(arr: List[int]) -> List[int]:
+    return quick_sort_rapido(arr, pivote='mediana_de_tres')
+
+def quick_sort_ninther_rapido(arr: List[int]) -> List[int]:
+    return quick_sort_rapido(arr, pivote='ninther')
+
+def introsort_rapido(arr: List[int]) -> List[int]:
+    arr_copy = _copiar(arr)
+    _quick_sort_tramos_rapido(arr_copy, 'mediana_de_tres', _limite_introsort(len(arr_copy)))
+    return arr_copy
+
+def insertion_sort_rapido(arr: List[int]) -> List[int]:
+    arr_copy = _copiar(arr)
+    for i in range(1, len(arr_copy)):
+        key = arr_copy[i]
+        j = i - 1
+        while j >= 0 and arr_copy[j] > key:
+            arr_copy[j + 1] = arr_copy[j]
+            j -= 1
+        arr_copy[j + 1] = key
+    return arr_copy
+
+def _mezclar_rapido(arr: List[int], aux: List[int], low: int, mid: int, high: int):
+    aux[low:high] = arr[low:high]
+    i, j, k = low, mid, low
+    while i < mid and j < high:
+        if aux[j] < aux[i]:
+            arr[k] = aux[j]
+            j += 1
+        else:
+            arr[k] = aux[i]
+            i += 1
+        k += 1
+    if i < mid:
+        arr[k:high] = aux[i:mid]
+
+def _merge_sort_recursivo_rapido(arr: List[int], aux: List[int], low: int, high: int):
+    if high - low < 2:
+        return
+    mid = (low + high) // 2
+    _merge_sort_recursivo_rapido(arr, aux, low, mid)
+    _merge_sort_recursivo_rapido(arr, aux, mid, high)
+    _mezclar_rapido(arr, aux, low, mid, high)
+
+def merge_sort_rapido(arr: List[int]) -> List[int]:
+    arr_copy = _copiar(arr)
+    _merge_sort_recursivo_rapido(arr_copy, _copiar(arr_copy), 0, len(arr_copy))
+    return arr_copy
+
+def merge_sort_ascendente_rapido(arr: List[int]) -> List[int]:
+    arr_copy = _copiar(arr)
+    n = len(arr_copy)
+    aux = _copiar(arr_copy)
+    ancho = 1
+    while ancho < n:
+        for low in range(0, n - ancho, 2 * ancho):
+            _mezclar_rapido(arr_copy, aux, low, low + ancho, min(low + 2 * ancho, n))
+        ancho *= 2
+    return arr_copy
+
+def _insercion_tramo_rapido(arr: List[int], low: int, inicio: int, high: int):
+    for i in range(inicio, high):
+        key = arr[i]
+        j = i - 1
+        while j >= low and arr[j] > key:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = key
+
+def _colapsar_pila_rapido(arr: List[int], aux: List[int], pila: List[Tuple[int, int]], forzar: bool):
+    while len(pila) > 1:
+        i = len(pila) - 2
+        if forzar:
+            if i > 0 and pila[i - 1][1] < pila[i + 1][1]:
+                i -= 1
+        elif (i > 0 and pila[i - 1][1] <= pila[i][1] + pila[i + 1][1]) or \
+                (i > 1 and pila[i - 2][1] <= pila[i - 1][1] + pila[i][1]):
+            if pila[i - 1][1] < pila[i + 1][1]:
+                i -= 1
+        elif pila[i][1] > pila[i + 1][1]:
+            break
+        inicio, largo_a = pila[i]
+        largo_b = pila[i + 1][1]
+        pila[i] = (inicio, largo_a + largo_b)
+        del pila[i + 1]
+        _mezclar_rapido(arr, aux, inicio, inicio + largo_a, inicio + largo_a + largo_b)
+
+def merge_sort_natural_rapido(arr: List[int]) -> List[int]:
+    arr_copy = _copiar(arr)
+    n = len(arr_copy)
+    aux = _copiar(arr_copy)
+    min_run = _min_run(n)
+    pila = []
+    low = 0
+    while low < n:
+        fin, _, _ = _corrida(arr_copy, low, n)
+        forzado = min(low + min_run, n)
+        if fin < forzado:
+            _insercion_tramo_rapido(arr_copy, low, fin, forzado)
+            fin = forzado
+        pila.append((low, fin - low))
+        _colapsar_pila_rapido(arr_copy, aux, pila, False)
+        low = fin
+    _colapsar_pila_rapido(arr_copy, aux, pila, True)
+    return arr_copy
+
+def radix_sort_rapido(arr: List[int]) -> List[int]:
+    arr_copy = _copiar(arr)
+    n = len(arr_copy)
+    if n < 2:
+        return arr_copy
+    minimo = min(arr_copy)
+    rango = max(arr_copy) - minimo
+    base = 1 << BITS_DIGITO_RADIX
+    mascara = base - 1
+    origen, destino = arr_copy, _nuevo_como(arr_copy, n)
+    desplazamiento = 0
+    while rango >> desplazamiento:
+        conteos = [0] * base
+        digitos = [((x - minimo) >> desplazamiento) & mascara for x in origen]
+        for d in digitos:
+            conteos[d] += 1
+        conteos = list(itertools.accumulate(conteos, initial=0))
+        for x, d in zip(origen, digitos):
+            destino[conteos[d]] = x
+            conteos[d] += 1
+        origen, destino = destino, origen
+        desplazamiento += BITS_DIGITO_RADIX
+    if origen is not arr_copy:
+        arr_copy[:] = origen
+    return arr_copy
+
+def counting_sort_rapido(arr: List[int]) -> List[int]:
+    arr_copy = _copiar(arr)
+    if len(arr_copy) < 2:
+        return arr_copy
+    minimo = min(arr_copy)
+    conteos = [0] * (max(arr_copy) - minimo + 1)
+    for x in arr_copy:
+        conteos[x - minimo] += 1
+    k = 0
+    for valor, veces in enumerate(conteos, minimo):
+        if veces:
+            arr_copy[k:k + veces] = _repetido_como(arr_copy, valor, veces)
+            k += veces
+    return arr_copy
+
+# --- Líneas base en C ---
+# Ordenamientos de la biblioteca estándar y de NumPy, sin contadores (devuelven 0
+# instrucciones). Se miden por el mismo camino que los demás y sirven de
+# referencia para cuantificar el sobrecosto del intérprete en cada algoritmo.
+
+def linea_base_sorted(arr: List[int]) -> Tuple[List[int], int]:
+    """sorted() (Timsort en C)."""
+    return sorted(arr), 0
+
+def linea_base_list_sort(arr: List[int]) -> Tuple[List[int], int]:
+    """Copia a una lista + list.sort(): el mismo patrón que los algoritmos instrumentados."""
+    arr_copy = list(arr)
+    arr_copy.sort()
+    return arr_copy, 0
+
+def linea_base_sorted_sobre_array(arr: List[int]) -> Tuple[array, int]:
+    """sorted() con el resultado empaquetado en un array tipado: la línea base de --entrada array sin NumPy."""
+    tipo = 'i' if isinstance(arr, list) else memoryview(arr).format
+    return array(tipo, sorted(arr)), 0
+
+def _numpy_requerido():
+    np = _numpy()
+    if np is None:
+        raise RuntimeError("Las líneas base de NumPy requieren tener NumPy instalado.")
+    return np
+
+def _ordenar_numpy(arr, tipo: str):
+    """numpy.sort con el kind indicado; con una lista incluye convertirla a ndarray."""
+    np = _numpy_requerido()
+    return np.sort(np.asarray(arr), kind=tipo), 0
+
+def linea_base_numpy_quicksort(arr: List[int]):
+    """numpy.sort(kind='quicksort'): introsort en C."""
+    return _ordenar_numpy(arr, 'quicksort')
+
+def linea_base_numpy_mergesort(arr: List[int]):
+    """numpy.sort(kind='mergesort'): estable (Timsort o radix sort según el tipo)."""
+    return _ordenar_numpy(arr, 'mergesort')
+
+def linea_base_numpy_heapsort(arr: List[int]):
+    """numpy.sort(kind='heapsort')."""
+    return _ordenar_numpy(arr, 'heapsort')
+
+def linea_base_numpy_sobre_array(arr: List[int]) -> Tuple[array, int]:
+    """Empaqueta la entrada en un array('i') (4 bytes por elemento) y lo ordena en el lugar con NumPy, sin copiarlo."""
+    np = _numpy_requerido()
+    datos = array('i', arr) if isinstance(arr, list) else _copiar(arr)
+    np.frombuffer(datos, dtype=np.intc).sort()
+    return datos, 0
+
+def _como_lista(arr) -> List[int]:
+    """El resultado como lista: las líneas base pueden devolver ndarray o array('i')."""
+    return arr if isinstance(arr, list) else arr.tolist()
+
+def _como_secuencia(arr):
+    """Listas y buffers tipados tal cual; el resto (p. ej. ndarray) como lista de int de Python."""
+    return arr if isinstance(arr, (list, array, memoryview)) else arr.tolist()
+
+def _ordenado_como(arr):
+    """Copia ordenada de arr: lista para una lista, array tipado para un buffer tipado."""
+    if isinstance(arr, list):
+        return sorted(arr)
+    # La lista intermedia de sorted() es temporal; lo que se conserva son 4 bytes por elemento
+    return array(memoryview(arr).format, sorted(arr))
+
+def _igual_a(arr_ordenado, referencia) -> bool:
+    """Compara una salida con una referencia de _ordenado_como sin pasar un buffer tipado a lista."""
+    if isinstance(referencia, list):
+        return _como_lista(arr_ordenado) == referencia
+    if not (isinstance(arr_ordenado, array) and arr_ordenado.typecode == referencia.typecode):
+        try:
+            arr_ordenado = array(referencia.typecode, _como_secuencia(arr_ordenado))
+        except (OverflowError, TypeError):
+            return False  # Valores que no caben en el tipo de la entrada: no es la entrada ordenada
+    return arr_ordenado == referencia
+
+def verificar_ordenamiento(arr_original: List[int], arr_ordenado: List[int]) -> bool:
+    """Verifica que el array esté correctamente ordenado."""
+    return _igual_a(arr_ordenado, _ordenado_como(arr_original))
+
+# --- Verificación en tiempo lineal ---
+# 'completa' ordena la entrada en cada verificación (O(n log n) por algoritmo);
+# 'referencia' ordena una sola vez por entrada y compara; 'lineal' comprueba que
+# la salida sea no decreciente y que conserve la huella de la entrada, en O(n).
+
+MODOS_VERIFICACION = ('completa', 'referencia', 'lineal')
+
+def esta_ordenado(arr) -> bool:
+    """Comprueba en O(n) que arr sea no decreciente."""
+    return all(map(operator.le, arr, itertools.islice(arr, 1, None)))
+
+def huella_multiconjunto(arr, sal: Optional[int] = None) -> Tuple[int, int, int, int, int]:
+    """
+    Huella del multiconjunto de valores: (sal, longitud, suma, suma de cuadrados,
+    suma de hash((sal, valor))). No depende del orden. Las sumas de potencias solas
+    coinciden en multiconjuntos distintos ({1, 5, 6} y {2, 3, 7}); la suma de hashes
+    con una sal sorteada (o la de la huella de referencia, para comparar con ella)
+    no guarda relación aritmética con los valores, así que un error de ordenamiento
+    no la compensa.
+    """
+    if sal is None:
+        sal = random.SystemRandom().getrandbits(60)
+    # hash() de una tupla de int no cambia entre procesos (no depende de PYTHONHASHSEED)
+    suma_hashes = sum(map(hash, zip(itertools.repeat(sal), arr)))
+    return sal, len(arr), sum(arr), sum(map(operator.mul, arr, arr)), suma_hashes
+
+def huella_secuencia(arr) -> int:
+    """
+    Huella de la secuencia (depende del orden): permite comparar una salida con
+    la referencia ordenada sin transportar la referencia completa entre procesos.
+    Se calcula sobre los valores empaquetados como enteros de 8 bytes, así una
+    lista y un array tipado con los mismos valores tienen la misma huella, y con
+    hashlib, que a diferencia de hash() no cambia entre procesos.
+    """
+    try:
+        empaquetado = array('q', _como_secuencia(arr)).tobytes()
+    except OverflowError:  # Enteros de más de 8 bytes
+        empaquetado = repr(_como_lista(arr)).encode()
+    return int.from_bytes(hashlib.blake2b(empaquetado, digest_size=8).digest(), 'little')
+
+def preparar_verificacion(arr_original: List[int], modo: str):
+    """Calcula, una vez por entrada, la referencia que necesita el modo de verificación."""
+    if modo == 'referencia':
+        return _ordenado_como(arr_original)
+    if modo == 'lineal':
+        return huella_multiconjunto(arr_original)
+    if modo == 'completa':
+        return None
+    raise ValueError(f"Modo de verificación desconocido: '{modo}'")
+
+def verificar_con_referencia(arr_original: List[int], arr_ordenado: List[int], modo: str, referencia) -> bool:
+    """
+    Verifica arr_ordenado usando la referencia de preparar_verificacion. Con una
+    entrada tipada (entrada='array') nada se convierte a lista de int de Python.
+    """
+    arr_ordenado = _como_secuencia(arr_ordenado)
+    if modo == 'referencia':
+        if isinstance(referencia, int):  # Referencia resumida con huella_secuencia
+            return huella_secuencia(arr_ordenado) == referencia
+        return _igual_a(arr_ordenado, referencia)
+    if modo == 'lineal':
+        return esta_ordenado(arr_ordenado) and huella_multiconjunto(arr_ordenado, sal=referencia[0]) == referencia
+    return verificar_ordenamiento(arr_original, arr_ordenado)
+
+VALOR_MAXIMO = 100000  # Los datos aleatorios toman valores en 1..VALOR_MAXIMO
+
+FORMATOS_ARRAY = ('lista', 'array', 'numpy')
+MODOS_ENTRADA = ('lista', 'array')  # Tipo de entrada que reciben los algoritmos al medir (ver _copiar)
+
+_np = None
+
+def _numpy():
+    """Importa NumPy la primera vez que se necesita; devuelve None si no está instalado."""
+    global _np
+    if _np is None:
+        try:
+            import numpy
+            _np = numpy
+        except ImportError:
+            _np = False
+    return _np or None
+
+def numpy_disponible() -> bool:
+    return _numpy() is not None
+
+def generar_array_segun_caso(n: int, caso: str = 'aleatorio', semilla: int = None,
+                             formato: str = 'lista', usar_numpy: bool = None):
+    """
+    Genera arrays con diferentes características:
+    - 'aleatorio': Completamente aleatorio
+    - 'ordenado': Ya ordenado (mejor caso para algunos algoritmos)
+    - 'inverso': Ordenado inversamente (peor caso)
+    - 'casi_ordenado': 90% ordenado con algunos elementos fuera de lugar
+
+    Con semilla se obtiene siempre la misma entrada. formato elige el tipo
+    devuelto: 'lista' (list de int), 'array' (array.array('i')) o 'numpy'
+    (ndarray int32, requiere NumPy). Si NumPy está instalado se usa para
+    generar los datos de forma vectorizada (usar_numpy=False lo desactiva);
+    ambos motores producen secuencias distintas para una misma semilla.
+    """
+    if formato not in FORMATOS_ARRAY:
+        raise ValueError(f"Formato de array desconocido: '{formato}'")
+    np = _numpy() if usar_numpy is not False else None
+    if np is None:
+        if formato == 'numpy':
+            raise RuntimeError("El formato 'numpy' requiere tener NumPy instalado.")
+        arr = _generar_python(n, caso, semilla)
+        return array('i', arr) if formato == 'array' else arr
+
+    arr = _generar_numpy(np, n, caso, semilla)
+    if formato == 'numpy':
+        return arr
+    if formato == 'array':
+        datos = array('i')
+        datos.frombytes(arr.astype(np.intc, copy=False).tobytes())
+        return datos
+    return arr.tolist()
+
+def _generar_python(n: int, caso: str, semilla: int = None) -> List[int]:
+    rng = random.Random(semilla)
+    if caso == 'ordenado':
+        return list(range(1, n + 1))
+    elif caso == 'inverso':
+        return list(range(n, 0, -1))
+    elif caso == 'casi_ordenado':
+        arr = list(range(1, n + 1))
+        # Desordenar 10% de elementos
+        for _ in range(n // 10):
+            i, j = rng.randrange(n), rng.randrange(n)
+            arr[i], arr[j] = arr[j], arr[i]
+        return arr
+    # 'aleatorio' y cualquier caso desconocido
+    return rng.choices(range(1, VALOR_MAXIMO + 1), k=n)
+
+def _generar_numpy(np, n: int, caso: str, semilla: int = None):
+    rng = np.random.default_rng(semilla)
+    if caso == 'ordenado':
+        return np.arange(1, n + 1, dtype=np.int32)
+    elif caso == 'inverso':
+        return np.arange(n, 0, -1, dtype=np.int32)
+    elif caso == 'casi_ordenado':
+        arr = np.arange(1, n + 1, dtype=np.int32)
+        # Desordenar 10% de elementos: n//10 intercambios entre posiciones distintas
+        k = min(n // 10, n // 2)
+        if k:
+            posiciones = rng.choice(n, size=2 * k, replace=False)
+            i, j = posiciones[:k], posiciones[k:]
+            arr[i], arr[j] = arr[j], arr[i].copy()
+        return arr
+    return rng.integers(1, VALOR_MAXIMO + 1, size=n, dtype=np.int32)
+
+def parsear_serie_tamanos(serie_str: str) -> List[int]:
+    """
+    Convierte una serie de tamaños como "1000, 5k, 1m" en una lista de enteros.
+    Admite los sufijos 'k' (miles) y 'm' (millones). Lanza ValueError si la
+    serie está vacía o contiene tamaños no positivos.
+    """
+    if not serie_str or not serie_str.strip():
+        raise ValueError("La serie de tamaños no puede estar vacía.")
+
+    tamanos_str = serie_str.replace(' ', '').lower().split(',')
+    tamanos = []
+    for s in tamanos_str:
+        if 'm' in s:
+            tamanos.append(int(float(s.replace('m', '')) * 1_000_000))
+        elif 'k' in s:
+            tamanos.append(int(float(s.replace('k', '')) * 1_000))
+        else:
+            tamanos.append(int(s))
+
+    if any(n <= 0 for n in tamanos):
+        raise ValueError("Todos los tamaños deben ser mayores a 0.")
+    return tamanos
+
+# --- Registro de algoritmos disponibles ---
+
+FUNCIONES_ORDENAMIENTO = {
+    'Bubble Sort': bubble_sort, 'Insertion Sort': insertion_sort,
+    'Heap Sort': heap_sort, 'Quick Sort': quick_sort,
+    'Quick Sort (Aleatorio)': quick_sort_aleatorio,
+    'Quick Sort (Mediana de 3)': quick_sort_mediana_de_tres,
+    'Quick Sort (Ninther)': quick_sort_ninther,
+    'Introsort': introsort,
+    'Merge Sort': merge_sort,
+    'Merge Sort (Ascendente)': merge_sort_ascendente,
+    'Merge Sort (Natural)': merge_sort_natural,
+    'Radix Sort': radix_sort,
+    'Counting Sort': counting_sort
+}
+
+# Gemelos sin instrumentar: en el modo de medición 'separado' se cronometran estos
+# y las instrucciones se obtienen de una ejecución aparte de la versión instrumentada.
+FUNCIONES_RAPIDAS = {
+    'Bubble Sort': bubble_sort_rapido, 'Insertion Sort': insertion_sort_rapido,
+    'Heap Sort': heap_sort_rapido, 'Quick Sort': quick_sort_rapido,
+    'Quick Sort (Aleatorio)': quick_sort_aleatorio_rapido,
+    'Quick Sort (Mediana de 3)': quick_sort_mediana_de_tres_rapido,
+    'Quick Sort (Ninther)': quick_sort_ninther_rapido,
+    'Introsort': introsort_rapido,
+    'Merge Sort': merge_sort_rapido,
+    'Merge Sort (Ascendente)': merge_sort_ascendente_rapido,
+    'Merge Sort (Natural)': merge_sort_natural_rapido,
+    'Radix Sort': radix_sort_rapido,
+    'Counting Sort': counting_sort_rapido
+}
+
+# Complejidad esperada (caso promedio), usada para estimar costos antes de medir
+COMPLEJIDADES_ALGORITMOS = {
+    'Bubble Sort': 'n^2', 'Insertion Sort': 'n^2',
+    'Heap Sort': 'n log n', 'Quick Sort': 'n log n',
+    'Quick Sort (Aleatorio)': 'n log n',
+    'Quick Sort (Mediana de 3)': 'n log n',
+    'Quick Sort (Ninther)': 'n log n',
+    'Introsort': 'n log n',
+    'Merge Sort': 'n log n',
+    'Merge Sort (Ascendente)': 'n log n',
+    'Merge Sort (Natural)': 'n log n',
+    'Radix Sort': 'n',
+    'Counting Sort': 'n'
+}
+
+COLORES_ALGORITMOS = {
+    'Bubble Sort': '#e55353',
+    'Insertion Sort': '#f9b115',
+    'Heap Sort': '#3399ff',
+    'Quick Sort': '#2eb85c',
+    'Quick Sort (Aleatorio)': '#20c997',
+    'Quick Sort (Mediana de 3)': '#6f42c1',
+    'Quick Sort (Ninther)': '#e83e8c',
+    'Introsort': '#17a2b8',
+    'Merge Sort': '#fd7e14',
+    'Merge Sort (Ascendente)': '#b35900',
+    'Merge Sort (Natural)': '#795548',
+    'Radix Sort': '#6c757d',
+    'Counting Sort': '#8bc34a'
+}
+
+# Las líneas base se registran aparte; las de NumPy, solo si está instalado (sin importarlo aún)
+LINEAS_BASE_NUMPY = {
+    'NumPy (quicksort)': linea_base_numpy_quicksort,
+    'NumPy (mergesort)': linea_base_numpy_mergesort,
+    'NumPy (heapsort)': linea_base_numpy_heapsort,
+    'NumPy sobre array': linea_base_numpy_sobre_array,
+} if importlib.util.find_spec('numpy') is not None else {}
+LINEAS_BASE = {
+    'sorted()': linea_base_sorted,
+    'list.sort()': linea_base_list_sort,
+    'sorted() sobre array': linea_base_sorted_sobre_array,
+    **LINEAS_BASE_NUMPY,
+}
+LINEA_BASE_REFERENCIA = 'sorted()'  # Contra la que se calcula el factor del resumen estadístico
+
+FUNCIONES_ORDENAMIENTO.update(LINEAS_BASE)
+COMPLEJIDADES_ALGORITMOS.update(dict.fromkeys(LINEAS_BASE, 'n log n'))
+COLORES_ALGORITMOS.update({
+    'sorted()': '#000000',
+    'list.sort()': '#495057',
+    'sorted() sobre array': '#868e96',
+    'NumPy (quicksort)': '#1d3557',
+    'NumPy (mergesort)': '#2a6f97',
+    'NumPy (heapsort)': '#5a7d9a',
+    'NumPy sobre array': '#5c4d7d',
+})
+
+COMPLEJIDADES = ('n', 'n log n', 'n^2')  # Las que entiende planificador.costo_teorico
+
+def registrar_algoritmo(nombre: str, color: str, complejidad: str = 'n log n',
+                        rapida: Optional[Callable] = None) -> Callable[[Callable], Callable]:
+    """
+    Decorador que agrega un algoritmo instrumentado al registro, con su color y
+    su complejidad esperada; rapida es su gemelo sin contadores (opcional). La
+    función sigue el mismo contrato que las de este módulo: recibe la lista (y,
+    si quiere el desglose, operaciones), no la modifica y devuelve
+    (arr_ordenado, instrucciones). Ver plugins.py para cargarlos desde otros paquetes.
+
+        @registrar_algoritmo('Shell Sort', '#ff9800', 'n log n')
+        def shell_sort(arr, operaciones=None): ...
+    """
+    if complejidad not in COMPLEJIDADES:
+        raise ValueError(f"Complejidad desconocida: '{complejidad}' (use una de {', '.join(COMPLEJIDADES)})")
+
+    def decorador(func: Callable) -> Callable:
+        if FUNCIONES_ORDENAMIENTO.get(nombre, func) is not func:
+            raise ValueError(f"Ya hay un algoritmo registrado con el nombre '{nombre}'")
+        FUNCIONES_ORDENAMIENTO[nombre] = func
+        COLORES_ALGORITMOS[nombre] = color
+        COMPLEJIDADES_ALGORITMOS[nombre] = complejidad
+        if rapida is not None:
+            FUNCIONES_RAPIDAS[nombre] = rapida
+        return func
+    return decorador
+
+CASOS_DATOS = ('aleatorio', 'ordenado', 'inverso', 'casi_ordenado')
+
+MODOS_MEDICION = ('instrumentado', 'separado')
+
+def crear_algoritmos(nombres: List[str] = None) -> Dict[str, AlgoritmoOrdenamiento]:
+    """Crea los contenedores de métricas para los algoritmos indicados (todos por defecto)."""
+    if nombres is None:
+        nombres = list(FUNCIONES_ORDENAMIENTO)
+    return {nombre: AlgoritmoOrdenamiento(nombre, COLORES_ALGORITMOS[nombre]) for nombre in nombres}
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+Planificador consciente de la complejidad.
+
+Antes de ejecutar un tamaño n, estima cuánto tardará cada algoritmo a partir de
+los tamaños menores ya medidos en AlgoritmoOrdenamiento.resultados, ajustando un
+modelo de crecimiento t(n) = a·n^b. Las celdas cuya predicción supera el
+presupuesto por celda se omiten o se extrapolan según la política elegida, o
+bien se ejecutan con el presupuesto como límite de tiempo ('limitar').
+"""
+
+import math
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ordenamiento import AlgoritmoOrdenamiento, COMPLEJIDADES_ALGORITMOS
+
+POLITICAS = ('omitir', 'extrapolar', 'limitar')
+
+# Límites del exponente ajustado, para que dos mediciones ruidosas no disparen la predicción
+EXPONENTE_MINIMO, EXPONENTE_MAXIMO = 0.5, 3.0
+PUNTOS_AJUSTE = 4  # Se ajusta con los tamaños medidos más grandes
+
+
+def costo_teorico(complejidad: str, n: int) -> float:
+    """Costo relativo según la complejidad esperada ('n', 'n log n' o 'n^2')."""
+    if complejidad == 'n^2':
+        return float(n) * n
+    if complejidad == 'n log n':
+        return n * math.log2(n) if n > 1 else 1.0
+    return float(n)
+
+
+def ajustar_modelo(puntos: List[Tuple[int, float]], complejidad: str = 'n log n') -> Optional[Callable[[int], float]]:
+    """
+    Ajusta un modelo de crecimiento a los puntos (n, valor) y devuelve la función
+    predictora, o None si no hay datos. Con un solo punto se escala según la
+    complejidad teórica; con dos o más se ajusta a·n^b por mínimos cuadrados en
+    escala log-log.
+    """
+    puntos = sorted((n, v) for n, v in puntos if n > 0 and v > 0)[-PUNTOS_AJUSTE:]
+    if not puntos:
+        return None
+    if len(puntos) == 1:
+        n0, v0 = puntos[0]
+        base = costo_teorico(complejidad, n0)
+        return lambda n: v0 * costo_teorico(complejidad, n) / base
+
+    xs = [math.log(n) for n, _ in puntos]
+    ys = [math.log(v) for _, v in puntos]
+    media_x = sum(xs) / len(xs)
+    media_y = sum(ys) / len(ys)
+    var_x = sum((x - media_x) ** 2 for x in xs)
+    if var_x == 0:
+        return ajustar_modelo(puntos[-1:], complejidad)
+    b = sum((x - media_x) * (y - media_y) for x, y in zip(xs, ys)) / var_x
+    b = min(max(b, EXPONENTE_MINIMO), EXPONENTE_MAXIMO)
+    a = media_y - b * media_x
+    return lambda n: math.exp(a + b * math.log(n))
+
+
+class PlanificadorComplejidad:
+    """
+    Decide, para cada (algoritmo, n), si la celda se ejecuta.
+
+    - presupuesto: segundos máximos estimados por ejecución individual.
+    - politica: 'omitir' descarta la celda; 'extrapolar' además registra el
+      valor predicho como punto extrapolado del algoritmo; 'limitar' ejecuta
+      todas las celdas con el presupuesto como límite de tiempo real, de modo
+      que una predicción pesimista no descarta mediciones posibles.
+    """
+    def __init__(self, presupuesto: float, politica: str = 'omitir',
+                 complejidades: Optional[Dict[str, str]] = None):
+        if politica not in POLITICAS:
+            raise ValueError(f"Política desconocida: '{politica}'")
+        if presupuesto <= 0:
+            raise ValueError("El presupuesto por celda debe ser mayor a 0.")
+        self.presupuesto = presupuesto
+        self.politica = politica
+        self.complejidades = COMPLEJIDADES_ALGORITMOS if complejidades is None else complejidades
+
+    def predecir(self, alg: AlgoritmoOrdenamiento, n: int) -> Optional[Tuple[float, float]]:
+        """(tiempo, instrucciones) estimados para n a partir de los tamaños menores medidos."""
+        promedios = [p for p in alg.obtener_promedios() if p[0] < n]
+        complejidad = self.complejidades.get(alg.nombre, 'n log n')
+        modelo_tiempo = ajustar_modelo([(t, tiempo) for t, tiempo, _ in promedios], complejidad)
+        if modelo_tiempo is None:
+            return None
+        modelo_inst = ajustar_modelo([(t, inst) for t, _, inst in promedios], complejidad)
+        return modelo_tiempo(n), (modelo_inst(n) if modelo_inst else 0.0)
+
+    def excede_presupuesto(self, prediccion: Optional[Tuple[float, float]]) -> bool:
+        if self.politica == 'limitar':
+            return False  # La celda se ejecuta igual; el límite de tiempo la interrumpe si hace falta
+        return prediccion is not None and prediccion[0] > self.presupuesto
+
+    def limite_por_celda(self) -> Optional[float]:
+        """Límite de tiempo real por ejecución que impone la política, o None."""
+        return self.presupuesto if self.politica == 'limitar' else None
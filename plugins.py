@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""
+Algoritmos externos (plugins).
+
+Un paquete instalado publica sus algoritmos con un entry point en el grupo
+GRUPO_ENTRY_POINTS, cuyo valor es el módulo que los registra con
+ordenamiento.registrar_algoritmo al importarse:
+
+    [project.entry-points."laboratorio_ordenamiento.algoritmos"]
+    kernels_internos = "kernels_internos.ordenamiento"
+
+La búsqueda solo lee los metadatos de los paquetes: nada se importa hasta que
+cargar_plugins() recibe el nombre del plugin. También se admite el nombre de un
+módulo importable (por ejemplo, un archivo .py en el directorio actual), sin
+empaquetarlo.
+"""
+
+import importlib
+import os
+from importlib.metadata import entry_points
+from typing import Dict, Iterable, List
+
+from ordenamiento import FUNCIONES_ORDENAMIENTO
+
+GRUPO_ENTRY_POINTS = 'laboratorio_ordenamiento.algoritmos'
+VARIABLE_ENTORNO = 'LABORATORIO_PLUGINS'  # Plugins a cargar, separados por comas
+
+
+def _entry_points():
+    try:
+        return entry_points(group=GRUPO_ENTRY_POINTS)
+    except TypeError:  # Python < 3.10: entry_points() devuelve un dict por grupo
+        return entry_points().get(GRUPO_ENTRY_POINTS, [])
+
+def plugins_disponibles() -> Dict[str, str]:
+    """{nombre: módulo} de los plugins instalados, sin importarlos."""
+    return {ep.name: ep.value for ep in _entry_points()}
+
+def plugins_de_entorno() -> List[str]:
+    """Plugins pedidos en la variable de entorno LABORATORIO_PLUGINS."""
+    return [nombre.strip() for nombre in os.environ.get(VARIABLE_ENTORNO, '').split(',') if nombre.strip()]
+
+def cargar_plugins(nombres: Iterable[str]) -> List[str]:
+    """
+    Importa solo los plugins indicados (nombre de entry point o de módulo) y
+    devuelve los nombres de los algoritmos que registraron. Lanza ValueError si
+    alguno no existe o falla al importarse.
+    """
+    instalados = {ep.name: ep for ep in _entry_points()}
+    previos = set(FUNCIONES_ORDENAMIENTO)
+    for nombre in nombres:
+        try:
+            if nombre in instalados:
+                instalados[nombre].load()
+            else:
+                importlib.import_module(nombre)
+        except Exception as e:
+            raise ValueError(f"No se pudo cargar el plugin '{nombre}': {e}") from e
+    return [nombre for nombre in FUNCIONES_ORDENAMIENTO if nombre not in previos]
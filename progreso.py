@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""
+Estimación del avance de una serie ponderado por costo.
+
+Cada celda (algoritmo, tamaño) pesa lo que se espera que tarde: el promedio ya
+medido para ese tamaño si existe, si no la predicción del modelo de crecimiento
+ajustado a los demás tamaños del algoritmo (planificador.ajustar_modelo), y
+como último recurso su costo teórico según la complejidad, convertido a segundos
+con la relación tiempo/costo observada en los demás algoritmos. Así un Bubble
+Sort con n = 50k pesa lo que corresponde frente a un Heap Sort con n = 1k.
+
+El tiempo restante (ETA) corrige la predicción con la relación entre el tiempo
+real transcurrido y el predicho para las celdas ya terminadas, lo que absorbe
+tanto el error del modelo como el efecto de los procesos en paralelo.
+"""
+
+import time
+from collections import Counter
+from typing import Dict, Iterable, Optional, Tuple
+
+from ordenamiento import AlgoritmoOrdenamiento, COMPLEJIDADES_ALGORITMOS
+from planificador import ajustar_modelo, costo_teorico
+
+SEGUNDOS_POR_UNIDAD = 1e-7  # Costo de una operación elemental en Python, antes de tener mediciones
+
+
+def formatear_duracion(segundos: Optional[float]) -> str:
+    """'1h 02m', '3m 05s' o '12s'; '--' si no hay estimación."""
+    if segundos is None:
+        return '--'
+    segundos = int(round(segundos))
+    if segundos >= 3600:
+        return f"{segundos // 3600}h {segundos % 3600 // 60:02d}m"
+    if segundos >= 60:
+        return f"{segundos // 60}m {segundos % 60:02d}s"
+    return f"{segundos}s"
+
+
+class EstimadorProgreso:
+    """
+    Lleva el avance de una serie celda a celda.
+
+    planificar() recibe las celdas pendientes (una entrada (algoritmo, n) por
+    repetición); completar() marca una como terminada u omitida; descartar()
+    da por omitidas de una vez las que un algoritmo ya no va a ejecutar; reestimar()
+    recalcula el costo de las pendientes con las mediciones nuevas; estado()
+    devuelve el avance ponderado, el ETA y el ritmo en celdas por segundo.
+    Con limite (segundos por ejecución) ninguna celda se estima por encima de él.
+    """
+    def __init__(self, algoritmos: Dict[str, AlgoritmoOrdenamiento],
+                 complejidades: Optional[Dict[str, str]] = None, paralelismo: int = 1,
+                 limite: Optional[float] = None):
+        self.algoritmos = algoritmos
+        self.complejidades = COMPLEJIDADES_ALGORITMOS if complejidades is None else complejidades
+        self.paralelismo = max(1, paralelismo)
+        self.limite = limite
+        self.planificar(())
+
+    def planificar(self, celdas: Iterable[Tuple[str, int]]):
+        self._pendientes = Counter(celdas)
+        self.total = sum(self._pendientes.values())
+        self.completadas = 0
+        self._ejecutadas = 0
+        self._predicho_completado = 0.0
+        self._inicio = time.perf_counter()
+        self.reestimar()
+
+    def reestimar(self):
+        escala = self._segundos_por_unidad()
+        self._costos = {celda: self._costo(*celda, escala) for celda in self._pendientes}
+        if self.limite is not None:
+            self._costos = {celda: min(costo, self.limite) for celda, costo in self._costos.items()}
+        self._restante = sum(self._costos[celda] * k for celda, k in self._pendientes.items())
+
+    def completar(self, nombre: str, n: int, ejecutada: bool = True, limite: Optional[float] = None):
+        """
+        Marca una celda como terminada. Las omitidas (ejecutada=False) no cuentan
+        para la corrección del ETA; las interrumpidas por límite de tiempo cuentan
+        como si hubieran costado ese límite.
+        """
+        celda = (nombre, n)
+        if self._pendientes[celda] <= 0:
+            return
+        self._pendientes[celda] -= 1
+        costo = self._costos.get(celda, 0.0)
+        self._restante = max(self._restante - costo, 0.0)
+        self.completadas += 1
+        if ejecutada:
+            self._ejecutadas += 1
+            self._predicho_completado += costo if limite is None else min(costo, limite)
+
+    def descartar(self, nombre: str, desde_n: int):
+        """
+        Da por omitidas, con costo cero, las celdas pendientes de nombre con
+        tamaño mayor que desde_n: las de un algoritmo excluido dejan de pesar en
+        el ETA y en el avance. Las llamadas posteriores a completar() para esas
+        celdas no tienen efecto.
+        """
+        for celda, k in self._pendientes.items():
+            if celda[0] == nombre and celda[1] > desde_n and k > 0:
+                self._restante = max(self._restante - self._costos.get(celda, 0.0) * k, 0.0)
+                self.completadas += k
+                self._pendientes[celda] = 0
+
+    def estado(self) -> dict:
+        transcurrido = time.perf_counter() - self._inicio
+        if self._predicho_completado > 0:
+            correccion = transcurrido / self._predicho_completado
+        else:
+            correccion = 1.0 / self.paralelismo
+        total_predicho = self._predicho_completado + self._restante
+        return {
+            'completadas': self.completadas,
+            'total': self.total,
+            'fraccion': self._predicho_completado / total_predicho if total_predicho > 0 else 1.0,
+            'eta': self._restante * correccion if self.completadas < self.total else 0.0,
+            'celdas_por_segundo': self._ejecutadas / transcurrido if transcurrido > 0 else 0.0,
+            'transcurrido': transcurrido,
+        }
+
+    def _costo(self, nombre: str, n: int, escala: float) -> float:
+        alg = self.algoritmos.get(nombre)
+        complejidad = self.complejidades.get(nombre, 'n log n')
+        if alg is not None:
+            if n in alg.resultados and len(alg.resultados[n]):
+                return alg.resultados[n].media_tiempo()
+            modelo = ajustar_modelo([(t, tiempo) for t, tiempo, _ in alg.obtener_promedios()], complejidad)
+            if modelo is not None:
+                return modelo(n)
+        return costo_teorico(complejidad, n) * escala
+
+    def _segundos_por_unidad(self) -> float:
+        """Segundos por unidad de costo teórico observados en los algoritmos ya medidos (mediana)."""
+        relaciones = []
+        for nombre, alg in self.algoritmos.items():
+            promedios = alg.obtener_promedios()
+            if promedios:
+                n, tiempo, _ = promedios[-1]
+                relaciones.append(tiempo / costo_teorico(self.complejidades.get(nombre, 'n log n'), n))
+        if not relaciones:
+            return SEGUNDOS_POR_UNIDAD
+        relaciones.sort()
+        return relaciones[len(relaciones) // 2]
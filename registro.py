@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+Canal del log de ejecución.
+
+Los mensajes se encolan desde cualquier hilo y quien los muestra (la interfaz
+gráfica) los retira por lotes a intervalos fijos, en lugar de programar una
+actualización por mensaje. Opcionalmente cada mensaje se copia a un archivo de
+log rotativo (logging.handlers.RotatingFileHandler). No importa Tkinter.
+"""
+
+import logging
+import logging.handlers
+import queue
+import time
+from typing import List, Optional
+
+ARCHIVO_LOG_POR_DEFECTO = 'laboratorio.log'
+TAMANO_MAXIMO_LOG = 5 * 1024 ** 2  # 5 MiB por archivo
+COPIAS_LOG = 3  # laboratorio.log.1 ... laboratorio.log.3
+
+
+def crear_registro_archivo(ruta: str, tamano_maximo: int = TAMANO_MAXIMO_LOG,
+                           copias: int = COPIAS_LOG) -> logging.Logger:
+    """Logger que escribe en un archivo rotativo; no propaga a la configuración global de logging."""
+    registro = logging.getLogger(f'laboratorio_ordenamiento.{ruta}')
+    registro.setLevel(logging.INFO)
+    registro.propagate = False
+    if not registro.handlers:
+        manejador = logging.handlers.RotatingFileHandler(ruta, maxBytes=tamano_maximo,
+                                                         backupCount=copias, encoding='utf-8')
+        manejador.setFormatter(logging.Formatter('%(asctime)s %(message)s'))
+        registro.addHandler(manejador)
+    return registro
+
+
+def cerrar_registro_archivo(registro: logging.Logger):
+    for manejador in list(registro.handlers):
+        registro.removeHandler(manejador)
+        manejador.close()
+
+
+class ColaLog:
+    """
+    Cola de mensajes de log segura entre hilos.
+
+    Llamarla con un mensaje lo encola con su hora; extraer() devuelve los
+    pendientes (hasta un máximo por lote) ya formateados como líneas.
+    """
+    def __init__(self, archivo: Optional[str] = None):
+        self._cola = queue.SimpleQueue()
+        self._registro = None
+        self.configurar_archivo(archivo)
+
+    def configurar_archivo(self, archivo: Optional[str]):
+        """Activa (ruta) o desactiva (None) la copia de los mensajes a un archivo rotativo."""
+        if self._registro is not None:
+            cerrar_registro_archivo(self._registro)
+            self._registro = None
+        if archivo:
+            self._registro = crear_registro_archivo(archivo)
+
+    def __call__(self, mensaje: str):
+        self._cola.put(f"[{time.strftime('%H:%M:%S')}] {mensaje}")
+        registro = self._registro
+        if registro is not None:
+            registro.info(mensaje)
+
+    def extraer(self, maximo: int) -> List[str]:
+        lineas = []
+        try:
+            while len(lineas) < maximo:
+                lineas.append(self._cola.get_nowait())
+        except queue.Empty:
+            pass
+        return lineas
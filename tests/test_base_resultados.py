@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""Pruebas de la base de resultados y de la reanudación de corridas."""
+
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import base_resultados
+from base_resultados import BaseResultados, aplicar_mediciones
+from cronometro import Cronometro
+from experimentos import EjecutorSerie
+from ordenamiento import FUNCIONES_ORDENAMIENTO, crear_algoritmos
+
+TAMANOS = [100, 200]
+REPETICIONES = 3
+
+
+class PruebasReanudacion(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.base = BaseResultados(os.path.join(self.directorio.name, 'resultados.sqlite'))
+        self.funciones = {nombre: FUNCIONES_ORDENAMIENTO[nombre] for nombre in ('Heap Sort', 'Insertion Sort')}
+        self.algoritmos = crear_algoritmos(list(self.funciones))
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def _ejecutor(self, **opciones) -> EjecutorSerie:
+        return EjecutorSerie(self.algoritmos, self.funciones, semilla=7, base=self.base,
+                             cronometro=Cronometro(calentamiento=0, tiempo_minimo=0), **opciones)
+
+    def _cancelar_tras(self, mediciones: int) -> EjecutorSerie:
+        ejecutor = None
+        recibidas = []
+
+        def al_medir(medicion):
+            recibidas.append(medicion)
+            if len(recibidas) == mediciones:
+                ejecutor.cancelar()
+
+        ejecutor = self._ejecutor(al_medir=al_medir)
+        ejecutor.ejecutar(TAMANOS, REPETICIONES, 'aleatorio')
+        self.assertTrue(ejecutor.cancelada)
+        return ejecutor
+
+    def test_reanudar_en_algoritmos_con_datos_no_duplica_mediciones(self):
+        cancelada = self._cancelar_tras(5)
+        # Los algoritmos conservan en memoria lo medido antes de cancelar
+        self.assertEqual(sum(len(m) for m in self.algoritmos['Heap Sort'].resultados.values()), 3)
+
+        reanudada = self._ejecutor(reanudar=cancelada.corrida_id)
+        reanudada.ejecutar(TAMANOS, REPETICIONES, 'aleatorio')
+
+        self.assertFalse(reanudada.cancelada)
+        for alg in self.algoritmos.values():
+            for n in TAMANOS:
+                self.assertEqual(len(alg.resultados[n]), REPETICIONES, f"{alg.nombre}, n={n}")
+        self.assertEqual(len(self.base.mediciones(cancelada.corrida_id)),
+                         len(TAMANOS) * REPETICIONES * len(self.funciones))
+        self.assertEqual(self.base.corrida(cancelada.corrida_id)['estado'], 'completada')
+
+    def test_reanudar_conserva_los_datos_de_otras_series(self):
+        EjecutorSerie(self.algoritmos, self.funciones, semilla=3,
+                      cronometro=Cronometro(calentamiento=0, tiempo_minimo=0)).ejecutar([50], 2, 'inverso')
+        cancelada = self._cancelar_tras(5)
+
+        self._ejecutor(reanudar=cancelada.corrida_id).ejecutar(TAMANOS, REPETICIONES, 'aleatorio')
+
+        for alg in self.algoritmos.values():
+            self.assertEqual(len(alg.resultados[50]), 2, alg.nombre)
+            for n in TAMANOS:
+                self.assertEqual(len(alg.resultados[n]), REPETICIONES, f"{alg.nombre}, n={n}")
+
+    def test_cargar_dos_veces_una_corrida_no_duplica(self):
+        corrida = self._ejecutor()
+        corrida.ejecutar(TAMANOS, REPETICIONES, 'aleatorio')
+        mediciones = self.base.mediciones(corrida.corrida_id)
+        algoritmos = crear_algoritmos(list(self.funciones))
+
+        self.assertEqual(aplicar_mediciones(mediciones, algoritmos, corrida.corrida_id), len(mediciones))
+        self.assertEqual(aplicar_mediciones(mediciones, algoritmos, corrida.corrida_id), 0)
+        # La serie que la midió ya tiene sus celdas: cargarla en esos algoritmos tampoco agrega nada
+        self.assertEqual(aplicar_mediciones(mediciones, self.algoritmos, corrida.corrida_id), 0)
+        self.assertEqual(len(algoritmos['Heap Sort'].resultados[100]), REPETICIONES)
+
+    def test_reanudar_en_algoritmos_nuevos_carga_lo_guardado(self):
+        cancelada = self._cancelar_tras(5)
+        self.algoritmos = crear_algoritmos(list(self.funciones))
+
+        self._ejecutor(reanudar=cancelada.corrida_id).ejecutar(TAMANOS, REPETICIONES, 'aleatorio')
+
+        for alg in self.algoritmos.values():
+            for n in TAMANOS:
+                self.assertEqual(len(alg.resultados[n]), REPETICIONES, f"{alg.nombre}, n={n}")
+
+
+class PruebasVolcadoPorLotes(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.base = BaseResultados(os.path.join(self.directorio.name, 'resultados.sqlite'))
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def test_un_lote_incompleto_se_guarda_sin_esperar_otra_medicion(self):
+        with mock.patch.object(base_resultados, 'INTERVALO_LOTE', 0.05):
+            corrida = self.base.iniciar_corrida('aleatorio', 1, [100], 1, ['Heap Sort'], {})
+            corrida({'algoritmo': 'Heap Sort', 'tamanio': 100, 'repeticion': 0, 'semilla': 1,
+                     'tiempo': 0.001, 'instrucciones': 10, 'correcto': True})
+            limite = time.monotonic() + 5
+            while not self.base.mediciones(corrida.id) and time.monotonic() < limite:
+                time.sleep(0.01)
+            # Leído desde otra conexión antes de cerrar la corrida: ya está en disco
+            self.assertEqual(len(self.base.mediciones(corrida.id)), 1)
+            corrida.cerrar('completada')
+        self.assertEqual(self.base.corrida(corrida.id)['estado'], 'completada')
+
+
+if __name__ == '__main__':
+    unittest.main()
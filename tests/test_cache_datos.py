@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""Pruebas de la caché de entradas en disco y de su uso en EjecutorSerie."""
+
+import os
+import tempfile
+import unittest
+from array import array
+
+from cache_datos import CacheDatos
+from cronometro import Cronometro
+from experimentos import EjecutorSerie
+from ordenamiento import AlgoritmoOrdenamiento, generar_array_segun_caso
+
+
+class PruebasCacheDatos(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def test_obtener_mapea_la_entrada_sin_copiarla(self):
+        cache = CacheDatos(self.directorio.name)
+        vista = cache.obtener(1000, 'aleatorio', 5)
+        self.assertIsInstance(vista, memoryview)
+        self.assertEqual(vista.format, 'i')
+        self.assertTrue(vista.readonly)
+        self.assertEqual(vista.tolist(), generar_array_segun_caso(1000, 'aleatorio', 5))
+        self.assertEqual((cache.aciertos, cache.fallos), (0, 1))
+
+        self.assertEqual(cache.obtener_array(1000, 'aleatorio', 5), array('i', vista))
+        self.assertEqual(cache.obtener_lista(1000, 'aleatorio', 5), vista.tolist())
+        self.assertEqual((cache.aciertos, cache.fallos), (2, 1))
+
+    def test_expulsa_las_entradas_usadas_hace_mas_tiempo(self):
+        # Cada entrada de 1000 enteros ocupa 4000 bytes: caben dos
+        cache = CacheDatos(self.directorio.name, tamano_maximo=8000)
+        for semilla in (1, 2):
+            cache.obtener(1000, 'aleatorio', semilla)
+        os.utime(cache.ruta(1000, 'aleatorio', 1), (0, 0))
+        os.utime(cache.ruta(1000, 'aleatorio', 2), (1, 1))
+        cache.obtener(1000, 'aleatorio', 1)  # Vuelve a ser la más reciente
+
+        cache.obtener(1000, 'aleatorio', 3)
+
+        self.assertTrue(os.path.exists(cache.ruta(1000, 'aleatorio', 1)))
+        self.assertFalse(os.path.exists(cache.ruta(1000, 'aleatorio', 2)))
+        self.assertTrue(os.path.exists(cache.ruta(1000, 'aleatorio', 3)))
+        self.assertLessEqual(cache.tamano_total(), 8000)
+
+    def test_la_entrada_recien_generada_no_se_expulsa(self):
+        cache = CacheDatos(self.directorio.name, tamano_maximo=100)
+        self.assertEqual(len(cache.obtener(1000, 'inverso', 1)), 1000)
+        self.assertTrue(os.path.exists(cache.ruta(1000, 'inverso', 1)))
+
+
+class PruebasEntradaDesdeCache(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def test_la_ejecucion_secuencial_en_array_recibe_el_mapeo(self):
+        recibidas = []
+
+        def ordenar(arr):
+            recibidas.append(type(arr))
+            return sorted(arr), 0
+
+        algoritmos = {'prueba': AlgoritmoOrdenamiento('prueba', 'gray')}
+        ejecutor = EjecutorSerie(algoritmos, {'prueba': ordenar}, semilla=1,
+                                 cache=CacheDatos(self.directorio.name), entrada='array',
+                                 verificacion='completa', cronometro=Cronometro(calentamiento=0, tiempo_minimo=0))
+        ejecutor.ejecutar([200], 2, 'aleatorio')
+
+        self.assertTrue(recibidas)
+        self.assertTrue(all(tipo is memoryview for tipo in recibidas))
+        self.assertEqual(len(algoritmos['prueba'].resultados[200]), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
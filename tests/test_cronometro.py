@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""Pruebas del cronómetro y del límite de tiempo por ejecución."""
+
+import time
+import unittest
+from contextlib import nullcontext
+
+from cronometro import Cronometro
+from experimentos import LIMITE_SOPORTADO, TiempoAgotado, medir_celda
+
+
+def _demorar(segundos):
+    def ordenar(arr, operaciones=None):
+        time.sleep(segundos)
+        return sorted(arr), 0
+    return ordenar
+
+
+class PruebasCronometro(unittest.TestCase):
+    def test_una_ejecucion_larga_es_la_medicion(self):
+        tiempo, _, bucles, resultado, _ = Cronometro(tiempo_minimo=0.001).medir(lambda: time.sleep(0.005) or 7)
+        self.assertEqual(bucles, 1)
+        self.assertEqual(resultado, 7)
+        self.assertGreaterEqual(tiempo, 0.005)
+
+    def test_las_ejecuciones_cortas_se_repiten_en_bucle(self):
+        _, _, bucles, _, _ = Cronometro(tiempo_minimo=0.01).medir(lambda: None)
+        self.assertGreater(bucles, 1)
+
+    def test_limitar_recibe_cada_tramo_por_separado(self):
+        tramos = []
+
+        def limitar(ejecuciones):
+            tramos.append(ejecuciones)
+            return nullcontext()
+
+        _, _, bucles, _, _ = Cronometro(calentamiento=2, tiempo_minimo=0.01).medir(lambda: None, limitar=limitar)
+        self.assertEqual(tramos, [1, 1, 1, bucles])
+
+
+@unittest.skipUnless(LIMITE_SOPORTADO, "la plataforma no permite interrumpir por tiempo")
+class PruebasLimitePorEjecucion(unittest.TestCase):
+    def test_el_limite_no_cuenta_calentamiento_ni_bucles(self):
+        # Cada ejecución tarda ~2 ms, el total del cronómetro supera con creces los 20 ms de límite
+        cronometro = Cronometro(calentamiento=3, tiempo_minimo=0.1)
+        tiempo, _, arr_ordenado, _ = medir_celda(_demorar(0.002), [3, 1, 2], cronometro=cronometro, limite=0.02)
+        self.assertEqual(arr_ordenado, [1, 2, 3])
+        self.assertLess(tiempo, 0.02)
+
+    def test_una_ejecucion_que_supera_el_limite_se_interrumpe(self):
+        with self.assertRaises(TiempoAgotado):
+            medir_celda(_demorar(0.5), [3, 1, 2], cronometro=Cronometro(), limite=0.05)
+
+    def test_la_ejecucion_instrumentada_aparte_queda_fuera_del_limite(self):
+        rapida = lambda arr: sorted(arr)
+        _, _, arr_ordenado, _ = medir_celda(_demorar(0.1), [2, 1], rapida, cronometro=Cronometro(), limite=0.05)
+        self.assertEqual(arr_ordenado, [1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
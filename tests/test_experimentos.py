@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""Pruebas de EjecutorSerie con procesos trabajadores."""
+
+import multiprocessing
+import threading
+import time
+import unittest
+
+from cronometro import Cronometro
+from experimentos import EjecutorSerie
+from ordenamiento import FUNCIONES_ORDENAMIENTO, crear_algoritmos
+
+
+class PruebasCancelacionConProcesos(unittest.TestCase):
+    def test_cancelar_termina_los_trabajadores_en_curso(self):
+        funciones = {'Bubble Sort': FUNCIONES_ORDENAMIENTO['Bubble Sort']}
+        algoritmos = crear_algoritmos(list(funciones))
+        # Cada celda de Bubble Sort con n = 30000 tarda decenas de segundos
+        ejecutor = EjecutorSerie(algoritmos, funciones, semilla=1, trabajadores=2,
+                                 cronometro=Cronometro(calentamiento=0, tiempo_minimo=0))
+        threading.Timer(1.5, ejecutor.cancelar).start()
+
+        inicio = time.monotonic()
+        ejecutor.ejecutar([30000], 2, 'aleatorio')
+
+        self.assertTrue(ejecutor.cancelada)
+        self.assertLess(time.monotonic() - inicio, 10)
+        self.assertEqual(multiprocessing.active_children(), [])
+        self.assertEqual(algoritmos['Bubble Sort'].resultados.get(30000, []), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
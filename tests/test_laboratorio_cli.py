@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""Pruebas de la línea de comandos."""
+
+import contextlib
+import csv
+import io
+import os
+import tempfile
+import unittest
+
+from laboratorio_cli import main, resolver_algoritmos
+
+
+class PruebasResolverAlgoritmos(unittest.TestCase):
+    def test_por_clave_o_por_nombre_en_el_orden_del_registro(self):
+        funciones = resolver_algoritmos(['heap_sort', 'Quick Sort (Mediana de 3)', 'list.sort()'])
+        self.assertEqual(list(funciones), ['Heap Sort', 'Quick Sort (Mediana de 3)', 'list.sort()'])
+
+    def test_algoritmo_desconocido(self):
+        with self.assertRaises(ValueError):
+            resolver_algoritmos(['shell_sort'])
+
+
+class PruebasOpcionesInvalidas(unittest.TestCase):
+    def test_las_opciones_fuera_de_rango_terminan_con_error_de_uso(self):
+        for argumentos in (['-r', '0'], ['-j', '0'], ['--limite-tiempo', '0'], ['--presupuesto-celda', '-1'],
+                           ['--fraccion-verificada', '1.5'], ['--calentamiento', '-1'], ['--tiempo-minimo', '-0.1'],
+                           ['-t', '10, 0'], ['-a', 'shell_sort'], ['--verificacion', 'muestreo']):
+            with self.subTest(argumentos=argumentos):
+                with contextlib.redirect_stderr(io.StringIO()), self.assertRaises(SystemExit) as salida:
+                    main(argumentos)
+                self.assertEqual(salida.exception.code, 2)
+
+
+class PruebasEjecucion(unittest.TestCase):
+    def test_emite_una_fila_csv_por_medicion(self):
+        with tempfile.TemporaryDirectory() as directorio:
+            archivo = os.path.join(directorio, 'mediciones.csv')
+            codigo = main(['-t', '100, 200', '-r', '2', '-a', 'heap_sort', 'sorted', '-s', '5', '-f', 'csv',
+                           '-o', archivo, '--calentamiento', '0', '--tiempo-minimo', '0'])
+            with open(archivo, newline='', encoding='utf-8') as f:
+                filas = list(csv.DictReader(f))
+        self.assertEqual(codigo, 0)
+        self.assertEqual(len(filas), 2 * 2 * 2)
+        self.assertEqual({fila['algoritmo'] for fila in filas}, {'Heap Sort', 'sorted()'})
+        self.assertTrue(all(fila['correcto'] == 'True' for fila in filas))
+        self.assertEqual({fila['semilla'] for fila in filas}, {'5', '6'})
+
+
+if __name__ == '__main__':
+    unittest.main()
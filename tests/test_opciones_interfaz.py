@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""Pruebas de la lectura de opciones de la interfaz gráfica (sin abrir ventanas)."""
+
+import unittest
+
+from CDA_tarea import (
+    AplicacionLaboratorio, _entero_no_negativo, _entero_positivo, _milisegundos_en_segundos, _segundos_opcionales
+)
+
+
+class PruebasConversiones(unittest.TestCase):
+    def test_valores_validos(self):
+        self.assertEqual(_entero_positivo('3'), 3)
+        self.assertEqual(_entero_no_negativo('0'), 0)
+        self.assertEqual(_milisegundos_en_segundos('250'), 0.25)
+        self.assertEqual(_milisegundos_en_segundos(''), 0.0)
+        self.assertEqual(_segundos_opcionales('1.5'), 1.5)
+        self.assertIsNone(_segundos_opcionales(''))
+
+    def test_valores_fuera_de_rango(self):
+        for convertir, texto in ((_entero_positivo, '0'), (_entero_no_negativo, '-1'),
+                                 (_milisegundos_en_segundos, '-5'), (_segundos_opcionales, '0'),
+                                 (_entero_positivo, 'dos')):
+            with self.subTest(convertir=convertir.__name__, texto=texto):
+                with self.assertRaises(ValueError):
+                    convertir(texto)
+
+
+class PruebasLeerOpcion(unittest.TestCase):
+    def test_el_error_nombra_el_campo_y_el_valor(self):
+        with self.assertRaises(ValueError) as error:
+            AplicacionLaboratorio._leer_opcion("Procesos en paralelo", " cero ", _entero_positivo)
+        self.assertIn("Procesos en paralelo", str(error.exception))
+        self.assertIn("'cero'", str(error.exception))
+
+    def test_recorta_espacios_antes_de_convertir(self):
+        self.assertEqual(AplicacionLaboratorio._leer_opcion("Límite", " 2.5 ", _segundos_opcionales), 2.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
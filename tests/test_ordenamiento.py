@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""Pruebas de los algoritmos de ordenamiento y de las líneas base registradas."""
+
+import unittest
+from array import array
+
+from ordenamiento import (
+    ContadorOperaciones, FUNCIONES_ORDENAMIENTO, FUNCIONES_RAPIDAS, LINEAS_BASE, PIVOTES, generar_array_segun_caso,
+    parsear_serie_tamanos, quick_sort
+)
+
+ENTRADAS = {
+    'vacía': [],
+    'un elemento': [4],
+    'aleatoria': generar_array_segun_caso(300, 'aleatorio', 11),
+    'con repetidos': [3, 1, 3, 0, 2, 2, 1, 3] * 10,
+    'ordenada': list(range(50)),
+    'inversa': list(range(50, 0, -1)),
+}
+
+
+class PruebasAlgoritmos(unittest.TestCase):
+    def test_todos_ordenan_listas_y_arrays(self):
+        for nombre, func in FUNCIONES_ORDENAMIENTO.items():
+            for caso, entrada in ENTRADAS.items():
+                with self.subTest(algoritmo=nombre, entrada=caso):
+                    arr_ordenado, _ = func(list(entrada))
+                    self.assertEqual(list(arr_ordenado), sorted(entrada))
+                    tipada = array('i', entrada)
+                    arr_ordenado, _ = func(tipada)
+                    self.assertEqual(list(arr_ordenado), sorted(entrada))
+                    self.assertEqual(tipada, array('i', entrada))  # La entrada no se modifica
+
+    def test_quick_sort_con_cada_pivote(self):
+        entrada = ENTRADAS['aleatoria']
+        for pivote in PIVOTES:
+            with self.subTest(pivote=pivote):
+                self.assertEqual(quick_sort(entrada, pivote=pivote)[0], sorted(entrada))
+        with self.assertRaises(ValueError):
+            quick_sort(entrada, pivote='primero')
+
+
+class PruebasGemelosRapidos(unittest.TestCase):
+    def test_cada_gemelo_rapido_devuelve_lo_mismo_que_el_instrumentado(self):
+        entrada = ENTRADAS['aleatoria']
+        for nombre, rapida in FUNCIONES_RAPIDAS.items():
+            with self.subTest(algoritmo=nombre):
+                arr_ordenado, _ = FUNCIONES_ORDENAMIENTO[nombre](entrada)
+                self.assertEqual(rapida(entrada), arr_ordenado)
+                self.assertEqual(rapida(array('i', entrada)), array('i', arr_ordenado))
+
+    def test_el_desglose_no_cambia_las_instrucciones(self):
+        entrada = ENTRADAS['aleatoria']
+        for nombre in FUNCIONES_RAPIDAS:
+            if nombre == 'Quick Sort (Aleatorio)':
+                continue  # El pivote sorteado cambia el conteo entre ejecuciones
+            with self.subTest(algoritmo=nombre):
+                func = FUNCIONES_ORDENAMIENTO[nombre]
+                operaciones = ContadorOperaciones()
+                _, sin_desglose = func(entrada)
+                _, con_desglose = func(entrada, operaciones=operaciones)
+                self.assertEqual(con_desglose, sin_desglose)
+                self.assertGreater(sum(operaciones.como_dict().values()), 0)
+
+
+class PruebasSerieTamanos(unittest.TestCase):
+    def test_sufijos_y_espacios(self):
+        self.assertEqual(parsear_serie_tamanos(" 1000, 5k, 1.5k,2M "), [1000, 5000, 1500, 2000000])
+
+    def test_series_invalidas(self):
+        for serie in ('', '  ', '10, 0', '-5', '10, abc'):
+            with self.subTest(serie=serie):
+                with self.assertRaises(ValueError):
+                    parsear_serie_tamanos(serie)
+
+
+class PruebasLineasBase(unittest.TestCase):
+    def test_la_linea_base_tipada_siempre_esta_registrada(self):
+        self.assertIn('sorted() sobre array', LINEAS_BASE)
+        self.assertIn('sorted() sobre array', FUNCIONES_ORDENAMIENTO)
+
+    def test_la_linea_base_tipada_devuelve_un_array(self):
+        func = LINEAS_BASE['sorted() sobre array']
+        arr_ordenado, instrucciones = func(array('i', [3, -1, 2]))
+        self.assertEqual(arr_ordenado, array('i', [-1, 2, 3]))
+        self.assertEqual(instrucciones, 0)
+        arr_ordenado, _ = func(memoryview(array('i', [2, 1])))
+        self.assertEqual(arr_ordenado, array('i', [1, 2]))
+        self.assertIsInstance(func([2, 1])[0], array)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""Pruebas del planificador por complejidad y de sus políticas en EjecutorSerie."""
+
+import unittest
+
+from cronometro import Cronometro
+from experimentos import EjecutorSerie
+from ordenamiento import FUNCIONES_ORDENAMIENTO, crear_algoritmos
+from planificador import PlanificadorComplejidad, ajustar_modelo
+
+TAMANOS = [100, 200, 400, 20000]
+
+
+class PruebasModelo(unittest.TestCase):
+    def test_ajusta_una_potencia_exacta(self):
+        modelo = ajustar_modelo([(n, 3e-9 * n ** 2) for n in (100, 200, 400)], 'n^2')
+        self.assertAlmostEqual(modelo(10000) / (3e-9 * 10000 ** 2), 1.0, places=6)
+
+    def test_sin_puntos_no_hay_modelo(self):
+        self.assertIsNone(ajustar_modelo([], 'n^2'))
+
+
+class PruebasPoliticas(unittest.TestCase):
+    def test_opciones_invalidas(self):
+        with self.assertRaises(ValueError):
+            PlanificadorComplejidad(1.0, 'adivinar')
+        with self.assertRaises(ValueError):
+            PlanificadorComplejidad(0, 'omitir')
+
+    def test_limitar_ejecuta_todo_con_el_presupuesto_como_limite(self):
+        planificador = PlanificadorComplejidad(0.5, 'limitar')
+        self.assertFalse(planificador.excede_presupuesto((100.0, 0)))
+        self.assertEqual(planificador.limite_por_celda(), 0.5)
+        self.assertIsNone(PlanificadorComplejidad(0.5, 'omitir').limite_por_celda())
+
+    def _ejecutar(self, politica: str):
+        funciones = {nombre: FUNCIONES_ORDENAMIENTO[nombre] for nombre in ('Bubble Sort', 'Heap Sort')}
+        algoritmos = crear_algoritmos(list(funciones))
+        mediciones = []
+        # Bubble Sort con n = 20000 supera con creces el presupuesto; Heap Sort no
+        EjecutorSerie(algoritmos, funciones, semilla=1, al_medir=mediciones.append,
+                      planificador=PlanificadorComplejidad(0.5, politica),
+                      cronometro=Cronometro(calentamiento=0, tiempo_minimo=0)).ejecutar(TAMANOS, 2, 'aleatorio')
+        return algoritmos, mediciones
+
+    def test_omitir_no_ejecuta_ni_registra_la_celda(self):
+        algoritmos, mediciones = self._ejecutar('omitir')
+        self.assertNotIn(20000, algoritmos['Bubble Sort'].resultados)
+        self.assertEqual(algoritmos['Bubble Sort'].obtener_extrapolados(), [])
+        self.assertEqual(len(algoritmos['Heap Sort'].resultados[20000]), 2)
+        self.assertFalse(any(medicion.get('extrapolado') for medicion in mediciones))
+
+    def test_extrapolar_registra_el_valor_predicho(self):
+        algoritmos, mediciones = self._ejecutar('extrapolar')
+        self.assertNotIn(20000, algoritmos['Bubble Sort'].resultados)
+        (n, tiempo, _), = algoritmos['Bubble Sort'].obtener_extrapolados()
+        self.assertEqual(n, 20000)
+        self.assertGreater(tiempo, 0.5)
+        extrapoladas = [medicion for medicion in mediciones if medicion.get('extrapolado')]
+        self.assertEqual([(m['algoritmo'], m['tamanio']) for m in extrapoladas], [('Bubble Sort', 20000)])
+
+
+if __name__ == '__main__':
+    unittest.main()
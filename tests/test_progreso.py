@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""Pruebas del estimador de avance y de su uso en EjecutorSerie."""
+
+import unittest
+
+from cronometro import Cronometro
+from experimentos import EjecutorSerie
+from ordenamiento import FUNCIONES_ORDENAMIENTO, crear_algoritmos
+from planificador import PlanificadorComplejidad
+from progreso import EstimadorProgreso
+
+
+class PruebasEstimadorProgreso(unittest.TestCase):
+    def setUp(self):
+        self.estimador = EstimadorProgreso(crear_algoritmos(['Bubble Sort', 'Heap Sort']))
+        self.estimador.planificar((nombre, n) for n in (1000, 100000) for nombre in ('Bubble Sort', 'Heap Sort')
+                                  for _ in range(3))
+
+    def test_descartar_quita_las_celdas_restantes_del_eta(self):
+        antes = self.estimador.estado()['eta']
+        self.estimador.descartar('Bubble Sort', 1000)
+        estado = self.estimador.estado()
+        self.assertEqual(estado['completadas'], 3)
+        self.assertLess(estado['eta'], antes / 100)
+
+    def test_descartar_no_toca_tamanos_menores_ni_otros_algoritmos(self):
+        self.estimador.descartar('Bubble Sort', 1000)
+        for _ in range(3):
+            self.estimador.completar('Bubble Sort', 1000)
+        self.assertEqual(self.estimador.estado()['completadas'], 6)
+        self.estimador.completar('Heap Sort', 100000)
+        self.assertEqual(self.estimador.estado()['completadas'], 7)
+
+    def test_completar_una_celda_descartada_no_la_cuenta_dos_veces(self):
+        self.estimador.descartar('Bubble Sort', 1000)
+        self.estimador.completar('Bubble Sort', 100000, ejecutada=False)
+        self.assertEqual(self.estimador.estado()['completadas'], 3)
+
+    def test_con_limite_ninguna_celda_pesa_mas_que_el_limite(self):
+        estimador = EstimadorProgreso(crear_algoritmos(['Bubble Sort']), limite=0.5)
+        estimador.planificar([('Bubble Sort', 1000000)] * 4)
+        self.assertLessEqual(estimador._restante, 4 * 0.5)
+
+
+class PruebasAvanceConAlgoritmosExcluidos(unittest.TestCase):
+    def test_un_algoritmo_omitido_no_infla_el_eta(self):
+        funciones = {nombre: FUNCIONES_ORDENAMIENTO[nombre] for nombre in ('Bubble Sort', 'sorted()')}
+        estados, mensajes = [], []
+        ejecutor = EjecutorSerie(crear_algoritmos(list(funciones)), funciones, semilla=1,
+                                 log=mensajes.append,
+                                 al_progresar=lambda estado: estados.append((len(mensajes), estado)),
+                                 planificador=PlanificadorComplejidad(0.5, 'omitir'),
+                                 cronometro=Cronometro(calentamiento=0, tiempo_minimo=0))
+        ejecutor.ejecutar([100, 200, 20000, 40000], 2, 'aleatorio')
+
+        omision = next(i for i, mensaje in enumerate(mensajes) if 'se omite' in mensaje)
+        # Estados desde la primera celda que se ejecuta después de planificar ese tamaño
+        siguiente = next(i for i, mensaje in enumerate(mensajes) if i > omision and 'Ejecutando' in mensaje)
+        posteriores = [estado for i, estado in estados if i > siguiente]
+        self.assertTrue(posteriores)
+        # Sin descartar, las celdas de Bubble Sort con n = 40000 sumaban más de un minuto
+        self.assertLess(max(estado['eta'] for estado in posteriores), 5.0)
+        self.assertEqual(posteriores[-1]['completadas'], posteriores[-1]['total'])
+
+
+if __name__ == '__main__':
+    unittest.main()
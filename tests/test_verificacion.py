@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""Pruebas de los modos de verificación de resultados."""
+
+import unittest
+from array import array
+
+from ordenamiento import (
+    MODOS_VERIFICACION, huella_multiconjunto, huella_secuencia, preparar_verificacion, verificar_con_referencia, verificar_ordenamiento
+)
+
+ENTRADA = [5, 3, 9, 1, 3, 7]
+ORDENADA = sorted(ENTRADA)
+
+
+class PruebasModosVerificacion(unittest.TestCase):
+    def _verificar(self, entrada, salida, modo):
+        return verificar_con_referencia(entrada, salida, modo, preparar_verificacion(entrada, modo))
+
+    def test_todos_los_modos_aceptan_la_salida_correcta(self):
+        for modo in MODOS_VERIFICACION:
+            with self.subTest(modo=modo):
+                self.assertTrue(self._verificar(ENTRADA, list(ORDENADA), modo))
+                self.assertTrue(self._verificar(array('i', ENTRADA), array('i', ORDENADA), modo))
+
+    def test_todos_los_modos_rechazan_salidas_incorrectas(self):
+        incorrectas = {
+            'desordenada': [1, 3, 3, 7, 9, 5],
+            'valor cambiado': [1, 3, 4, 5, 7, 9],
+            'elemento perdido': [1, 3, 5, 7, 9],
+            'elemento duplicado': [1, 3, 3, 5, 7, 9, 9],
+        }
+        for modo in MODOS_VERIFICACION:
+            for caso, salida in incorrectas.items():
+                with self.subTest(modo=modo, caso=caso):
+                    self.assertFalse(self._verificar(ENTRADA, salida, modo))
+                    self.assertFalse(self._verificar(array('i', ENTRADA), array('i', salida), modo))
+
+    def test_salida_lista_de_una_entrada_tipada(self):
+        # Las líneas base como sorted() devuelven una lista aunque reciban un array('i')
+        for modo in MODOS_VERIFICACION:
+            with self.subTest(modo=modo):
+                self.assertTrue(self._verificar(array('i', ENTRADA), list(ORDENADA), modo))
+                self.assertFalse(self._verificar(array('i', ENTRADA), [1, 3, 3, 5, 7, 2 ** 40], modo))
+
+    def test_verificar_ordenamiento_acepta_memoryview(self):
+        self.assertTrue(verificar_ordenamiento(memoryview(array('i', ENTRADA)), array('i', ORDENADA)))
+
+
+class PruebasReferenciaTipada(unittest.TestCase):
+    def test_la_referencia_de_una_entrada_tipada_es_tipada(self):
+        referencia = preparar_verificacion(array('i', ENTRADA), 'referencia')
+        self.assertIsInstance(referencia, array)
+        self.assertEqual(referencia.typecode, 'i')
+        self.assertIsInstance(preparar_verificacion(ENTRADA, 'referencia'), list)
+
+    def test_huella_secuencia_no_depende_del_tipo_y_si_del_orden(self):
+        self.assertEqual(huella_secuencia(ORDENADA), huella_secuencia(array('i', ORDENADA)))
+        self.assertNotEqual(huella_secuencia(ORDENADA), huella_secuencia(ORDENADA[::-1]))
+
+    def test_referencia_resumida(self):
+        huella = huella_secuencia(preparar_verificacion(array('i', ENTRADA), 'referencia'))
+        self.assertTrue(verificar_con_referencia(ENTRADA, array('i', ORDENADA), 'referencia', huella))
+        self.assertFalse(verificar_con_referencia(ENTRADA, array('i', ENTRADA), 'referencia', huella))
+
+
+class PruebasHuellaMulticonjunto(unittest.TestCase):
+    def test_distingue_multiconjuntos_con_las_mismas_sumas_de_potencias(self):
+        # Misma longitud, suma y suma de cuadrados; el segundo par coincide hasta los cubos
+        for original, alterada in (([1, 5, 6], [2, 3, 7]), ([1, 5, 9, 17, 18], [2, 3, 11, 15, 19])):
+            with self.subTest(original=original):
+                referencia = preparar_verificacion(original, 'lineal')
+                self.assertFalse(verificar_con_referencia(original, alterada, 'lineal', referencia))
+                self.assertTrue(verificar_con_referencia(original, sorted(original), 'lineal', referencia))
+
+    def test_con_la_misma_sal_no_depende_del_orden_ni_del_tipo(self):
+        referencia = huella_multiconjunto(ENTRADA)
+        sal = referencia[0]
+        self.assertEqual(huella_multiconjunto(ORDENADA, sal), referencia)
+        self.assertEqual(huella_multiconjunto(array('i', ORDENADA), sal), referencia)
+
+
+if __name__ == '__main__':
+    unittest.main()